@@ -0,0 +1,184 @@
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+import urllib3
+from urllib3.util.retry import Retry
+
+# Backend routes by action, relative to API_URL. Path fields are filled from
+# keyword arguments; API_ENDPOINTS_FILE (JSON, same shape) overrides entries
+# when the deployed backend differs from the stand-in.
+ENDPOINTS = {
+    "login": ["POST", "/login"],
+    "list_assets": ["GET", "/assets"],
+    "create_asset": ["POST", "/assets"],
+    "delete_asset": ["DELETE", "/assets/{name}"],
+    "list_devices": ["GET", "/devices"],
+    "create_device": ["POST", "/devices"],
+    "update_device": ["PUT", "/devices/{name}"],
+    "delete_device": ["DELETE", "/devices/{name}"],
+    "create_slave": ["POST", "/devices/{device}/slaves"],
+    "list_users": ["GET", "/users"],
+    "create_user": ["POST", "/users"],
+    "delete_user": ["DELETE", "/users/{username}"],
+}
+
+
+class ApiError(Exception):
+    def __init__(self, action, status, message):
+        super().__init__(f"{action} failed with HTTP {status}: {message}")
+        self.action = action
+        self.status = status
+
+
+class ApiSeeder:
+    """Creates and removes test data through the backend HTTP API.
+
+    All requests share one urllib3 PoolManager, so a batch reuses keep-alive
+    connections instead of opening one per request. Batches run on up to
+    `workers` threads; a tree is created level by level so every parent
+    exists before its children are posted.
+    """
+
+    def __init__(self, api_url=None, email=None, password=None, workers=8, enabled=True):
+        self._api_url = api_url
+        self._email = email
+        self._password = password
+        self.workers = workers
+        self.enabled = enabled
+        self.endpoints = dict(ENDPOINTS)
+        overrides = os.getenv("API_ENDPOINTS_FILE")
+        if overrides:
+            with open(overrides) as f:
+                self.endpoints.update(json.load(f))
+        self.http = urllib3.PoolManager(
+            maxsize=workers, block=True, timeout=urllib3.Timeout(connect=5, read=30),
+            retries=Retry(total=2, connect=2, read=0, backoff_factor=0.2))
+        self._auth = None
+
+    @property
+    def api_url(self):
+        # Read late: STAND_IN sets BASE_URL when the first driver starts
+        base_url = (os.getenv("BASE_URL") or "").rstrip("/")
+        return (self._api_url or os.getenv("API_URL") or f"{base_url}/api").rstrip("/")
+
+    # ---------------- Transport ----------------
+    def request(self, action, body=None, **path_args):
+        method, path = self.endpoints[action]
+        url = self.api_url + path.format(**{k: quote(str(v), safe="") for k, v in path_args.items()})
+        response = self.http.request(method, url, headers={"Content-Type": "application/json", **(self._auth or {})},
+                                     body=None if body is None else json.dumps(body))
+        if response.status >= 400:
+            # Proxies and 404 pages answer in HTML or plain text
+            data = self._decode(response)
+            message = data.get("message") if isinstance(data, dict) else None
+            raise ApiError(action, response.status,
+                           message or response.data[:200].decode("utf-8", "replace").strip())
+        data = self._decode(response)
+        if response.data and data is None:
+            raise ApiError(action, response.status, "response is not JSON")
+        return data, response
+
+    @staticmethod
+    def _decode(response):
+        try:
+            return json.loads(response.data) if response.data else None
+        except ValueError:
+            return None
+
+    def call(self, action, body=None, **path_args):
+        self.login()
+        return self.request(action, body, **path_args)[0]
+
+    def login(self):
+        """Log in once; later requests send the token (or the session cookie)."""
+        if self._auth is not None:
+            return
+        data, response = self.request("login", {
+            "email": self._email or os.getenv("USER_EMAIL"),
+            "password": self._password or os.getenv("PASSWORD")})
+        token = (data or {}).get("token") or (data or {}).get("accessToken")
+        cookie = response.headers.get("Set-Cookie")
+        if token:
+            self._auth = {"Authorization": f"Bearer {token}"}
+        else:
+            self._auth = {"Cookie": cookie.split(";")[0]} if cookie else {}
+
+    def batch(self, action, calls, exist_ok=False):
+        """Run action once per (body, path_args) pair, concurrently over the
+        shared pool. Every call runs; the first error is raised afterwards.
+        exist_ok: a 409 (left over from an earlier run) counts as done."""
+        self.login()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="api-seed") as executor:
+            futures = [executor.submit(self.request, action, body, **path_args) for body, path_args in calls]
+        errors = [f.exception() for f in futures if f.exception() is not None
+                  and not (exist_ok and isinstance(f.exception(), ApiError) and f.exception().status == 409)]
+        if errors:
+            raise errors[0]
+        return [None if f.exception() else f.result()[0] for f in futures]
+
+    # ---------------- Assets ----------------
+    def create_assets(self, tree, parent=None):
+        """Create a tree given as {name: {child: {...}}}; returns its names.
+        Assets that already exist are kept."""
+        created = []
+        level = [(name, parent, children) for name, children in tree.items()]
+        while level:
+            self.batch("create_asset", [({"name": name, "parent": p}, {}) for name, p, _ in level], exist_ok=True)
+            created += [name for name, _, _ in level]
+            level = [(child, name, grandchildren)
+                     for name, _, children in level for child, grandchildren in (children or {}).items()]
+        return created
+
+    def create_asset_chain(self, root, depth, suffix="_Child"):
+        """Root, Root_Child, Root_Child_Child, ... depth levels; returns the path."""
+        path = [root]
+        while len(path) < depth:
+            path.append(path[-1] + suffix)
+        tree = {}
+        for name in reversed(path):
+            tree = {name: tree}
+        self.create_assets(tree)
+        return path
+
+    def delete_assets(self, names):
+        """Delete assets deepest first (the backend refuses parents with children)."""
+        assets = {a["name"]: a.get("parent") for a in self.call("list_assets")}
+        depth = {}
+        for name in names:
+            level, node = 0, name
+            while assets.get(node):
+                level, node = level + 1, assets[node]
+            depth.setdefault(level, []).append(name)
+        for level in sorted(depth, reverse=True):
+            self.batch("delete_asset", [(None, {"name": name}) for name in depth[level]])
+
+    # ---------------- Devices ----------------
+    def create_devices(self, devices, exist_ok=False):
+        """devices: dicts with name and optional description, config and slaves.
+        exist_ok: devices that already exist are kept."""
+        self.batch("create_device", [({"name": d["name"], "description": d.get("description", "")}, {})
+                                     for d in devices], exist_ok=exist_ok)
+        configured = [d for d in devices if d.get("config")]
+        if configured:
+            self.configure_devices({d["name"]: d["config"] for d in configured})
+        slaves = [(slave, {"device": d["name"]}) for d in devices for slave in d.get("slaves", [])]
+        if slaves:
+            self.batch("create_slave", slaves)
+        return [d["name"] for d in devices]
+
+    def configure_devices(self, configs):
+        """configs: {device name: {configName, pollInterval, IpAddress, Port}}"""
+        self.batch("update_device", [({"config": config}, {"name": name}) for name, config in configs.items()])
+
+    # ---------------- Users ----------------
+    def create_users(self, users):
+        """users: dicts with username, email and role."""
+        self.batch("create_user", [(user, {}) for user in users])
+        return [u["username"] for u in users]
+
+
+api_seeder = ApiSeeder(
+    workers=int(os.getenv("API_SEED_WORKERS", "8")),
+    enabled=os.getenv("API_SEEDING") == "true")
@@ -0,0 +1,286 @@
+import os
+import sys
+import time
+import shutil
+import atexit
+import sqlite3
+import hashlib
+import argparse
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from RunHistory import run_history
+
+OUTSIDE_TESTS = "<class fixtures>"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256    TEXT PRIMARY KEY,
+    ext       TEXT NOT NULL,
+    size      INTEGER NOT NULL,
+    created   REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    run_id  TEXT NOT NULL,
+    test_id TEXT NOT NULL,
+    kind    TEXT NOT NULL,
+    name    TEXT NOT NULL,
+    sha256  TEXT NOT NULL REFERENCES blobs(sha256),
+    created TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS artifacts_by_run ON artifacts(run_id, test_id);
+CREATE INDEX IF NOT EXISTS artifacts_by_blob ON artifacts(sha256);
+"""
+
+
+class ArtifactStore:
+    """Screenshots, downloads and other test output, stored once by content.
+
+    Files live under blobs/<2 hex>/<sha256>.<ext>; identical content is kept
+    once however often it is produced. index.sqlite maps run -> test ->
+    artifact (kind, original name) -> blob. Parallel workers share the store
+    the same way they share the run history: WAL mode and a busy timeout.
+
+    A daemon thread prunes every `prune_interval` seconds: blobs unused for
+    `max_age_days` go first, then the least recently used until the store is
+    under `max_mb`. Index rows of pruned blobs go with them. Writing a blob
+    and pruning both run inside an exclusive index transaction, so a blob
+    pruned by another process is written again before it is indexed. The
+    parallel runner turns the pruner off in its workers and prunes once
+    itself.
+    """
+
+    def __init__(self, root, max_mb=1024, max_age_days=14, prune_interval=600):
+        self.root = root
+        self.max_bytes = max_mb * 1024 * 1024
+        self.max_age = max_age_days * 86400
+        self.prune_interval = prune_interval
+        self.current = OUTSIDE_TESTS
+        self._connection = None
+        self._lock = threading.Lock()
+        self._pruner = None
+        self._stop = threading.Event()
+        # Closing the last connection checkpoints the WAL into index.sqlite
+        atexit.register(self.close)
+
+    # ---------------- Index ----------------
+    def connect(self):
+        if self._connection is None:
+            os.makedirs(self.root, exist_ok=True)
+            # Autocommit; transactions are opened explicitly with BEGIN IMMEDIATE
+            self._connection = sqlite3.connect(os.path.join(self.root, "index.sqlite"), timeout=30,
+                                               isolation_level=None, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(SCHEMA)
+            self.start_pruner()
+        return self._connection
+
+    @contextmanager
+    def _transaction(self):
+        """Exclusive write transaction across processes; call with self._lock held."""
+        db = self.connect()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def close(self):
+        """Stop the pruner and close the index."""
+        self._stop.set()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    @contextmanager
+    def test(self, test_id):
+        previous, self.current = self.current, test_id
+        try:
+            yield
+        finally:
+            self.current = previous
+
+    def blob_path(self, sha256, ext):
+        return os.path.join(self.root, "blobs", sha256[:2], f"{sha256}.{ext}")
+
+    # ---------------- Writing ----------------
+    def put_bytes(self, data, name, kind, ext, test_id=None):
+        """Store data as an artifact of test_id (default: the running test); returns its path."""
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(sha256, ext)
+        with self._lock, self._transaction() as db:
+            if not os.path.exists(path):
+                self._write(path, data)
+            self._index(db, sha256, ext, len(data), name, kind, test_id)
+        return path
+
+    @staticmethod
+    def _write(path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        partial = f"{path}.{os.getpid()}.{threading.get_ident()}.part"
+        with open(partial, "wb") as f:
+            f.write(data)
+        os.replace(partial, path)
+
+    def put_file(self, source, kind, name=None, test_id=None):
+        """Move a finished file into the store; a duplicate is just removed."""
+        digest = hashlib.sha256()
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+        name = name or os.path.basename(source)
+        ext = os.path.splitext(name)[1].lstrip(".") or "bin"
+        path = self.blob_path(sha256, ext)
+        size = os.path.getsize(source)
+        with self._lock, self._transaction() as db:
+            if os.path.exists(path):
+                os.remove(source)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                shutil.move(source, path)
+            self._index(db, sha256, ext, size, name, kind, test_id)
+        return path
+
+    def collect(self, directory, kind):
+        """Move every finished file in directory (e.g. Downloads/) into the store."""
+        if not os.path.isdir(directory):
+            return []
+        stored = []
+        for entry in sorted(os.scandir(directory), key=lambda e: e.stat().st_mtime):
+            if entry.is_file() and not entry.name.endswith((".crdownload", ".tmp", ".part")):
+                stored.append(self.put_file(entry.path, kind))
+        return stored
+
+    def _index(self, db, sha256, ext, size, name, kind, test_id):
+        now = time.time()
+        db.execute(
+            "INSERT INTO blobs (sha256, ext, size, created, last_used) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT(sha256) DO UPDATE SET last_used = excluded.last_used",
+            (sha256, ext, size, now, now))
+        db.execute(
+            "INSERT INTO artifacts (run_id, test_id, kind, name, sha256, created) VALUES (?, ?, ?, ?, ?, ?)",
+            (run_history.run_id, test_id or self.current, kind, name, sha256,
+             datetime.now().isoformat(timespec="seconds")))
+
+    # ---------------- Queries ----------------
+    def artifacts(self, run_id=None, test_id=None):
+        """[(run_id, test_id, kind, name, path)] of a run (default: this one), optionally one test."""
+        query = ("SELECT a.run_id, a.test_id, a.kind, a.name, a.sha256, b.ext FROM artifacts a"
+                 " JOIN blobs b USING (sha256) WHERE a.run_id = ?")
+        params = [run_id or run_history.run_id]
+        if test_id:
+            query += " AND a.test_id = ?"
+            params.append(test_id)
+        with self._lock:
+            rows = self.connect().execute(query + " ORDER BY a.created", params).fetchall()
+        return [(run, test, kind, name, self.blob_path(sha256, ext)) for run, test, kind, name, sha256, ext in rows]
+
+    def usage(self):
+        with self._lock:
+            count, size = self.connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        return count, size
+
+    # ---------------- Retention ----------------
+    def start_pruner(self):
+        if self._pruner is None and self.prune_interval > 0:
+            self._pruner = threading.Thread(target=self._prune_loop, name="artifact-pruner", daemon=True)
+            self._pruner.start()
+
+    def _prune_loop(self):
+        while not self._stop.is_set():
+            try:
+                self.prune()
+            except (OSError, sqlite3.Error) as e:
+                print(f"Artifact pruning failed: {e}")
+            self._stop.wait(self.prune_interval)
+
+    def prune(self):
+        """Remove expired blobs, then the least recently used ones over the size limit."""
+        with self._lock, self._transaction() as db:
+            doomed = []
+            if self.max_age:
+                doomed += db.execute("SELECT sha256, ext, size FROM blobs WHERE last_used < ?",
+                                     (time.time() - self.max_age,)).fetchall()
+            if self.max_bytes:
+                total = db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+                total -= sum(size for _, _, size in doomed)
+                expired = {sha for sha, _, _ in doomed}
+                for sha256, ext, size in db.execute("SELECT sha256, ext, size FROM blobs ORDER BY last_used"):
+                    if total <= self.max_bytes:
+                        break
+                    if sha256 not in expired:
+                        doomed.append((sha256, ext, size))
+                        total -= size
+            for sha256, ext, _ in doomed:
+                db.execute("DELETE FROM artifacts WHERE sha256 = ?", (sha256,))
+                db.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+                # Inside the transaction: no other process can index the blob meanwhile
+                try:
+                    os.remove(self.blob_path(sha256, ext))
+                except FileNotFoundError:
+                    pass
+        return len(doomed), sum(size for _, _, size in doomed)
+
+
+artifact_store = ArtifactStore(
+    os.getenv("ARTIFACT_DIR", os.path.join(os.getcwd(), "artifacts")),
+    max_mb=float(os.getenv("ARTIFACT_MAX_MB", "1024")),
+    max_age_days=float(os.getenv("ARTIFACT_MAX_AGE_DAYS", "14")),
+    prune_interval=float(os.getenv("ARTIFACT_PRUNE_INTERVAL", "600")))
+
+
+# ---------------- Command line ----------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect and prune the TMind artifact store")
+    commands = parser.add_subparsers(dest="command", required=True)
+    listing = commands.add_parser("list", help="Artifacts of a run")
+    listing.add_argument("--run", default=None, help="Run id (default: latest)")
+    listing.add_argument("--test", default=None, help="Substring of the test id")
+    export = commands.add_parser("export", help="Copy a run's artifacts out under their original names")
+    export.add_argument("dest")
+    export.add_argument("--run", default=None)
+    commands.add_parser("prune", help="Apply the size and age limits now")
+    args = parser.parse_args(argv)
+
+    if args.command == "prune":
+        removed, freed = artifact_store.prune()
+        count, size = artifact_store.usage()
+        print(f"Removed {removed} blobs ({freed / 1048576:.1f} MB); {count} blobs, {size / 1048576:.1f} MB left")
+        return 0
+
+    run_id = args.run
+    if run_id is None:
+        latest = artifact_store.connect().execute(
+            "SELECT run_id FROM artifacts ORDER BY created DESC LIMIT 1").fetchone()
+        if latest is None:
+            print(f"No artifacts in {artifact_store.root}")
+            return 0
+        run_id = latest[0]
+    rows = artifact_store.artifacts(run_id)
+    if args.command == "list":
+        for _, test_id, kind, name, path in rows:
+            if not args.test or args.test in test_id:
+                print(f"{kind:10} {test_id}  {name}  {path}")
+        return 0
+
+    for _, test_id, kind, name, path in rows:
+        target = os.path.join(args.dest, test_id.rsplit(".", 1)[-1], name)
+        stem, ext = os.path.splitext(target)
+        copy = 1
+        while os.path.exists(target):
+            copy += 1
+            target = f"{stem} ({copy}){ext}"
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(path, target)
+    print(f"Exported {len(rows)} artifacts of {run_id} to {args.dest}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
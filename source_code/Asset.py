@@ -2,7 +2,9 @@ import os
 import unittest
 import allure
 from Base import Base
-from Page import AssetPage, LoginPage, DevicePage
+from Page import AssetPage, DevicePage
+from LoginCache import login_cache
+from ApiSeeder import api_seeder
 from locators import SignUpLocators, AssetLocators
 from dotenv import load_dotenv
 import time
@@ -18,17 +20,11 @@ class AssetsTests(Base):
     def setUpClass(cls):
         cls.driver = super().start_driver()
 
-        login = LoginPage(cls.driver)
-    
-        login.enter_email(os.environ.get("USER_EMAIL"))
-        login.enter_password(os.environ.get("PASSWORD"))
-        login.click_login()
-
-        assert login.is_dashboard_displayed(), "Login failed"
+        assert login_cache.login(cls.driver), "Login failed"
         cls.device = DevicePage(cls.driver)
         cls.asset = AssetPage(cls.driver)
         
-        cls.asset.click(AssetLocators.ASSETS_MENU)
+        cls.asset.open_assets_page()
 
     # 1 ---------------- OPEN ----------------
     @allure.title("Verify Assets page opens successfully")
@@ -140,7 +136,7 @@ class AssetsTests(Base):
     @allure.title("Verify empty details when no asset selected")
     @allure.severity(allure.severity_level.MINOR)
     def test_07_no_asset_selected_shows_empty_details(self):
-        self.asset.click(AssetLocators.ASSETS_MENU)
+        self.asset.open_assets_page()
 
         try:
             assert self.asset.is_visible(
@@ -268,7 +264,7 @@ class AssetsTests(Base):
                 AssetLocators.EXPAND_BTN("Hydraulic Press")))
 
         try:
-            assert not self.asset.is_visible(
+            self.asset.assert_absent(
                 AssetLocators.DELETE_ICON("Hydraulic Press"))
             assert self.asset.is_visible(
                 AssetLocators.DELETE_ICON("Robotic Arm"))
@@ -288,6 +284,17 @@ class AssetsTests(Base):
         depth = 1
         max_depth = 5
 
+    # ---------- SEED THROUGH THE API (API_SEEDING=true) ----------
+        if api_seeder.enabled:
+            path = api_seeder.create_asset_chain(root, max_depth)
+            self.driver.refresh()
+            self.assertTrue(self.asset.is_visible(AssetLocators.ADD_ROOT_BTN), "Assets page not reloaded")
+            self.asset.expand_path(path[:-1])
+            for depth, name in enumerate(path[:-1], start=1):
+                self.assertTrue(self.asset.can_add_child(name), f"Add child must exist at depth {depth}")
+            self.asset.assert_absent(AssetLocators.ADD_CHILD_ICON(path[-1]), "Add child must NOT exist after max depth")
+            return
+
     # ---------- CREATE ROOT ----------
         self.asset.click(AssetLocators.ADD_ROOT_BTN)
         self.asset.send_keys(AssetLocators.ASSET_NAME_INPUT, root)
@@ -329,7 +336,9 @@ class AssetsTests(Base):
             AssetLocators.SUB_ASSET_SAVE_BTN
         )
             # WAIT FOR TREE TO STABILIZE
-            time.sleep(2)
+            self.asset.wait_for_save_finished(
+            AssetLocators.SUB_ASSET_NAME_INPUT
+        )
 
         # Expand tree to reveal new child
             self.asset.expand_path(path)
@@ -366,12 +375,10 @@ class AssetsTests(Base):
         self.asset.select_asset(asset_name)
     # Open Configure Signals
         self.asset.click(AssetLocators.CONFIGURE_SIGNALS_BTN)
-        time.sleep(2)
     # Ensure Available Signals table is visible
         self.assertTrue(self.asset.is_visible(AssetLocators.AVAILABLE_SIGNALS_TABLE), "Available signals table not visible")   
     # Add VOLTAGE signal
         self.asset.click(AssetLocators.ADD_SIGNAL_BTN)
-        time.sleep(2)
     # Save changes
         self.asset.click(AssetLocators.SAVE_ALL_CHANGES_BTN)
     # Verify success toast
@@ -1,29 +1,52 @@
 import os
+import time
+import atexit
+import functools
+import sqlite3
 import unittest
+from contextlib import contextmanager
 from selenium import webdriver
 from dotenv import load_dotenv
 import allure
-from datetime import datetime
+from BrowserPool import BrowserPool, PooledChrome
+from SleepAudit import sleep_audit
+from LocatorProfiler import locator_profiler
+from CommandLog import command_log
+from RunHistory import run_history
+from PerfMetrics import perf_metrics
+from PerfBudget import perf_budgets
+from NetworkMonitor import NetworkMonitor
+from ScreenshotPipeline import screenshots
+from Screencast import Screencast
+from Forensics import forensics
+from DownloadTracker import DownloadTracker
+from ArtifactStore import artifact_store
+from StandInServer import start_for_suite
 
 load_dotenv()
 
 class Base(unittest.TestCase):
     driver = None
-    screenshot_path = None
+    pool = None
+    stand_in = None
 
     @classmethod
-    def start_driver(cls):
-        download_path = os.path.join(os.getcwd(), "Downloads")
-
-        cls.screenshot_path = os.path.join(os.getcwd(), "Screenshots")
-        os.makedirs(cls.screenshot_path, exist_ok=True)
+    def output_dir(cls):
+        """Root for Downloads; every driver gets its own directory under it."""
+        return os.getenv("TMIND_OUTPUT_DIR", os.getcwd())
 
+    @classmethod
+    def chrome_options(cls):
         chrome_options = webdriver.ChromeOptions()
-
-        prefs = {"download.default_directory": download_path}
-        chrome_options.add_experimental_option("prefs", prefs)
         chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
         chrome_options.add_argument("--window-size=1920,1080")
+        logging_prefs = {}
+        if NetworkMonitor.enabled:
+            logging_prefs.update(NetworkMonitor.logging_prefs())
+        if forensics.enabled:
+            logging_prefs.update(forensics.logging_prefs())
+        if logging_prefs:
+            chrome_options.set_capability("goog:loggingPrefs", logging_prefs)
 
         if os.getenv("RUNNING_IN_DOCKER") == "true":
             chrome_options.binary_location = "/usr/bin/chromium"
@@ -31,29 +54,175 @@ class Base(unittest.TestCase):
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
             chrome_options.add_argument("--disable-gpu")
-            
-        cls.driver = webdriver.Chrome(options=chrome_options)
+        return chrome_options
+
+    @classmethod
+    def create_driver(cls, options=None):
+        driver = command_log.attach(PooledChrome(options=options or cls.chrome_options()))
+        DownloadTracker.attach(driver, os.path.join(cls.output_dir(), "Downloads"))
+        return Screencast.attach(driver)
+
+    @classmethod
+    def get_pool(cls):
+        """Shared warm-browser pool; BROWSER_POOL_SIZE=0 turns it off."""
+        size = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+        if size <= 0:
+            return None
+        if Base.pool is None:
+            Base.pool = BrowserPool(
+                Base.create_driver,
+                size=size,
+                max_uses=int(os.getenv("BROWSER_POOL_MAX_USES", "20")),
+                on_reset=forensics.reset if forensics.enabled else None)
+            atexit.register(Base.pool.shutdown)
+        return Base.pool
+
+    @staticmethod
+    def shutdown():
+        """Quit pooled browsers, finish background writes, write the reports and
+        close the artifact store. Runs at exit; processes that leave without
+        running atexit (parallel workers) call it directly. Each hook runs once."""
+        hooks = [screenshots.drain, sleep_audit.report, locator_profiler.report, command_log.report,
+                 perf_metrics.report, perf_budgets.report, artifact_store.close]
+        if Base.pool is not None:
+            hooks.insert(0, Base.pool.shutdown)
+            Base.pool = None
+        for hook in hooks:
+            atexit.unregister(hook)
+            try:
+                hook()
+            except Exception as e:
+                print(f"Shutdown step {hook.__qualname__} failed: {e}")
+
+    @staticmethod
+    def start_stand_in():
+        """STAND_IN=true: serve the stand-in frontend from this process and use it as
+        BASE_URL. Started with the first driver, so a process that only collects
+        tests (the ParallelRunner parent) never binds a port."""
+        if os.getenv("STAND_IN") == "true" and Base.stand_in is None:
+            Base.stand_in = start_for_suite()
+        return Base.stand_in
+
+    @classmethod
+    def start_driver(cls):
+        cls.start_stand_in()
+        pool = cls.get_pool()
+        cls.driver = pool.acquire() if pool else cls.create_driver()
         # cls.driver.maximize_window()
         # cls.driver.get(os.environ.get("BASE_URL"))
         return cls.driver
 
+    def run(self, result=None):
+        self.phase_timings = {}
+        self.failed = False
+        # Instance attributes shadow the methods unittest looks up by name
+        self.setUp = self.timed_phase_call("setup", self.setUp)
+        self.tearDown = self.timed_phase_call("teardown", self.tearDown)
+        setattr(self, self._testMethodName,
+                self.timed_phase_call("call", getattr(self, self._testMethodName)))
+        self.started_at = time.monotonic()
+        self.started_wall = time.time()
+        self.addCleanup(self.save_screencast)
+        self.addCleanup(self.save_forensics)
+        self.addCleanup(screenshots.attach_pending)
+        self.addCleanup(self.collect_downloads)
+        self.addCleanup(self.check_command_budget)
+        self.addCleanup(self.check_perf_budgets)
+        test_id = self.id()
+        with sleep_audit.test(test_id), locator_profiler.test(test_id), \
+                command_log.test(test_id), perf_metrics.test(test_id), perf_budgets.test(test_id), \
+                artifact_store.test(test_id):
+            return super().run(run_history.wrap(result))
+
+    # ---------------- Phase timings ----------------
+    @contextmanager
+    def timed_phase(self, phase):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_timings[phase] = round(time.perf_counter() - started, 3)
+
+    def timed_phase_call(self, phase, function):
+        """function timed as phase; an exception other than a skip marks the test failed."""
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            with self.timed_phase(phase):
+                try:
+                    return function(*args, **kwargs)
+                except unittest.SkipTest:
+                    raise
+                except BaseException:
+                    self.failed = True
+                    raise
+        return timed
+
+    def collect_downloads(self):
+        """Move the files this test downloaded into the artifact store."""
+        driver = self.__class__.driver
+        if driver is None or getattr(driver, "downloads", None) is None:
+            return
+        try:
+            artifact_store.collect(driver.downloads.directory, "download")
+        except (OSError, sqlite3.Error) as e:
+            print(f"Collecting downloads failed: {e}")
+
+    def failed_driver(self):
+        """The class driver when setUp, the test or tearDown has failed, else None."""
+        driver = self.__class__.driver
+        if not getattr(self, "failed", False) or driver is None or not driver.session_id:
+            return None
+        return driver
+
+    def save_screencast(self):
+        """On failure, keep the last seconds of the screen as a clip; passing tests skip this."""
+        driver = self.failed_driver() if Screencast.enabled else None
+        if driver is None:
+            return
+        try:
+            with command_log.internal():
+                Screencast.for_driver(driver).clip(f"{self._testMethodName}_screencast", since=self.started_at)
+        except Exception as e:
+            print(f"Saving the screencast failed: {e}")
+
+    def save_forensics(self):
+        """On failure, attach DOM, console, network and command log as one bundle."""
+        driver = self.failed_driver() if forensics.enabled else None
+        if driver is None:
+            return
+        try:
+            forensics.save(driver, self.id(), f"{self._testMethodName}_forensics",
+                           since=self.started_wall, timings=self.phase_timings)
+        except Exception as e:
+            print(f"Saving the forensics bundle failed: {e}")
+
+    def check_command_budget(self):
+        """Attach this test's WebDriver commands to Allure; fail it when over budget."""
+        if not command_log.enabled:
+            return
+        allure.attach(command_log.summary(), name="webdriver_commands",
+                      attachment_type=allure.attachment_type.TEXT)
+        test_method = getattr(self, self._testMethodName, None)
+        budget = getattr(test_method, "command_budget", command_log.budget)
+        if budget and command_log.count() > budget:
+            # Cleanups run last-in first-out, so forensics and the screencast still see this
+            self.failed = True
+            self.fail(f"{command_log.count()} WebDriver commands, budget is {budget}")
+
+    def check_perf_budgets(self):
+        """Fail the test for "fail" budgets its page-object calls went over."""
+        exceeded = [v["message"] for v in perf_budgets.take_violations() if v["mode"] == "fail"]
+        if exceeded:
+            self.failed = True
+            self.fail("Performance budget exceeded: " + "; ".join(exceeded))
+
     def attach_screenshot(self, suffix=""):
+        """Capture now; the file is written in the background and attached to
+        Allure when the test finishes. Returns a Future for the file path."""
         try:
             driver = self.__class__.driver
             if driver and driver.session_id:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                test_name = self._testMethodName
-                screenshot_name = f"{test_name}{suffix}_{timestamp}.png"
-                screenshot_file = os.path.join(
-                    self.__class__.screenshot_path, screenshot_name)
-
-                driver.save_screenshot(screenshot_file)
-                allure.attach.file(
-                    screenshot_file,
-                    name=screenshot_name,
-                    attachment_type=allure.attachment_type.PNG
-                )
-                return screenshot_file
+                return screenshots.capture(driver, f"{self._testMethodName}{suffix}")
         except Exception as e:
             print(f"Screenshot capture failed: {e}")
         return None
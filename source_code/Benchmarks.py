@@ -0,0 +1,225 @@
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from datetime import datetime
+
+from Base import Base
+from CommandLog import command_log
+from LoadRunner import percentile
+from Page import LoginPage, BasePage, DevicePage, AssetPage
+from StandInServer import StandInServer, EMAIL, PASSWORD
+from locators import DeviceLocators, AssetLocators
+
+REPORT_DIR = os.path.join(os.getenv("TMIND_OUTPUT_DIR", os.getcwd()), "reports", "benchmarks")
+
+
+# ---------------- Benchmarks ----------------
+# Each benchmark opens a stand-in route, waits for its landmark, then calls
+# one BasePage primitive repeatedly. Calls must leave the page as they found it.
+def bench_click(page):
+    page.click(DeviceLocators.SEARCH_DEVICES_INPUT)
+
+
+def bench_send_keys(page):
+    page.send_keys(DeviceLocators.SEARCH_DEVICES_INPUT, "Pressure")
+
+
+def bench_is_visible(page):
+    page.is_visible(DeviceLocators.ADD_DEVICE_BUTTON)
+
+
+def bench_wait_for(page):
+    page.wait_for(DeviceLocators.ADD_DEVICE_BUTTON, "clickable")
+
+
+def bench_reset_search(page):
+    # Keyboard clearing: click, Ctrl+A, Delete, Space, Backspace
+    page.send_keys(DeviceLocators.SEARCH_DEVICES_INPUT, "Pressure")
+    page.reset_search()
+
+
+def bench_clear_search(page):
+    # JS clear plus the waits for the emptied input and the re-rendered tree
+    page.get_element(AssetLocators.SEARCH_INPUT).send_keys("Robotic")
+    page.clear_search()
+
+
+def bench_hover_then_click(page):
+    page._hover_asset_row("Robotic Arm")
+    page.select_asset("Robotic Arm")
+
+
+BENCHMARKS = {
+    "click": ("/devices", DevicePage, DeviceLocators.SEARCH_DEVICES_INPUT, bench_click),
+    "send_keys": ("/devices", DevicePage, DeviceLocators.SEARCH_DEVICES_INPUT, bench_send_keys),
+    "is_visible": ("/devices", BasePage, DeviceLocators.ADD_DEVICE_BUTTON, bench_is_visible),
+    "wait_for": ("/devices", BasePage, DeviceLocators.ADD_DEVICE_BUTTON, bench_wait_for),
+    "reset_search": ("/devices", BasePage, DeviceLocators.SEARCH_DEVICES_INPUT, bench_reset_search),
+    "clear_search": ("/assets", AssetPage, AssetLocators.ASSET_NAME_NODE("Robotic Arm"), bench_clear_search),
+    "hover_then_click": ("/assets", AssetPage, AssetLocators.ASSET_NAME_NODE("Robotic Arm"), bench_hover_then_click),
+}
+
+
+def summarize(samples, commands):
+    ordered = sorted(samples)
+    return {
+        "calls": len(samples),
+        "mean_ms": round(statistics.mean(samples), 2),
+        "p50_ms": round(percentile(ordered, 50), 2),
+        "p95_ms": round(percentile(ordered, 95), 2),
+        "round_trips": round(commands / len(samples), 2),
+    }
+
+
+class BenchmarkRunner:
+    """Runs the benchmarks in one headless browser against a private stand-in.
+
+    The stand-in answers without latency unless told otherwise, so the numbers
+    are framework overhead plus Chrome, not the app or the network. Round
+    trips are counted by the command log, which is switched on for the run.
+    """
+
+    def __init__(self, iterations=50, warmup=5, headless=True, latency_ms=0):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.headless = headless
+        self.server = StandInServer(latency_ms=latency_ms)
+        self.driver = None
+
+    def start(self):
+        self.server.start()
+        os.environ["BASE_URL"] = self.server.url
+        command_log.enabled = True
+        options = Base.chrome_options()
+        if self.headless:
+            options.add_argument("--headless=new")
+        self.driver = Base.create_driver(options)
+
+        login = LoginPage(self.driver)
+        login.enter_email(EMAIL)
+        login.enter_password(PASSWORD)
+        login.click_login()
+        login.is_dashboard_displayed()
+
+    def stop(self):
+        if self.driver is not None:
+            self.driver.quit()
+        self.server.stop()
+
+    def run_one(self, name):
+        route, page_class, landmark, call = BENCHMARKS[name]
+        self.driver.get(self.server.url + route)
+        page = page_class(self.driver)
+        page.wait_for(landmark)
+        for _ in range(self.warmup):
+            call(page)
+
+        samples = []
+        with command_log.test(f"benchmark:{name}"):
+            for _ in range(self.iterations):
+                started = time.perf_counter()
+                call(page)
+                samples.append((time.perf_counter() - started) * 1000)
+            commands = command_log.count()
+        return summarize(samples, commands)
+
+    def run(self, names):
+        self.start()
+        try:
+            return {name: self.run_one(name) for name in names}
+        finally:
+            self.stop()
+
+
+# ---------------- Results ----------------
+def git_revision():
+    """(short commit, dirty) of the working tree, or ("unknown", False)."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+
+def save(results, iterations):
+    commit, dirty = git_revision()
+    record = {
+        "commit": commit,
+        "dirty": dirty,
+        "at": datetime.now().isoformat(timespec="seconds"),
+        "iterations": iterations,
+        "results": results,
+    }
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    path = os.path.join(REPORT_DIR, f"{commit}{'-dirty' if dirty else ''}.json")
+    with open(path, "w") as f:
+        json.dump(record, f, indent=2)
+    return path
+
+
+def load(ref):
+    """A saved result by path or by (a prefix of) its commit."""
+    if os.path.isfile(ref):
+        path = ref
+    else:
+        matches = sorted(f for f in os.listdir(REPORT_DIR) if f.startswith(ref)) if os.path.isdir(REPORT_DIR) else []
+        if not matches:
+            raise SystemExit(f"No saved benchmark for {ref!r} in {REPORT_DIR}")
+        path = os.path.join(REPORT_DIR, matches[0])
+    with open(path) as f:
+        return json.load(f)
+
+
+def print_results(results):
+    print(f"\n{'benchmark':18} {'mean':>9} {'p50':>9} {'p95':>9} {'trips':>6}")
+    for name, r in results.items():
+        print(f"{name:18} {r['mean_ms']:9.1f} {r['p50_ms']:9.1f} {r['p95_ms']:9.1f} {r['round_trips']:6.1f}")
+
+
+def print_comparison(baseline, results):
+    print(f"\nAgainst {baseline['commit']} ({baseline['at']}):")
+    print(f"{'benchmark':18} {'p50 before':>11} {'p50 now':>9} {'change':>8} {'trips':>11}")
+    for name, r in results.items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:18} {'-':>11} {r['p50_ms']:9.1f}")
+            continue
+        change = (r["p50_ms"] - before["p50_ms"]) / before["p50_ms"] * 100 if before["p50_ms"] else 0.0
+        print(f"{name:18} {before['p50_ms']:11.1f} {r['p50_ms']:9.1f} {change:+7.1f}% "
+              f"{before['round_trips']:5.1f}->{r['round_trips']:<5.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmark the BasePage primitives on the stand-in frontend")
+    parser.add_argument("--only", default=None, help="Comma-separated benchmarks (default: all)")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Stand-in API latency")
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    parser.add_argument("--compare", default=None, help="Saved result (commit prefix or path) to compare with")
+    args = parser.parse_args(argv)
+
+    names = args.only.split(",") if args.only else list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}; choose from {', '.join(BENCHMARKS)}")
+
+    baseline = load(args.compare) if args.compare else None
+    runner = BenchmarkRunner(args.iterations, args.warmup, not args.headed, args.latency_ms)
+    results = runner.run(names)
+    print_results(results)
+    if baseline:
+        print_comparison(baseline, results)
+    print(f"Saved: {save(results, args.iterations)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
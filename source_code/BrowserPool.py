@@ -0,0 +1,179 @@
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from selenium import webdriver
+
+
+def origin(url):
+    """scheme://host[:port] of an http(s) URL, else None."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}" if parts.scheme in ("http", "https") else None
+
+
+class PooledChrome(webdriver.Chrome):
+    """Chrome driver whose quit() hands the browser back to its pool."""
+    pool = None
+
+    def quit(self):
+        if self.pool is not None:
+            self.pool.release(self)
+        else:
+            super().quit()
+            if getattr(self, "downloads", None):
+                self.downloads.close()
+
+
+class BrowserPool:
+    """Keeps pre-launched, reset browsers ready so tests skip the cold start."""
+
+    def __init__(self, factory, size=2, max_uses=20, on_reset=None):
+        self.factory = factory
+        # Extra per-lease cleanup, e.g. draining buffered browser logs
+        self.on_reset = on_reset
+        self.size = size
+        self.max_uses = max_uses
+        self._idle = queue.Queue()
+        self._uses = {}
+        self._leased = set()
+        # Released browsers whose reset has not started yet
+        self._returned = set()
+        self._pending = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(size, 1), thread_name_prefix="browser-pool")
+
+    # ---------------- Lease ----------------
+    def acquire(self):
+        """Return a ready browser, launching one inline if none is warm yet."""
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            driver = self._launch()
+        with self._lock:
+            self._leased.add(driver)
+        driver.pool = self
+        self._refill()
+        return driver
+
+    def release(self, driver):
+        """Take a browser back; it is reset or retired in the background."""
+        with self._lock:
+            if driver not in self._leased:
+                return
+            self._leased.discard(driver)
+            self._uses[driver] = self._uses.get(driver, 0) + 1
+            retire = self._closed or self._uses[driver] >= self.max_uses
+            if not retire:
+                self._pending += 1
+                self._returned.add(driver)
+        if retire:
+            self._terminate(driver)
+            self._refill()
+        else:
+            self._executor.submit(self._recycle, driver)
+
+    # ---------------- Background work ----------------
+    def _launch(self):
+        driver = self.factory()
+        with self._lock:
+            self._uses[driver] = 0
+        return driver
+
+    def _refill(self):
+        with self._lock:
+            if self._closed:
+                return
+            missing = self.size - self._idle.qsize() - self._pending
+            self._pending += max(missing, 0)
+        for _ in range(max(missing, 0)):
+            self._executor.submit(self._warm_one)
+
+    def _warm_one(self):
+        try:
+            driver = self._launch()
+        except Exception as e:
+            print(f"Browser pool launch failed: {e}")
+            with self._lock:
+                self._pending -= 1
+            return
+        self._park(driver)
+
+    def _recycle(self, driver):
+        with self._lock:
+            self._returned.discard(driver)
+        try:
+            self.reset(driver)
+            if self.on_reset is not None:
+                self.on_reset(driver)
+        except Exception as e:
+            print(f"Browser pool reset failed, retiring browser: {e}")
+            with self._lock:
+                self._pending -= 1
+            self._terminate(driver)
+            self._refill()
+            return
+        self._park(driver)
+
+    def _park(self, driver):
+        with self._lock:
+            self._pending -= 1
+            closed = self._closed
+            if not closed:
+                self._idle.put(driver)
+        if closed:
+            self._terminate(driver)
+
+    @staticmethod
+    def reset(driver):
+        """Close extra tabs, clear cookies and storage, land on about:blank."""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        origins = {origin(os.getenv("BASE_URL", ""))}
+        current = driver.current_url
+        if current.startswith("http"):
+            # sessionStorage belongs to the tab, so it can only be cleared from the page
+            driver.execute_script("window.sessionStorage.clear();")
+            origins.add(origin(current))
+        for storage_origin in origins - {None}:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                "origin": storage_origin,
+                "storageTypes": "local_storage,indexeddb,cache_storage,service_workers"})
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        driver.get("about:blank")
+        if getattr(driver, "network_monitor", None):
+            driver.network_monitor.reset()
+
+    def _terminate(self, driver):
+        with self._lock:
+            self._uses.pop(driver, None)
+        driver.pool = None
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Error quitting pooled driver: {e}")
+
+    # ---------------- Shutdown ----------------
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            leased = list(self._leased)
+            self._leased.clear()
+        # Queued warm launches would only start a browser to quit it again
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            leased += self._returned
+            self._returned.clear()
+        for driver in leased:
+            self._terminate(driver)
+        while True:
+            try:
+                self._terminate(self._idle.get_nowait())
+            except queue.Empty:
+                break
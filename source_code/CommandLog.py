@@ -0,0 +1,158 @@
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+import unittest
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+OUTSIDE_TESTS = "<class fixtures>"
+FRAMEWORK_MODULES = ("selenium", "urllib3", "http.", "contextlib", __name__)
+
+
+def command_budget(limit):
+    """Per-test override of COMMAND_BUDGET; 0 means unlimited."""
+    def decorate(test_method):
+        test_method.command_budget = limit
+        return test_method
+    return decorate
+
+
+class CommandLog:
+    """Times every WebDriver command and charges it to the running test.
+
+    Each driver's RemoteConnection.execute is wrapped, so every round trip is
+    recorded with its endpoint, duration and the page-object method that
+    issued it. Only the thread running the test is charged: background
+    threads (browser pool resets, load-run users) are not, and neither are
+    the harness's own commands issued inside internal().
+    """
+
+    def __init__(self, enabled, budget=0):
+        self.enabled = enabled
+        self.budget = budget
+        self.current = OUTSIDE_TESTS
+        self.records = []
+        self.totals = {}
+        self.thread = threading.main_thread()
+        self._local = threading.local()
+        if enabled:
+            atexit.register(self.report)
+
+    # ---------------- Hook ----------------
+    def attach(self, driver):
+        if not self.enabled or getattr(driver, "command_log_attached", False):
+            return driver
+        connection = driver.command_executor
+        execute = connection.execute
+        log = self
+
+        def timed_execute(command, params):
+            if threading.current_thread() is not log.thread or getattr(log._local, "depth", 0):
+                return execute(command, params)
+            started = time.perf_counter()
+            try:
+                return execute(command, params)
+            finally:
+                log._record(connection, command, (time.perf_counter() - started) * 1000)
+
+        connection.execute = timed_execute
+        driver.command_log_attached = True
+        return driver
+
+    @contextmanager
+    def internal(self):
+        """Commands issued inside the block (profiling, forensics, screenshots)
+        are not charged to the test."""
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+
+    @staticmethod
+    def _issuer():
+        """Outermost page-object method on the stack, else the first caller
+        outside selenium and the HTTP stack."""
+        page_method, fallback = None, None
+        frame = sys._getframe(2)
+        while frame is not None:
+            owner = frame.f_locals.get("self")
+            if isinstance(owner, unittest.TestCase):
+                break
+            module = frame.f_globals.get("__name__", "")
+            if owner is not None and type(owner).__module__ == "Page":
+                page_method = f"{type(owner).__name__}.{frame.f_code.co_name}"
+            elif fallback is None and not module.startswith(FRAMEWORK_MODULES):
+                fallback = f"{module}.{frame.f_code.co_name}"
+            frame = frame.f_back
+        if page_method is None and fallback is None and frame is not None:
+            fallback = f"{type(frame.f_locals['self']).__name__}.{frame.f_code.co_name}"
+        return page_method or fallback or "-"
+
+    def _record(self, connection, command, duration_ms):
+        endpoint = getattr(connection, "_commands", {}).get(command)
+        self.records.append({
+            "command": command,
+            "endpoint": f"{endpoint[0]} {endpoint[1]}" if endpoint else command,
+            "ms": round(duration_ms, 2),
+            "issuer": self._issuer(),
+        })
+
+    # ---------------- Per test ----------------
+    @contextmanager
+    def test(self, test_id):
+        previous, self.current = self.current, test_id
+        previous_records, self.records = self.records, []
+        previous_thread, self.thread = self.thread, threading.current_thread()
+        try:
+            yield
+        finally:
+            if self.enabled:
+                self.totals[test_id] = {
+                    "commands": len(self.records),
+                    "ms": round(sum(r["ms"] for r in self.records), 1),
+                }
+            self.current, self.records, self.thread = previous, previous_records, previous_thread
+
+    def count(self):
+        return len(self.records)
+
+    def summary(self, top=15):
+        """Plain-text breakdown of the current test's commands."""
+        total_ms = sum(r["ms"] for r in self.records)
+        lines = [f"{len(self.records)} WebDriver commands, {total_ms:.0f} ms", "", "By issuer:"]
+        lines += self._breakdown("issuer", top)
+        lines += ["", "By command:"]
+        lines += self._breakdown("command", top)
+        return "\n".join(lines)
+
+    def _breakdown(self, field, top):
+        counts, durations = Counter(), defaultdict(float)
+        for record in self.records:
+            counts[record[field]] += 1
+            durations[record[field]] += record["ms"]
+        return [f"{counts[key]:5d}  {durations[key]:9.1f} ms  {key}"
+                for key, _ in sorted(durations.items(), key=lambda item: item[1], reverse=True)[:top]]
+
+    # ---------------- Report ----------------
+    def report(self):
+        if not self.totals:
+            return
+        rows = sorted(self.totals.items(), key=lambda item: item[1]["commands"], reverse=True)
+        print("\n===== Command log: WebDriver round trips per test =====")
+        for test_id, total in rows:
+            print(f"{total['commands']:6d} cmds  {total['ms']:9.1f} ms  {test_id}")
+
+        path = os.path.join(os.getenv("TMIND_OUTPUT_DIR", os.getcwd()), "reports", "command_log.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump([dict(test=t, **total) for t, total in rows], f, indent=2)
+
+
+command_log = CommandLog(
+    os.getenv("COMMAND_LOG") == "true" or int(os.getenv("COMMAND_BUDGET", "0")) > 0,
+    budget=int(os.getenv("COMMAND_BUDGET", "0")))
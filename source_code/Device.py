@@ -1,27 +1,37 @@
 import os
 import unittest
 from Base import Base
-from Page import LoginPage, DevicePage
+from Page import DevicePage
+from DomObserver import DomObserver
+from LoginCache import login_cache
+from ApiSeeder import api_seeder
 from locators import SignUpLocators, DeviceLocators
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from dotenv import load_dotenv
 from selenium.webdriver.common.keys import Keys
 import allure
-import time
 load_dotenv()
 
 DEVICE_NAME = "BatteryMonitor_01"
+# API_SEEDING=true: test_11 deletes a device of its own instead of the one test_02 creates
+DELETE_DEVICE_NAME = "BatteryMonitor_01_Delete"
+
+# Devices the delete, edit and config tests only need to exist
+SEEDED_DEVICES = [
+    {"name": DELETE_DEVICE_NAME, "description": "Seeded for delete"},
+    {"name": "TyrePressureStation_01", "description": "Seeded for edit"},
+    {"name": "PressureSensor", "description": "Seeded for config"},
+    {"name": "Controller_01", "description": "Seeded for edit validations"},
+]
 
 class DevicesTests(Base):
     @classmethod
     def setUpClass(cls):
         cls.driver = cls.start_driver()
-        login = LoginPage(cls.driver)
-        login.enter_email(os.environ.get("USER_EMAIL"))
-        login.enter_password(os.environ.get("PASSWORD"))
-        login.click_login()
-        assert login.is_dashboard_displayed(), "Login failed"
+        assert login_cache.login(cls.driver), "Login failed"
+        if api_seeder.enabled:
+            api_seeder.create_devices(SEEDED_DEVICES, exist_ok=True)
 
         cls.device = DevicePage(cls.driver)
         cls.device.go_to_devices()
@@ -32,6 +42,7 @@ class DevicesTests(Base):
         self.device = self.__class__.device
 
         self.device.close_any_device_modal_if_open()
+        self.device.mark_toasts()
 
     @allure.title("Verify Devices module opens successfully")
     @allure.severity(allure.severity_level.CRITICAL)
@@ -42,6 +53,22 @@ class DevicesTests(Base):
             self.attach_screenshot("_failure")
             raise
 
+    @allure.title("Verify wait_for_any finds a later locator when the first is absent")
+    @allure.severity(allure.severity_level.MINOR)
+    def test_01a_wait_for_any_matches_later_locator(self):
+        # The WebDriverWait fallback, as with DOM_OBSERVER_WAITS=false or timeout=0
+        enabled, DomObserver.enabled = DomObserver.enabled, False
+        try:
+            index, element = self.device.wait_for_any(
+                [DeviceLocators.CANCEL_DEVICE_BUTTON, DeviceLocators.ADD_DEVICE_BUTTON], timeout=0)
+        finally:
+            DomObserver.enabled = enabled
+        try:
+            assert index == 1 and element is not None, f"Expected the Add Device button, got index {index}"
+        except AssertionError:
+            self.attach_screenshot("_failure")
+            raise
+
     @allure.title("Verify user can create a device with valid data")
     @allure.severity(allure.severity_level.CRITICAL)
     def test_02_Verify_create_device_successfully(self):
@@ -49,9 +76,9 @@ class DevicesTests(Base):
         self.device.send_keys(DeviceLocators.DEVICE_NAME_INPUT, DEVICE_NAME)
         self.device.send_keys(DeviceLocators.DEVICE_DESCRIPTION_INPUT, "Battery monitoring")
         self.device.click(DeviceLocators.SAVE_DEVICE_BUTTON)
-        time.sleep(1)
+        self.device.wait_for_save_finished(DeviceLocators.DEVICE_NAME_INPUT)
         try:
-            assert self.device.is_visible(SignUpLocators.TOAST_SUCCESS), "Success toast not displayed"
+            assert self.device.has_toast("success"), "Success toast not displayed"
         except AssertionError:
             self.attach_screenshot("_failure")
             raise AssertionError("Device not created")
@@ -61,7 +88,7 @@ class DevicesTests(Base):
     def test_03_Verify_error_for_empty_device_name(self):
         self.device.click(DeviceLocators.ADD_DEVICE_BUTTON)
         self.device.click(DeviceLocators.SAVE_DEVICE_BUTTON)
-        time.sleep(1)
+        self.device.wait_for_save_finished(DeviceLocators.DEVICE_NAME_INPUT)
         try:
             self.device.verify_toast_error("Device Name is required.")
         except AssertionError:
@@ -75,9 +102,9 @@ class DevicesTests(Base):
         self.device.send_keys(DeviceLocators.DEVICE_NAME_INPUT, "TyrePressureStation_01")
         self.device.send_keys(DeviceLocators.DEVICE_DESCRIPTION_INPUT, "")
         self.device.click(DeviceLocators.SAVE_DEVICE_BUTTON)
-        time.sleep(1)
+        self.device.wait_for_save_finished(DeviceLocators.DEVICE_NAME_INPUT)
         try:
-            assert self.device.is_visible(SignUpLocators.TOAST_SUCCESS), "Success toast not displayed"
+            assert self.device.has_toast("success"), "Success toast not displayed"
             # assert self.device.is_device_visible_in_table("TyrePressureStation_01")
         except AssertionError:
             self.attach_screenshot("_failure")
@@ -89,7 +116,7 @@ class DevicesTests(Base):
         self.device.click(DeviceLocators.ADD_DEVICE_BUTTON)
         self.device.send_keys(DeviceLocators.DEVICE_NAME_INPUT, "Car@123")
         self.device.click(DeviceLocators.SAVE_DEVICE_BUTTON)
-        time.sleep(1)
+        self.device.wait_for_save_finished(DeviceLocators.DEVICE_NAME_INPUT)
         try:
             self.device.verify_toast_error("Device Name must")
         except AssertionError:
@@ -99,11 +126,10 @@ class DevicesTests(Base):
     @allure.title("Verify inline error for device name with only special symbols")
     @allure.severity(allure.severity_level.NORMAL)
     def test_06_Verify_error_for_device_name_only_special_symbols(self):
-        self.device.wait_for_toast_disappear()
         self.device.click(DeviceLocators.ADD_DEVICE_BUTTON)
         self.device.send_keys(DeviceLocators.DEVICE_NAME_INPUT, "#@!*")
         self.device.click(DeviceLocators.SAVE_DEVICE_BUTTON)
-        time.sleep(1)
+        self.device.wait_for_save_finished(DeviceLocators.DEVICE_NAME_INPUT)
         try:
             self.device.verify_toast_error("Device Name must")
         except AssertionError:
@@ -113,11 +139,10 @@ class DevicesTests(Base):
     @allure.title("Verify inline error for device name starting with dash")
     @allure.severity(allure.severity_level.NORMAL)
     def test_07_Verify_error_for_device_name_starting_with_dash(self):
-        self.device.wait_for_toast_to_disappear()
         self.device.click(DeviceLocators.ADD_DEVICE_BUTTON)
         self.device.send_keys(DeviceLocators.DEVICE_NAME_INPUT, "-Station01")
         self.device.click(DeviceLocators.SAVE_DEVICE_BUTTON)
-        time.sleep(1)
+        self.device.wait_for_save_finished(DeviceLocators.DEVICE_NAME_INPUT)
         try:
             self.device.verify_toast_error("Device Name must")
         except AssertionError:
@@ -127,11 +152,10 @@ class DevicesTests(Base):
     @allure.title("Verify inline error for device name shorter than minimum length")
     @allure.severity(allure.severity_level.NORMAL)
     def test_08_Verify_error_for_device_name_too_short(self):
-        self.device.wait_for_toast_to_disappear()
         self.device.click(DeviceLocators.ADD_DEVICE_BUTTON)
         self.device.send_keys(DeviceLocators.DEVICE_NAME_INPUT, "AB")
         self.device.click(DeviceLocators.SAVE_DEVICE_BUTTON)
-        time.sleep(1)
+        self.device.wait_for_save_finished(DeviceLocators.DEVICE_NAME_INPUT)
         try:
             self.device.verify_toast_error("Device Name must")
         except AssertionError:
@@ -141,11 +165,10 @@ class DevicesTests(Base):
     @allure.title("Verify inline error for device name exceeding maximum length")
     @allure.severity(allure.severity_level.NORMAL)
     def test_09_Verify_error_for_device_name_too_long(self):
-        self.device.wait_for_toast_to_disappear()
         self.device.click(DeviceLocators.ADD_DEVICE_BUTTON)
         self.device.send_keys(DeviceLocators.DEVICE_NAME_INPUT, "A" * 101)
         self.device.click(DeviceLocators.SAVE_DEVICE_BUTTON)
-        time.sleep(1)
+        self.device.wait_for_save_finished(DeviceLocators.DEVICE_NAME_INPUT)
         try:
             self.device.verify_toast_error("Device Name must")
         except AssertionError:
@@ -155,15 +178,14 @@ class DevicesTests(Base):
     @allure.title("Verify error for duplicate device name")
     @allure.severity(allure.severity_level.NORMAL)
     def test_10_Verify_error_for_duplicate_device(self):
-        self.device.wait_for_toast_to_disappear()
         duplicate_name = "TyrePressureStation_01"
         self.device.click(DeviceLocators.ADD_DEVICE_BUTTON)
         self.device.send_keys(DeviceLocators.DEVICE_NAME_INPUT, duplicate_name)
         self.device.send_keys(DeviceLocators.DEVICE_DESCRIPTION_INPUT, "Duplicate test")
         self.device.click(DeviceLocators.SAVE_DEVICE_BUTTON)
-        time.sleep(1)
+        self.device.wait_for_save_finished(DeviceLocators.DEVICE_NAME_INPUT)
         try:
-            assert self.device.is_visible(SignUpLocators.TOAST_ERROR), "Duplicate device error toast not shown"
+            assert self.device.has_toast("error"), "Duplicate device error toast not shown"
         except AssertionError:
             self.attach_screenshot("_failure")
             raise
@@ -171,13 +193,14 @@ class DevicesTests(Base):
     @allure.title("Verify user can delete a device successfully")
     @allure.severity(allure.severity_level.CRITICAL)
     def test_11_delete_device(self):
+        device = DELETE_DEVICE_NAME if api_seeder.enabled else DEVICE_NAME
         try:
-            self.device.click(DeviceLocators.DELETE_BUTTON(DEVICE_NAME))
+            self.device.click(DeviceLocators.DELETE_BUTTON(device))
             popup_name = self.driver.find_element(*DeviceLocators.DELETE_POPUP_DEVICE_NAME).text.replace('"', '').strip()
-            assert popup_name == DEVICE_NAME, "Incorrect device shown in delete popup"
+            assert popup_name == device, "Incorrect device shown in delete popup"
             self.device.click(DeviceLocators.YES_DELETE_IT_BUTTON)
             self.device.verify_toast_success("deleted successfully")
-            assert not self.device.is_device_visible_in_table(DEVICE_NAME)
+            assert self.device.is_device_absent_from_table(device)
         except AssertionError:
             self.attach_screenshot("_failure")
             raise
@@ -242,7 +265,7 @@ class DevicesTests(Base):
         invalid_device = "INVALID_DEVICE_999"
         self.device.send_keys(DeviceLocators.SEARCH_DEVICES_INPUT, invalid_device)
         try:
-            assert not self.device.is_device_visible_in_table(invalid_device)
+            assert self.device.is_device_absent_from_table(invalid_device)
         except AssertionError:
             self.attach_screenshot("_failure")
             raise
@@ -281,7 +304,7 @@ class DevicesTests(Base):
             self.device.send_keys(DeviceLocators.IP_ADDRESS, "192.168.1.1")
             self.device.send_keys(DeviceLocators.PORT, "502")
 
-            self.device.click(DeviceLocators.SAVE_CONFIG)
+            self.device.click_and_wait_idle(DeviceLocators.SAVE_CONFIG)
             self.device.verify_toast_success("updated successfully")
         except Exception:
             self.attach_screenshot("_failure")
@@ -0,0 +1,121 @@
+import os
+from selenium.common.exceptions import TimeoutException
+
+# Resolves Selenium locators in the page and resolves the async callback as soon
+# as one of them meets the condition. Checks run on every DOM mutation, plus a
+# 100 ms tick for CSS-only changes (transitions, opacity) that mutate nothing.
+OBSERVE_JS = r"""
+const [specs, condition, arg, timeoutMs, done] = arguments;
+
+const byText = (exact) => (value) => Array.from(document.querySelectorAll('a')).filter(
+    a => exact ? a.innerText.trim() === value : a.innerText.includes(value));
+const finders = {
+    'xpath': (value) => {
+        const r = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const out = [];
+        for (let i = 0; i < r.snapshotLength; i++) out.push(r.snapshotItem(i));
+        return out;
+    },
+    'css selector': (value) => Array.from(document.querySelectorAll(value)),
+    'id': (value) => Array.from(document.querySelectorAll('#' + CSS.escape(value))),
+    'name': (value) => Array.from(document.querySelectorAll('[name="' + CSS.escape(value) + '"]')),
+    'class name': (value) => Array.from(document.querySelectorAll('.' + CSS.escape(value))),
+    'tag name': (value) => Array.from(document.getElementsByTagName(value)),
+    'link text': byText(true),
+    'partial link text': byText(false),
+};
+
+const visible = (el) => {
+    if (!el.isConnected || el.getClientRects().length === 0) return false;
+    for (let node = el; node && node.nodeType === 1; node = node.parentElement) {
+        const style = getComputedStyle(node);
+        if (parseFloat(style.opacity) === 0) return false;
+        if (node === el && (style.visibility === 'hidden' || style.visibility === 'collapse')) return false;
+    }
+    return true;
+};
+
+const checks = {
+    visible: (els) => els.find(visible) || null,
+    clickable: (els) => els.find(el => visible(el) && !el.disabled) || null,
+    text: (els) => els.find(el => visible(el) && el.innerText.includes(arg)) || null,
+    count_gt: (els) => els.length > arg ? els.length : null,
+    gone: (els) => els.some(visible) ? null : true,
+};
+
+let finished = false, observer = null, ticker = null, timer = null;
+const finish = (result) => {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearInterval(ticker);
+    clearTimeout(timer);
+    done(result);
+};
+const evaluate = () => {
+    for (let i = 0; i < specs.length; i++) {
+        let value = null;
+        try { value = checks[condition](finders[specs[i][0]](specs[i][1])); } catch (e) {}
+        if (value !== null) return finish({index: i, value: value});
+    }
+};
+
+const observe = (callback) => {
+    observer = new MutationObserver(callback);
+    observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true, characterData: true});
+};
+
+if (condition === 'settled_gone') {
+    // arg is a quiet period in ms: once the DOM has not changed for that long
+    // (or timeoutMs runs out), look once and report whether nothing is visible.
+    const lookOnce = () => finish({index: 0, value: !specs.some(spec => {
+        try { return finders[spec[0]](spec[1]).some(visible); } catch (e) { return false; }
+    })});
+    let quiet = null;
+    const restart = () => { clearTimeout(quiet); quiet = setTimeout(lookOnce, arg); };
+    observe(restart);
+    restart();
+    timer = setTimeout(lookOnce, timeoutMs);
+} else {
+    evaluate();
+    if (!finished) {
+        if (timeoutMs <= 0) { finish(null); return; }
+        observe(evaluate);
+        ticker = setInterval(evaluate, 100);
+        timer = setTimeout(() => finish(null), timeoutMs);
+    }
+}
+"""
+
+
+def allow_script_time(driver, timeout):
+    """Raise the async script timeout once per driver, not before every wait."""
+    needed = max(timeout + 5, 30)
+    if getattr(driver, "observer_script_timeout", 0) < needed:
+        driver.set_script_timeout(needed)
+        driver.observer_script_timeout = needed
+
+
+class DomObserver:
+    """Waits inside the page with one async script instead of polling over WebDriver."""
+    enabled = os.getenv("DOM_OBSERVER_WAITS", "true") == "true"
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def wait(self, locators, condition="visible", timeout=10, arg=None):
+        """Return (index, value) for the first locator meeting condition; raise TimeoutException otherwise."""
+        allow_script_time(self.driver, timeout)
+        result = self.driver.execute_async_script(
+            OBSERVE_JS, [list(locator) for locator in locators], condition, arg, int(timeout * 1000))
+        if result is None:
+            raise TimeoutException(f"'{condition}' not met within {timeout}s for {locators}")
+        return result["index"], result["value"]
+
+    def settled_absent(self, locators, quiet_ms=300, timeout=10):
+        """Wait until the DOM has been quiet for quiet_ms, then report whether none of
+        locators is visible. One round trip; never waits past timeout."""
+        allow_script_time(self.driver, timeout)
+        result = self.driver.execute_async_script(
+            OBSERVE_JS, [list(locator) for locator in locators], "settled_gone", quiet_ms, int(timeout * 1000))
+        return result["value"]
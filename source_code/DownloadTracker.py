@@ -0,0 +1,143 @@
+import os
+import time
+import uuid
+import threading
+
+import trio
+
+PARTIAL_SUFFIXES = (".crdownload", ".tmp", ".part")
+
+
+class DownloadTracker:
+    """A download directory of its own per driver, and exact download waits.
+
+    Browser.setDownloadBehavior points Chrome at `directory`, so parallel
+    sessions never see each other's files. A daemon thread listens on the
+    driver's bidi connection (trio) with eventsEnabled: Chrome saves each
+    download under its guid, and when Browser.downloadProgress reports it
+    completed the file is renamed to its suggested name and handed to
+    wait_for_download(). Without the event stream (no bidi connection), the
+    wait falls back to watching the directory for a new finished file.
+    """
+
+    def __init__(self, driver, directory):
+        self.driver = driver
+        self.directory = directory
+        self.completed = []
+        self.failed = []
+        self.listening = False
+        self._names = {}
+        self._condition = threading.Condition()
+        self._thread = None
+
+    @classmethod
+    def for_driver(cls, driver, root=None):
+        tracker = getattr(driver, "downloads", None)
+        if tracker is None:
+            root = root or os.path.join(os.getcwd(), "Downloads")
+            tracker = cls(driver, os.path.join(root, f"session-{uuid.uuid4().hex[:8]}"))
+            driver.downloads = tracker
+        return tracker
+
+    @classmethod
+    def attach(cls, driver, root):
+        """Give driver its own directory under root and start listening; returns the driver."""
+        cls.for_driver(driver, root).start()
+        return driver
+
+    def start(self):
+        """Point Chrome at directory and start the listener; once per driver."""
+        if self._thread is not None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        # Set over WebDriver first so the directory is in place before the listener is up
+        self.driver.execute_cdp_cmd("Browser.setDownloadBehavior",
+                                    {"behavior": "allow", "downloadPath": self.directory})
+        self._thread = threading.Thread(target=self._run, name="downloads", daemon=True)
+        self._thread.start()
+
+    # ---------------- Events (background) ----------------
+    def _run(self):
+        try:
+            trio.run(self._listen)
+        except Exception as e:
+            if not self.listening:
+                print(f"Download events unavailable, watching {self.directory} instead: {e}")
+        finally:
+            self.listening = False
+
+    async def _listen(self):
+        async with self.driver.bidi_connection() as connection:
+            session, devtools = connection.session, connection.devtools
+            # Events only reach the session that enabled them, so set the behaviour again here
+            await session.execute(devtools.browser.set_download_behavior(
+                behavior="allowAndName", download_path=self.directory, events_enabled=True))
+            self.listening = True
+            # One channel for both events keeps them in order: a download's
+            # name is always known before it can complete
+            async for event in session.listen(devtools.browser.DownloadWillBegin,
+                                              devtools.browser.DownloadProgress):
+                if isinstance(event, devtools.browser.DownloadWillBegin):
+                    self._names[event.guid] = event.suggested_filename
+                else:
+                    self._on_progress(event.guid, event.state)
+
+    def _on_progress(self, guid, state):
+        if state == "inProgress":
+            return
+        with self._condition:
+            name = self._names.pop(guid, None) or guid
+            if state == "completed":
+                self.completed.append(self._rename(guid, name))
+            else:
+                self.failed.append(name)
+            self._condition.notify_all()
+
+    def _rename(self, guid, name):
+        """Saved as <guid>; give it its suggested name, uniquified like Chrome does."""
+        stem, ext = os.path.splitext(name)
+        target, copy = os.path.join(self.directory, name), 0
+        while os.path.exists(target):
+            copy += 1
+            target = os.path.join(self.directory, f"{stem} ({copy}){ext}")
+        os.replace(os.path.join(self.directory, guid), target)
+        return target
+
+    def close(self):
+        """Remove the directory if the test cleanups emptied it; called when the driver quits."""
+        try:
+            os.rmdir(self.directory)
+        except OSError:
+            pass
+
+    # ---------------- Waits (test thread) ----------------
+    def mark(self):
+        """Call before triggering a download; pass the result to wait_for_download."""
+        with self._condition:
+            return len(self.completed), len(self.failed), set(self._finished_files())
+
+    def wait_for_download(self, mark, timeout=10):
+        """Path of the first download finished after mark; raises TimeoutError."""
+        completed, failed, existing = mark
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                if len(self.completed) > completed:
+                    return self.completed[completed]
+                if len(self.failed) > failed:
+                    raise RuntimeError(f"Download of {self.failed[failed]} was canceled")
+                if not self.listening:
+                    new = [f for f in self._finished_files() if f not in existing]
+                    if new:
+                        return min(new, key=os.path.getmtime)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No download finished in {self.directory} within {timeout}s")
+                self._condition.wait(min(remaining, 0.1))
+
+    def _finished_files(self):
+        if not os.path.isdir(self.directory):
+            return []
+        return [entry.path for entry in os.scandir(self.directory)
+                if entry.is_file() and not entry.name.endswith(PARTIAL_SUFFIXES)
+                and entry.name not in self._names]
@@ -0,0 +1,106 @@
+import io
+import os
+import json
+import time
+import zipfile
+
+import allure
+
+from ArtifactStore import artifact_store
+from CommandLog import command_log
+from NetworkMonitor import NetworkMonitor
+
+# Fallback when NETWORK_MONITOR is off: the page's own Resource Timing buffer
+RESOURCE_TIMING_JS = """
+const since = arguments[0], count = arguments[1];
+return performance.getEntriesByType('resource')
+    .filter(r => performance.timeOrigin + r.startTime >= since)
+    .slice(-count)
+    .map(r => ({url: r.name, type: r.initiatorType, status: r.responseStatus || null,
+                started: Math.round(performance.timeOrigin + r.startTime),
+                duration_ms: Math.round(r.duration * 10) / 10,
+                transfer_bytes: r.transferSize}));
+"""
+
+PAGE_JS = """
+return {url: location.href, title: document.title, ready_state: document.readyState,
+        dom: '<!DOCTYPE html>\\n' + document.documentElement.outerHTML};
+"""
+
+
+class Forensics:
+    """One zip per failed test: DOM, console errors, recent requests, commands.
+
+    Nothing runs while a test passes. Chrome buffers console messages in
+    chromedriver (goog:loggingPrefs "browser"), NetworkMonitor and CommandLog
+    already keep their records in memory, so the failure hook reads them
+    out in a handful of calls, writes a single deflated bundle to the
+    artifact store and attaches it to Allure.
+    """
+
+    def __init__(self, enabled, requests=50):
+        self.enabled = enabled
+        self.requests = requests
+
+    @staticmethod
+    def logging_prefs():
+        return {"browser": "ALL"}
+
+    @staticmethod
+    def reset(driver):
+        """Drop buffered console messages; the browser pool calls this between leases."""
+        driver.get_log("browser")
+
+    # ---------------- Collection ----------------
+    def bundle(self, driver, test_id, since, timings=None):
+        """{file name: content} for a test that started at since (epoch seconds)."""
+        files = {"test.json": {"test": test_id, "timings": timings or {},
+                               "collected": time.strftime("%Y-%m-%dT%H:%M:%S")}}
+        try:
+            page = driver.execute_script(PAGE_JS)
+            files["dom.html"] = page.pop("dom")
+            files["test.json"]["page"] = page
+        except Exception as e:
+            files["test.json"]["page"] = {"error": str(e)}
+        files["console.json"] = self._console(driver, since)
+        files["network.json"] = self._network(driver, since)
+        if command_log.enabled:
+            files["commands.json"] = command_log.records
+            files["commands.txt"] = command_log.summary()
+        return files
+
+    def _console(self, driver, since):
+        try:
+            return [entry for entry in driver.get_log("browser") if entry["timestamp"] >= since * 1000]
+        except Exception as e:
+            return {"error": str(e)}
+
+    def _network(self, driver, since):
+        try:
+            if NetworkMonitor.enabled:
+                monitor = NetworkMonitor.for_driver(driver)
+                monitor.poll()
+                return [r for r in monitor.recent(self.requests) if (r.get("wall_time") or since) >= since]
+            return driver.execute_script(RESOURCE_TIMING_JS, since * 1000, self.requests)
+        except Exception as e:
+            return {"error": str(e)}
+
+    # ---------------- Output ----------------
+    def save(self, driver, test_id, name, since, timings=None):
+        """Collect, store and attach the bundle; returns its path. Call from the test thread."""
+        with command_log.internal():
+            files = self.bundle(driver, test_id, since, timings)
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for filename, content in files.items():
+                if not isinstance(content, str):
+                    content = json.dumps(content, indent=2, default=str)
+                archive.writestr(filename, content)
+        path = artifact_store.put_bytes(buffer.getvalue(), f"{name}.zip", "forensics", "zip", test_id)
+        allure.attach.file(path, name=name, attachment_type="application/zip", extension="zip")
+        return path
+
+
+forensics = Forensics(
+    os.getenv("FORENSICS") == "true",
+    requests=int(os.getenv("FORENSICS_REQUESTS", "50")))
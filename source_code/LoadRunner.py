@@ -0,0 +1,255 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from Base import Base
+from BrowserPool import BrowserPool
+from Page import BasePage, LoginPage, DevicePage, AssetPage, ManageUserPage
+from PerfBudget import perf_budgets
+from locators import DeviceLocators
+
+
+# ---------------- Journey steps ----------------
+# Each step drives the page objects of one virtual user and raises (or returns
+# False) when the app did not respond the way a user would expect.
+class Session:
+    def __init__(self, driver, search):
+        self.driver = driver
+        self.search = search
+        self._pages = {}
+
+    def page(self, page_class):
+        if page_class not in self._pages:
+            self._pages[page_class] = page_class(self.driver)
+        return self._pages[page_class]
+
+
+def step_login(session):
+    login = LoginPage(session.driver)
+    login.enter_email(login.username)
+    login.enter_password(login.password)
+    login.click_login()
+    return login.is_dashboard_displayed()
+
+
+def step_open_devices(session):
+    session.page(DevicePage).go_to_devices()
+
+
+def step_search_device(session):
+    devices = session.page(DevicePage)
+    devices.search_device(session.search["devices"])
+    return devices.is_visible(DeviceLocators.DEVICE_IN_TABLE(session.search["devices"]))
+
+
+def step_open_assets(session):
+    return session.page(AssetPage).open_assets_page()
+
+
+def step_search_asset(session):
+    session.page(AssetPage).search_asset(session.search["assets"])
+
+
+def step_open_manage_user(session):
+    session.page(ManageUserPage).go_to_manage_user()
+
+
+def step_search_user(session):
+    users = session.page(ManageUserPage)
+    users.search_user(session.search["users"])
+    return users.wait_until(lambda d: users.get_user_table())
+
+
+STEPS = {
+    "login": step_login,
+    "open_devices": step_open_devices,
+    "search_device": step_search_device,
+    "open_assets": step_open_assets,
+    "search_asset": step_search_asset,
+    "open_manage_user": step_open_manage_user,
+    "search_user": step_search_user,
+}
+
+JOURNEYS = {
+    "devices": ["login", "open_devices", "search_device"],
+    "assets": ["login", "open_assets", "search_asset"],
+    "manage_user": ["login", "open_manage_user", "search_user"],
+}
+
+DEFAULT_SEARCH = {"devices": "PressureSensor", "assets": "Hydraulic", "users": "admin"}
+
+
+# ---------------- Statistics ----------------
+def percentile(sorted_values, pct):
+    """Linear interpolation between closest ranks."""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+# ---------------- Runner ----------------
+class LoadRunner:
+    """Runs one journey in N concurrent headless browser sessions.
+
+    Users start evenly spread over ramp_up seconds and pause a random think
+    time between steps. A failed step ends that iteration; the user starts
+    the next one from a fresh page load.
+    """
+
+    def __init__(self, journey, users, iterations=1, duration=None, ramp_up=0.0,
+                 think=(0.0, 0.0), search=None):
+        self.steps = JOURNEYS[journey] if isinstance(journey, str) else list(journey)
+        self.journey = journey if isinstance(journey, str) else "custom"
+        self.users = users
+        self.iterations = iterations
+        self.duration = duration
+        self.ramp_up = ramp_up
+        self.think = think
+        self.search = {**DEFAULT_SEARCH, **(search or {})}
+        self.samples = []
+        self._lock = threading.Lock()
+        self._stop_at = None
+
+    @staticmethod
+    def create_driver():
+        options = Base.chrome_options()
+        options.add_argument("--headless=new")
+        return Base.create_driver(options)
+
+    def _record(self, user, iteration, step, started, ok, error=None):
+        with self._lock:
+            self.samples.append({
+                "user": user, "iteration": iteration, "step": step,
+                "ms": round((time.perf_counter() - started) * 1000, 1),
+                "ok": ok, "error": error,
+            })
+
+    def _user(self, user):
+        time.sleep(self.ramp_up * user / max(self.users, 1))
+        try:
+            driver = self.create_driver()
+        except Exception as e:
+            self._record(user, 0, "start_browser", time.perf_counter(), False, repr(e))
+            return
+        try:
+            iteration = 0
+            while self._keep_going(iteration):
+                iteration += 1
+                # Every journey starts as a new visitor: no cookies, storage or cache
+                BrowserPool.reset(driver)
+                session = Session(driver, self.search)
+                for step in self.steps:
+                    started = time.perf_counter()
+                    try:
+                        ok = STEPS[step](session) is not False
+                        self._record(user, iteration, step, started, ok, None if ok else "returned False")
+                    except Exception as e:
+                        ok = False
+                        self._record(user, iteration, step, started, False, f"{type(e).__name__}: {e}")
+                    if not ok:
+                        break
+                    time.sleep(random.uniform(*self.think))
+        finally:
+            driver.quit()
+
+    def _keep_going(self, iteration):
+        if self._stop_at is not None:
+            return time.monotonic() < self._stop_at
+        return iteration < self.iterations
+
+    def run(self):
+        # Steps are timed here; per-page prints and budget checks would only add noise
+        BasePage.verbose = False
+        perf_budgets.enabled = False
+        started = time.perf_counter()
+        self._stop_at = time.monotonic() + self.duration if self.duration else None
+        with ThreadPoolExecutor(max_workers=self.users, thread_name_prefix="load-user") as executor:
+            for future in [executor.submit(self._user, u) for u in range(self.users)]:
+                future.result()
+        return self.summary(time.perf_counter() - started)
+
+    def summary(self, elapsed):
+        steps = {}
+        for name in dict.fromkeys(self.steps + [s["step"] for s in self.samples]):
+            samples = [s for s in self.samples if s["step"] == name]
+            if not samples:
+                continue
+            ok = sorted(s["ms"] for s in samples if s["ok"])
+            errors = [s["error"] for s in samples if not s["ok"]]
+            steps[name] = {
+                "count": len(samples),
+                "errors": len(errors),
+                "error_rate": round(len(errors) / len(samples), 4),
+                **{f"p{p}_ms": None if not ok else round(percentile(ok, p), 1) for p in (50, 90, 95, 99)},
+                "max_ms": ok[-1] if ok else None,
+                "top_errors": sorted({e: errors.count(e) for e in errors}.items(),
+                                     key=lambda item: item[1], reverse=True)[:3],
+            }
+        last_step = self.steps[-1] if self.steps else None
+        completed = sum(1 for s in self.samples if s["step"] == last_step and s["ok"])
+        return {
+            "journey": self.journey,
+            "steps_in_order": self.steps,
+            "base_url": os.getenv("BASE_URL"),
+            "users": self.users,
+            "ramp_up_s": self.ramp_up,
+            "think_s": list(self.think),
+            "elapsed_s": round(elapsed, 1),
+            "completed_journeys": completed,
+            "journeys_per_s": round(completed / elapsed, 3) if elapsed else None,
+            "steps": steps,
+        }
+
+
+def print_summary(summary):
+    print(f"\n===== Load: {summary['journey']} x {summary['users']} users against {summary['base_url']} =====")
+    print(f"{'step':18} {'count':>6} {'err%':>6} {'p50':>8} {'p90':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for name, s in summary["steps"].items():
+        cells = [f"{s[k]:8.0f}" if s[k] is not None else f"{'-':>8}"
+                 for k in ("p50_ms", "p90_ms", "p95_ms", "p99_ms", "max_ms")]
+        print(f"{name:18} {s['count']:6d} {s['error_rate'] * 100:5.1f}% {' '.join(cells)}")
+        for error, count in s["top_errors"]:
+            print(f"{'':18} {count:4d}x {error[:100]}")
+    print(f"{summary['completed_journeys']} journeys completed in {summary['elapsed_s']}s "
+          f"({summary['journeys_per_s']}/s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a TMind user journey under concurrent load")
+    parser.add_argument("--journey", choices=sorted(JOURNEYS), default="devices")
+    parser.add_argument("--users", type=int, default=5)
+    parser.add_argument("--iterations", type=int, default=3, help="Journeys per user")
+    parser.add_argument("--duration", type=float, default=None,
+                        help="Seconds to keep users looping; overrides --iterations")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="Seconds until all users started")
+    parser.add_argument("--think", default="1-3", help="Think time between steps, e.g. 1-3 or 0")
+    parser.add_argument("--search", default=None, help="Search term for the journey's search step")
+    parser.add_argument("--report", default=os.path.join("reports", "load_report.json"))
+    args = parser.parse_args(argv)
+
+    Base.start_stand_in()
+    low, _, high = args.think.partition("-")
+    search = {"devices": "devices", "assets": "assets", "manage_user": "users"}[args.journey]
+    runner = LoadRunner(args.journey, args.users, args.iterations, args.duration, args.ramp_up,
+                        think=(float(low), float(high or low)),
+                        search={search: args.search} if args.search else None)
+    summary = runner.run()
+    print_summary(summary)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.report)), exist_ok=True)
+    with open(args.report, "w") as f:
+        json.dump({"summary": summary, "samples": runner.samples}, f, indent=2)
+    print(f"Report: {args.report}")
+    return 1 if any(s["errors"] for s in summary["steps"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,388 @@
+import os
+import re
+import sys
+import json
+import time
+import atexit
+import inspect
+import statistics
+import threading
+import unittest
+from contextlib import contextmanager
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from CommandLog import command_log
+
+OUTSIDE_TESTS = "<class fixtures>"
+MARKER = "@@ARG@@"
+
+# Resolves the locator `repeats` times in the page and reports the median
+# resolve time and match count; with a CSS candidate it times that too and
+# checks it returns the very same elements in the same order.
+PROFILE_JS = r"""
+const [using, value, css, repeats] = arguments;
+const resolve = (u, v) => {
+    if (u !== 'xpath') return Array.from(document.querySelectorAll(v));
+    const r = document.evaluate(v, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const out = [];
+    for (let i = 0; i < r.snapshotLength; i++) out.push(r.snapshotItem(i));
+    return out;
+};
+const time = (u, v) => {
+    const samples = [];
+    let els = [];
+    for (let i = 0; i < repeats; i++) {
+        const t0 = performance.now();
+        els = resolve(u, v);
+        samples.push(performance.now() - t0);
+    }
+    samples.sort((a, b) => a - b);
+    return {ms: samples[Math.floor(samples.length / 2)], els: els};
+};
+let main;
+try { main = time(using, value); } catch (e) { return null; }
+const out = {ms: main.ms, count: main.els.length};
+if (css) {
+    try {
+        const alt = time('css selector', css);
+        out.css_ms = alt.ms;
+        out.css_same = alt.els.length === main.els.length && alt.els.every((el, i) => el === main.els[i]);
+    } catch (e) {
+        out.css_same = false;
+    }
+}
+return out;
+"""
+
+# Strategies Selenium itself sends to the browser as CSS selectors
+AS_CSS = {
+    By.ID: lambda v: f"[id={_css_string(v)}]",
+    By.NAME: lambda v: f"[name={_css_string(v)}]",
+    By.CLASS_NAME: lambda v: "." + v,
+    By.TAG_NAME: lambda v: v,
+    By.CSS_SELECTOR: lambda v: v,
+}
+
+
+def _css_string(value):
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+# ---------------- XPath -> CSS ----------------
+STEP_NAME = re.compile(r"\*|[A-Za-z][\w-]*")
+LITERAL = r"""(?:'([^']*)'|"([^"]*)")"""
+CONDITIONS = [
+    (re.compile(rf"@([\w-]+)\s*=\s*{LITERAL}"), lambda m: f"[{m[1]}={_css_string(m[2] if m[2] is not None else m[3])}]"),
+    (re.compile(rf"contains\(\s*@([\w-]+)\s*,\s*{LITERAL}\s*\)"), lambda m: f"[{m[1]}*={_css_string(m[2] if m[2] is not None else m[3])}]"),
+    (re.compile(rf"starts-with\(\s*@([\w-]+)\s*,\s*{LITERAL}\s*\)"), lambda m: f"[{m[1]}^={_css_string(m[2] if m[2] is not None else m[3])}]"),
+    (re.compile(r"not\(\s*@([\w-]+)\s*\)"), lambda m: f":not([{m[1]}])"),
+    (re.compile(r"@([\w-]+)"), lambda m: f"[{m[1]}]"),
+]
+
+
+def _split_top_level(text, separator):
+    """Split on separator outside quotes, brackets and parentheses."""
+    parts, depth, quote, start, i = [], 0, None, 0, 0
+    while i < len(text):
+        ch = text[i]
+        if quote:
+            quote = None if ch == quote else quote
+        elif ch in "'\"":
+            quote = ch
+        elif ch in "([":
+            depth += 1
+        elif ch in ")]":
+            depth -= 1
+        elif depth == 0 and text.startswith(separator, i):
+            parts.append(text[start:i])
+            i += len(separator)
+            start = i
+            continue
+        i += 1
+    parts.append(text[start:])
+    return parts
+
+
+def _closing_bracket(text, start):
+    depth, quote = 0, None
+    for i in range(start, len(text)):
+        ch = text[i]
+        if quote:
+            quote = None if ch == quote else quote
+        elif ch in "'\"":
+            quote = ch
+        elif ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def _condition_to_css(condition):
+    condition = condition.strip()
+    for pattern, build in CONDITIONS:
+        match = pattern.fullmatch(condition)
+        if match:
+            return build(match)
+    return None
+
+
+def xpath_to_css(xpath):
+    """CSS selector for XPath built only from tag steps, child/descendant axes and
+    attribute predicates; None when any part (text(), axes, positions) has no CSS form."""
+    if not xpath.startswith("//"):
+        return None
+    css, i = "", 0
+    while i < len(xpath):
+        if xpath.startswith("//", i):
+            css, i = css + (" " if css else ""), i + 2
+        elif xpath.startswith("/", i):
+            css, i = css + " > ", i + 1
+        else:
+            return None
+        name = STEP_NAME.match(xpath, i)
+        if not name:
+            return None
+        css, i = css + name.group(0), name.end()
+        while i < len(xpath) and xpath[i] == "[":
+            end = _closing_bracket(xpath, i)
+            if end < 0:
+                return None
+            for condition in _split_top_level(xpath[i + 1:end], " and "):
+                part = _condition_to_css(condition)
+                if part is None:
+                    return None
+                css += part
+            i = end + 1
+    return css
+
+
+# ---------------- Locator names ----------------
+def _locator_names():
+    """Static (by, value) -> "Class.NAME", and (by, regex, "Class.NAME") templates
+    for the dynamic locator functions, built from locators.py."""
+    import locators
+    static, templates = {}, []
+    for cls_name, cls in vars(locators).items():
+        if not inspect.isclass(cls) or cls.__module__ != locators.__name__:
+            continue
+        for attr in vars(cls):
+            name = f"{cls_name}.{attr}"
+            value = getattr(cls, attr)
+            if isinstance(value, tuple) and len(value) == 2 and all(isinstance(v, str) for v in value):
+                static.setdefault(value, name)
+            elif callable(value) and not attr.startswith("__"):
+                try:
+                    count = len(inspect.signature(value).parameters)
+                    by, template = value(*[MARKER] * count)
+                except Exception:
+                    continue
+                pattern = re.escape(template).replace(re.escape(MARKER), "(.+?)")
+                templates.append((by, re.compile(pattern + r"\Z", re.S), name))
+    return static, templates
+
+
+class LocatorProfiler:
+    """Records resolve time and match count of every locator used in a run.
+
+    With LOCATOR_PROFILE=true, WebDriver.find_element(s) and the in-page
+    DomObserver waits are wrapped; after each lookup the locator is resolved
+    again in the page to time it without the WebDriver round trip, and any
+    XPath with a CSS equivalent is checked against the live DOM.
+    """
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.slow_ms = float(os.getenv("LOCATOR_SLOW_MS", "2"))
+        self.max_matches = int(os.getenv("LOCATOR_MAX_MATCHES", "50"))
+        self.current = OUTSIDE_TESTS
+        self.stats = {}
+        self._names = None
+        self._resolved = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        if enabled:
+            self._install()
+            atexit.register(self.report)
+
+    # ---------------- Hooks ----------------
+    def _install(self):
+        from DomObserver import DomObserver
+        profiler = self
+
+        find_element, find_elements = WebDriver.find_element, WebDriver.find_elements
+        observer_wait, observer_absent = DomObserver.wait, DomObserver.settled_absent
+
+        def profiled_find_element(driver, by=By.ID, value=None):
+            with profiler._lookup(driver, [(by, value)], single=True, timed=True):
+                return find_element(driver, by, value)
+
+        def profiled_find_elements(driver, by=By.ID, value=None):
+            with profiler._lookup(driver, [(by, value)], single=False, timed=True):
+                return find_elements(driver, by, value)
+
+        def profiled_wait(observer, locators, *args, **kwargs):
+            with profiler._lookup(observer.driver, locators, single=True):
+                return observer_wait(observer, locators, *args, **kwargs)
+
+        def profiled_absent(observer, locators, *args, **kwargs):
+            with profiler._lookup(observer.driver, locators, single=False):
+                return observer_absent(observer, locators, *args, **kwargs)
+
+        WebDriver.find_element = profiled_find_element
+        WebDriver.find_elements = profiled_find_elements
+        DomObserver.wait = profiled_wait
+        DomObserver.settled_absent = profiled_absent
+
+    @contextmanager
+    def _lookup(self, driver, locators, single, timed=False):
+        """Run the lookup, then profile its locators; nested lookups (a fallback
+        WebDriverWait inside an observer wait) are attributed to the outer one."""
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            self._local.depth = depth
+            if depth == 0:
+                page = self._calling_page()
+                for by, value in locators:
+                    try:
+                        self._profile(driver, by, value, page, single, elapsed if timed else None)
+                    except Exception:
+                        pass  # profiling must never fail the lookup it observes
+
+    @contextmanager
+    def test(self, test_id):
+        previous, self.current = self.current, test_id
+        try:
+            yield
+        finally:
+            self.current = previous
+
+    # ---------------- Recording ----------------
+    @staticmethod
+    def _calling_page():
+        """Page-object class that issued the lookup, else the test class."""
+        fallback = "-"
+        frame = sys._getframe(1)
+        while frame is not None:
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                if type(owner).__module__ == "Page":
+                    return type(owner).__name__
+                if fallback == "-" and isinstance(owner, unittest.TestCase):
+                    fallback = type(owner).__name__
+            frame = frame.f_back
+        return fallback
+
+    def name_of(self, by, value):
+        key = (by, value)
+        if key not in self._resolved:
+            if self._names is None:
+                self._names = _locator_names()
+            static, templates = self._names
+            name = static.get(key)
+            if name is None:
+                name = next((n for b, pattern, n in templates if b == by and pattern.match(value)), None)
+            self._resolved[key] = name or f"{by}={value[:80]}"
+        return self._resolved[key]
+
+    def _profile(self, driver, by, value, page, single, call_ms):
+        if by == By.XPATH:
+            using, query, css = "xpath", value, xpath_to_css(value)
+        elif by in AS_CSS:
+            using, query, css = "css selector", AS_CSS[by](value), None
+        else:
+            using = query = css = None
+        measured = None
+        if using:
+            with command_log.internal():
+                measured = driver.execute_script(PROFILE_JS, using, query, css, 5)
+
+        # Load runs look locators up from several threads at once
+        with self._lock:
+            key = (self.name_of(by, value), page)
+            entry = self.stats.get(key)
+            if entry is None:
+                entry = self.stats[key] = {
+                    "by": by, "example": value, "css": css, "uses": 0, "tests": set(),
+                    "call_ms": [], "resolve_ms": [], "matches": [], "css_ms": [],
+                    "ambiguous": 0, "css_verified": 0, "css_mismatch": 0}
+            entry["uses"] += 1
+            entry["tests"].add(self.current)
+            if call_ms is not None:
+                entry["call_ms"].append(call_ms)
+            if not measured:
+                return
+            entry["resolve_ms"].append(measured["ms"])
+            entry["matches"].append(measured["count"])
+            if single and measured["count"] > 1:
+                entry["ambiguous"] += 1
+            if css and "css_same" in measured:
+                if not measured["css_same"]:
+                    entry["css_mismatch"] += 1
+                elif measured["count"] > 0:
+                    entry["css_verified"] += 1
+                    entry["css_ms"].append(measured["css_ms"])
+
+    # ---------------- Report ----------------
+    def rows(self):
+        rows = []
+        with self._lock:
+            stats = list(self.stats.items())
+        for (name, page), entry in stats:
+            resolve = entry["resolve_ms"]
+            row = {
+                "locator": name,
+                "page": page,
+                "by": entry["by"],
+                "example": entry["example"],
+                "uses": entry["uses"],
+                "tests": len(entry["tests"]),
+                "call_ms_median": _median(entry["call_ms"]),
+                "resolve_ms_median": _median(resolve),
+                "resolve_ms_max": round(max(resolve), 3) if resolve else None,
+                "matches_max": max(entry["matches"]) if entry["matches"] else None,
+                "css": None,
+                "flags": [],
+            }
+            if resolve and statistics.median(resolve) >= self.slow_ms:
+                row["flags"].append("slow")
+            if entry["ambiguous"] or (row["matches_max"] or 0) > self.max_matches:
+                row["flags"].append("too_many_matches")
+            if entry["css"] and entry["css_verified"] and not entry["css_mismatch"]:
+                row["css"] = entry["css"]
+                row["css_ms_median"] = _median(entry["css_ms"])
+                row["flags"].append("css_candidate")
+            rows.append(row)
+        return sorted(rows, key=lambda r: r["resolve_ms_median"] or 0, reverse=True)
+
+    def report(self):
+        if not self.stats:
+            return
+        rows = self.rows()
+        flagged = [r for r in rows if r["flags"]]
+        print("\n===== Locator profile: flagged locators (median in-page resolve) =====")
+        for row in flagged:
+            print(f"{row['resolve_ms_median'] or 0:8.3f}ms  {row['matches_max'] or 0:4d} max  "
+                  f"{row['uses']:4d} uses  {row['locator']} [{row['page']}]  {','.join(row['flags'])}")
+            if row["css"]:
+                print(f"{'':12}-> {row['css']}")
+        print(f"{len(flagged)} of {len(rows)} locators flagged")
+
+        path = os.path.join(os.getenv("TMIND_OUTPUT_DIR", os.getcwd()), "reports", "locator_profile.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(rows, f, indent=2)
+
+
+def _median(values):
+    return round(statistics.median(values), 3) if values else None
+
+
+locator_profiler = LocatorProfiler(os.getenv("LOCATOR_PROFILE") == "true")
@@ -1,6 +1,5 @@
 import os
 import unittest
-import time
 import allure
 from dotenv import load_dotenv
 from selenium.webdriver.support.ui import WebDriverWait
@@ -36,7 +35,7 @@ class LoginTests(Base):
         self.login.send_keys(LoginLocators.EMAIL_INPUT, "User21@gmail.com")
         self.login.send_keys(LoginLocators.PASSWORD_INPUT, "User@123")
         self.login.click(LoginLocators.LOGIN_BUTTON)
-        time.sleep(2)
+        self.login.wait_for_toast_appeared()
         try:
             assert self.login.is_visible(LoginLocators.TOAST_ERROR), "Error message not shown for invalid login"
         except AssertionError:
@@ -48,7 +47,6 @@ class LoginTests(Base):
     def test_Verify_error_for_empty_email(self):
         self.login.send_keys(LoginLocators.PASSWORD_INPUT, "Test@123")
         self.login.click(LoginLocators.LOGIN_BUTTON)
-        time.sleep(2)
         try:
             assert self.login.is_visible(LoginLocators.ERROR_MSG), \
                 "Validation not shown for empty email"
@@ -61,7 +59,6 @@ class LoginTests(Base):
     def test_Verify_error_for_empty_password(self):
         self.login.send_keys(LoginLocators.EMAIL_INPUT, "test@test.com")
         self.login.click(LoginLocators.LOGIN_BUTTON)
-        time.sleep(2)
         try:
             assert self.login.is_visible(LoginLocators.ERROR_MSG), \
                 "Validation not shown for empty password"
@@ -73,7 +70,6 @@ class LoginTests(Base):
     @allure.severity(allure.severity_level.NORMAL)
     def test_Verify_error_when_both_fields_empty(self):
         self.login.click(LoginLocators.LOGIN_BUTTON)
-        time.sleep(2)
         try:
             assert self.login.is_visible(LoginLocators.ERROR_MSG), \
                 "Validation not shown when both fields are empty"
@@ -87,7 +83,7 @@ class LoginTests(Base):
         self.login.send_keys(LoginLocators.EMAIL_INPUT, "test@test.com")
         self.login.send_keys(LoginLocators.PASSWORD_INPUT, "123")
         self.login.click(LoginLocators.LOGIN_BUTTON)
-        time.sleep(2)
+        self.login.wait_for_toast_appeared()
         try:
             assert self.login.is_visible(LoginLocators.TOAST_ERROR), "Short password validation failed"
         except AssertionError:
@@ -100,10 +96,9 @@ class LoginTests(Base):
         self.login.send_keys(LoginLocators.EMAIL_INPUT, os.environ.get("USER_EMAIL"))
         self.login.send_keys(LoginLocators.PASSWORD_INPUT, os.environ.get("PASSWORD"))
         self.login.click(LoginLocators.LOGIN_BUTTON)
-        time.sleep(5)
+        self.login.is_dashboard_displayed()
         self.login.click(LoginLocators.PROFILE_ICON)
         self.login.click(LoginLocators.LOGOUT_BUTTON)
-        time.sleep(2)
         try:
             assert self.login.is_visible(LoginLocators.LOGIN_BUTTON), "Logout failed"
         except AssertionError:
@@ -117,11 +112,16 @@ class LoginTests(Base):
         self.login.send_keys(LoginLocators.EMAIL_INPUT, os.environ.get("USER_EMAIL"))
         self.login.send_keys(LoginLocators.PASSWORD_INPUT, os.environ.get("PASSWORD"))
         self.login.click(LoginLocators.LOGIN_BUTTON)
-        time.sleep(5)
+        self.login.is_dashboard_displayed()
         self.login.click(LoginLocators.PROFILE_ICON)
+        dashboard_url = self.driver.current_url
         self.driver.back()
-        time.sleep(2)
+        # Logged in, the app sends /login straight back to the dashboard
+        back_on_dashboard = self.login.wait_until(
+            lambda d: d.current_url == dashboard_url
+            and d.execute_script("return document.readyState") == "complete")
         try:
+            assert back_on_dashboard, f"Browser back left the dashboard for {self.driver.current_url}"
             assert self.login.is_visible(LoginLocators.PROFILE_ICON), "User logged out after browser back"
         except AssertionError:
             self.attach_screenshot("_failure")
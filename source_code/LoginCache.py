@@ -0,0 +1,145 @@
+import os
+import json
+import time
+import hashlib
+from dotenv import load_dotenv
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from Page import LoginPage
+from locators import LoginLocators
+
+load_dotenv()
+
+COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+
+SEED_STORAGE_JS = """
+if (location.origin === %(origin)s) {
+    const local = %(local)s, session = %(session)s;
+    for (const k in local) localStorage.setItem(k, local[k]);
+    for (const k in session) sessionStorage.setItem(k, session[k]);
+}
+"""
+
+READ_STORAGE_JS = """
+const dump = (s) => { const o = {}; for (let i = 0; i < s.length; i++) { const k = s.key(i); o[k] = s.getItem(k); } return o; };
+return {origin: location.origin, local: dump(localStorage), session: dump(sessionStorage)};
+"""
+
+
+def cookie_param(cookie):
+    """Network.setCookies params for a Network.getAllCookies entry. Session cookies
+    report expires=-1; leaving it unset keeps them session cookies on restore."""
+    param = {k: cookie[k] for k in COOKIE_FIELDS if k in cookie}
+    if param.get("expires", -1) <= 0:
+        param.pop("expires", None)
+    return param
+
+
+class LoginCache:
+    """Logs in through the UI once per credential set and replays the saved session."""
+
+    def __init__(self, cache_dir=None, ttl=None):
+        self.cache_dir = cache_dir or os.path.join(os.getcwd(), ".login_cache")
+        self.ttl = int(ttl or os.getenv("LOGIN_CACHE_TTL", "1800"))
+        self.deep_link = os.getenv("LOGIN_DEEP_LINK", "/dashboard")
+        self.enabled = os.getenv("LOGIN_CACHE", "true") == "true"
+
+    def login(self, driver, email=None, password=None):
+        """Restore a cached session or fall back to a real login. Returns True on dashboard."""
+        email = email or os.environ.get("USER_EMAIL")
+        password = password or os.environ.get("PASSWORD")
+
+        if self.enabled:
+            state = self.load(email, password)
+            if state and self.restore(driver, state):
+                return True
+            self.invalidate(email, password)
+
+        login = LoginPage(driver)
+        login.enter_email(email)
+        login.enter_password(password)
+        login.click_login()
+        if not login.is_dashboard_displayed():
+            return False
+        if self.enabled:
+            self.save(driver, email, password)
+        return True
+
+    # ---------------- Storage on disk ----------------
+    def _path(self, email, password):
+        key = f"{os.environ.get('BASE_URL')}|{email}|{password}"
+        name = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{name}.json")
+
+    def load(self, email, password):
+        try:
+            with open(self._path(email, password)) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("expires_at", 0) <= time.time():
+            return None
+        return state
+
+    def save(self, driver, email, password):
+        storage = driver.execute_script(READ_STORAGE_JS)
+        cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        expires_at = time.time() + self.ttl
+        for cookie in cookies:
+            if cookie.get("expires", -1) > 0:
+                expires_at = min(expires_at, cookie["expires"])
+
+        state = {
+            "origin": storage["origin"],
+            "cookies": [cookie_param(c) for c in cookies],
+            "local": storage["local"],
+            "session": storage["session"],
+            "expires_at": expires_at,
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(email, password)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+
+    def invalidate(self, email, password):
+        try:
+            os.remove(self._path(email, password))
+        except OSError:
+            pass
+
+    # ---------------- Restore into a driver ----------------
+    def restore(self, driver, state, timeout=10):
+        """Inject cookies and storage, open the deep link and confirm the app accepted it."""
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": [cookie_param(c) for c in state["cookies"]]})
+        script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+            "source": SEED_STORAGE_JS % {
+                "origin": json.dumps(state["origin"]),
+                "local": json.dumps(state["local"]),
+                "session": json.dumps(state["session"]),
+            }})
+        try:
+            driver.get(state["origin"] + self.deep_link)
+            WebDriverWait(driver, timeout).until(EC.any_of(
+                EC.visibility_of_element_located(LoginLocators.PROFILE_ICON),
+                EC.visibility_of_element_located(LoginLocators.EMAIL_INPUT)))
+            accepted = (self.deep_link in driver.current_url
+                        and len(driver.find_elements(*LoginLocators.PROFILE_ICON)) > 0)
+        except Exception as e:
+            print(f"Cached login failed to load: {e}")
+            accepted = False
+        finally:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument",
+                                   {"identifier": script["identifier"]})
+        if not accepted:
+            print("Cached login rejected, falling back to UI login")
+            try:
+                driver.execute_script("localStorage.clear(); sessionStorage.clear();")
+            except Exception:
+                pass
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        return accepted
+
+
+login_cache = LoginCache()
@@ -3,7 +3,8 @@ import time
 import allure
 import unittest
 from Base import Base
-from Page import LoginPage, DevicePage, ManageUserPage
+from Page import DevicePage, ManageUserPage
+from LoginCache import login_cache
 from locators import ManageUserLocators
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -16,12 +17,7 @@ class ManageUserTests(Base):
     def setUpClass(cls):
         cls.driver = cls.start_driver()
 
-        login = LoginPage(cls.driver)
-        login.enter_email(os.environ.get("USER_EMAIL"))
-        login.enter_password(os.environ.get("PASSWORD"))
-        login.click_login()
-
-        assert login.is_dashboard_displayed(), "Login failed"
+        assert login_cache.login(cls.driver), "Login failed"
 
         cls.device = DevicePage(cls.driver)
         cls.manage_user = ManageUserPage(cls.driver)
@@ -32,6 +28,7 @@ class ManageUserTests(Base):
         self.driver = self.__class__.driver
         self.device = self.__class__.device
         self.manage_user = self.__class__.manage_user
+        self.manage_user.mark_toasts()
 
     # ------------------------------------------------
     # PAGE LOAD
@@ -57,14 +54,10 @@ class ManageUserTests(Base):
 
         try:
             self.manage_user.search_user(username)
-            rows = self.manage_user.get_all_user_rows()
-
-            assert len(rows) == 1
-            actual_username = rows[0].find_element(
-                By.XPATH, ManageUserLocators.USERNAME_CELL
-            ).text.strip()
+            users = self.manage_user.get_user_table()
 
-            assert actual_username == username
+            assert len(users) == 1
+            assert users[0]["username"] == username
         except AssertionError:
             self.attach_screenshot("search_existing_user_failure")
             raise
@@ -74,8 +67,7 @@ class ManageUserTests(Base):
     def test_03_search_non_existing_user(self):
         try:
             self.manage_user.search_user("random_user_123")
-            rows = self.manage_user.get_all_user_rows()
-            assert len(rows) == 0
+            assert self.manage_user.get_user_table() == []
         except AssertionError:
             self.attach_screenshot("search_non_existing_user_failure")
             raise
@@ -163,7 +155,9 @@ class ManageUserTests(Base):
     @allure.severity(allure.severity_level.NORMAL)
     def test_07_csv_download_toast(self):
         try:
-            self.manage_user.download_csv()
+            path = self.manage_user.download_csv()
+            assert os.path.basename(path).startswith("users") and os.path.getsize(path) > 0, \
+                f"Unexpected download {path}"
             self.device.verify_toast_success("CSV downloaded successfully!")
         except AssertionError:
             self.attach_screenshot("csv_download_failure")
@@ -219,13 +213,12 @@ class ManageUserTests(Base):
 
         try:
             self.manage_user.search_user(query)
-            rows = self.manage_user.get_all_user_rows()
+            usernames = self.manage_user.get_all_usernames()
 
-            assert len(rows) > 0
+            assert len(usernames) > 0
 
-            for row in rows:
-                username = row.find_element(By.XPATH, ManageUserLocators.USERNAME_CELL).text.lower()
-                assert query in username
+            for username in usernames:
+                assert query in username.lower()
         except AssertionError:
             self.attach_screenshot("search_filter_failure")
             raise
@@ -0,0 +1,93 @@
+import os
+import json
+import time
+from collections import deque
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+TRACKED_TYPES = ("XHR", "Fetch")
+
+
+class NetworkMonitor:
+    """Follows CDP Network events through chromedriver's performance log.
+
+    Chrome only writes that log when the driver was started with
+    goog:loggingPrefs, which Base.chrome_options adds when NETWORK_MONITOR=true.
+    """
+    enabled = os.getenv("NETWORK_MONITOR") == "true"
+
+    def __init__(self, driver, history=200):
+        self.driver = driver
+        self.requests = {}
+        self.completed = deque(maxlen=history)
+        self.last_activity = time.monotonic()
+
+    @classmethod
+    def for_driver(cls, driver):
+        monitor = getattr(driver, "network_monitor", None)
+        if monitor is None:
+            monitor = cls(driver)
+            driver.network_monitor = monitor
+        return monitor
+
+    @staticmethod
+    def logging_prefs():
+        return {"performance": "ALL"}
+
+    # ---------------- Event intake ----------------
+    def poll(self):
+        """Drain the performance log and update request state. One WebDriver call."""
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            self._handle(message["method"], message.get("params", {}))
+
+    def _handle(self, method, params):
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            request = params["request"]
+            self.requests[request_id] = {
+                "url": request["url"],
+                "method": request["method"],
+                "type": params.get("type"),
+                "started": params["timestamp"],
+                "wall_time": params.get("wallTime"),
+                "status": None,
+            }
+            self.last_activity = time.monotonic()
+        elif method == "Network.responseReceived" and request_id in self.requests:
+            self.requests[request_id]["status"] = params["response"]["status"]
+        elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+            request = self.requests.pop(request_id, None)
+            if request is None:
+                return
+            request["duration_ms"] = round((params["timestamp"] - request["started"]) * 1000, 1)
+            if method == "Network.loadingFailed":
+                request["error"] = params.get("errorText")
+            self.completed.append(request)
+            self.last_activity = time.monotonic()
+
+    # ---------------- Queries ----------------
+    def in_flight(self):
+        return [r for r in self.requests.values() if r["type"] in TRACKED_TYPES]
+
+    def is_idle(self, quiet_ms, since=None):
+        self.poll()
+        quiet_from = max(self.last_activity, since or 0)
+        return not self.in_flight() and (time.monotonic() - quiet_from) * 1000 >= quiet_ms
+
+    def wait_idle(self, quiet_ms=500, timeout=10, since=None):
+        """True once no fetch/XHR has been in flight for quiet_ms (counted from since, if later)."""
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                lambda d: self.is_idle(quiet_ms, since))
+        except TimeoutException:
+            return False
+
+    def recent(self, count=50):
+        return list(self.completed)[-count:]
+
+    def reset(self):
+        self.poll()
+        self.requests.clear()
+        self.completed.clear()
+        self.last_activity = time.monotonic()
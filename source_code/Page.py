@@ -8,15 +8,91 @@ import unittest
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import (TimeoutException, WebDriverException, StaleElementReferenceException,
+                                        NoSuchElementException)
+from DomObserver import DomObserver
+from NetworkMonitor import NetworkMonitor
+from ToastRecorder import ToastRecorder
+from DownloadTracker import DownloadTracker
+from PerfMetrics import measured_navigation
+from PerfBudget import perf_budgets
 
 class BasePage:
     """Reusable methods for all pages"""
+    # Load runs open hundreds of pages and turn the progress prints off
+    verbose = True
+
     def __init__(self, driver, timeout=10):
         self.driver = driver
+        self.timeout = timeout
         self.wait = WebDriverWait(driver, timeout)
+        self.observer = DomObserver(driver)
+        self.toasts = ToastRecorder.for_driver(driver)
+        self.last_action = 0
+
+    # ---------------- In-page waits ----------------
+    FALLBACK_CONDITIONS = {
+        "visible": lambda locator, arg: EC.visibility_of_element_located(locator),
+        "clickable": lambda locator, arg: EC.element_to_be_clickable(locator),
+        "text": lambda locator, arg: EC.text_to_be_present_in_element(locator, arg),
+        "gone": lambda locator, arg: EC.invisibility_of_element_located(locator),
+        "count_gt": lambda locator, arg: lambda d: len(d.find_elements(*locator)) > arg,
+    }
+
+    def wait_for(self, locator, condition="visible", timeout=None, arg=None):
+        """Wait in the page for condition on locator; WebDriverWait is the fallback
+        when the observer is disabled or a navigation drops the async script."""
+        timeout = self.timeout if timeout is None else timeout
+        if DomObserver.enabled:
+            started = time.monotonic()
+            try:
+                return self.observer.wait([locator], condition, timeout, arg)[1]
+            except TimeoutException:
+                raise
+            except WebDriverException:
+                timeout = max(timeout - (time.monotonic() - started), 0.5)
+        result = WebDriverWait(self.driver, timeout).until(
+            self.FALLBACK_CONDITIONS[condition](locator, arg))
+        if condition == "text":
+            return self.driver.find_element(*locator)
+        return result
+
+    def wait_for_any(self, locators, timeout=None, condition="visible"):
+        """Check all locators in one browser call; return (index, element) of the
+        first that meets condition, or (None, None). timeout=0 checks once."""
+        timeout = self.timeout if timeout is None else timeout
+        if DomObserver.enabled:
+            try:
+                return self.observer.wait(locators, condition, timeout)
+            except TimeoutException:
+                return None, None
+            except WebDriverException:
+                pass
+
+        def first_match(driver):
+            for index, locator in enumerate(locators):
+                try:
+                    element = self.FALLBACK_CONDITIONS[condition](locator, None)(driver)
+                except (NoSuchElementException, StaleElementReferenceException):
+                    # Absent or re-rendered; the later locators still get their check
+                    continue
+                if element:
+                    return index, element
+            return False
+
+        try:
+            return WebDriverWait(self.driver, timeout).until(first_match)
+        except TimeoutException:
+            return None, None
 
     def click(self, locator):
-        self.wait.until(EC.element_to_be_clickable(locator)).click()
+        try:
+            element = self.wait_for(locator, "clickable")
+            self.last_action = time.monotonic()
+            element.click()
+        except StaleElementReferenceException:
+            # Re-rendered between the wait and the click
+            self.wait_for(locator, "clickable").click()
 
     def send_keys(self, locator, text):
         elem = self.wait.until(EC.visibility_of_element_located(locator))
@@ -37,16 +113,37 @@ class BasePage:
         search.send_keys(Keys.BACKSPACE)
 
     def get_element(self, locator):
-        return self.wait.until(EC.visibility_of_element_located(locator))
+        return self.wait_for(locator, "visible")
     
     def is_visible(self, locator, timeout=10):
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator))
+            self.wait_for(locator, "visible", timeout)
             return True
         except:
             return False    
 
+    def is_absent(self, locator, quiet_ms=300, timeout=None):
+        """Let the page settle, then check once that nothing visible matches locator.
+
+        Settled means no fetch/XHR since the last click (NETWORK_MONITOR=true) and
+        no DOM mutation for quiet_ms, so a passing negative check costs about
+        quiet_ms instead of the whole timeout.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        if NetworkMonitor.enabled:
+            self.wait_for_network_idle(quiet_ms, timeout)
+        if DomObserver.enabled:
+            try:
+                return self.observer.settled_absent([locator], quiet_ms, timeout)
+            except WebDriverException:
+                pass
+        self.wait_for_page_ready(timeout)
+        return not any(e.is_displayed() for e in self.driver.find_elements(*locator))
+
+    def assert_absent(self, locator, message=None, quiet_ms=300, timeout=None):
+        if not self.is_absent(locator, quiet_ms, timeout):
+            raise AssertionError(message or f"Expected {locator} to be absent")
+
     def get_attr(self, locator, attribute):
         return self.get_element(locator).get_attribute(attribute)
 
@@ -65,28 +162,38 @@ class BasePage:
             return None
 
     def wait_for_toast_to_disappear(self, timeout=10):
-        """Wait for toast to appear (if any) and disappear."""
-        try:
-            WebDriverWait(self.driver, timeout/2).until(
-                EC.visibility_of_element_located((By.CLASS_NAME, "Toastify__toast")))
-        except:
-            pass
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.invisibility_of_element_located((By.CLASS_NAME, "Toastify__toast")))
-        except:
-            pass
+        """Wait until no toast is on screen; returns at once when none is."""
+        return self.toasts.wait_until_none_live(timeout)
 
     def verify_toast_error(self, locator, expected_text):
-        toast = self.wait.until(
-            EC.visibility_of_element_located(locator))
-        assert expected_text in toast.text, f"Expected '{expected_text}', got '{toast.text}'"
+        try:
+            self.wait_for(locator, "text", arg=expected_text)
+        except TimeoutException:
+            toasts = self.driver.find_elements(*locator)
+            actual = toasts[0].text if toasts else None
+            raise AssertionError(f"Expected '{expected_text}', got '{actual}'")
 
     def wait_for_toast_disappear(self):
-        try:
-            WebDriverWait(self.driver, 5).until(EC.invisibility_of_element_located(SignUpLocators.TOAST_ERROR))
-        except:
-            pass
+        return self.toasts.wait_until_none_live(5)
+
+    # ---------------- Toast history ----------------
+    def mark_toasts(self):
+        """Start a new window: later toast assertions ignore everything shown before."""
+        return self.toasts.mark()
+
+    def toast_history(self, after=None):
+        return self.toasts.history(after)
+
+    def has_toast(self, toast_type=None, contains=None, timeout=None):
+        return self.toasts.wait_for(toast_type, contains, timeout=timeout or self.timeout) is not None
+
+    def assert_toast(self, toast_type, contains=None, after=None, timeout=None):
+        """Recorded toast of toast_type ("success", "error", ...) containing text, shown after the mark."""
+        entry = self.toasts.wait_for(toast_type, contains, after, timeout or self.timeout)
+        if entry is None:
+            seen = [(t["type"], t["text"]) for t in self.toasts.history(after or self.toasts.consumed)]
+            raise AssertionError(f"No {toast_type} toast containing '{contains}'; toasts since mark: {seen}")
+        return entry
 
 
     # def verify_inline_error(self, locator):
@@ -122,8 +229,103 @@ class BasePage:
         search.send_keys(term)
 
     # Wait until at least one matching asset appears
-        WebDriverWait(self.driver, 5).until(
-            lambda d: len(d.find_elements(*AssetLocators.ASSET_NAME_NODE(term))) > 0)
+        with perf_budgets.measure(self, "search_asset:results"):
+            self.wait_for(AssetLocators.ASSET_NAME_NODE(term), "count_gt", timeout=5, arg=0)
+
+    # ---------------- Wait conditions ----------------
+    # Named replacements for fixed sleeps. They return False on timeout instead
+    # of raising, so the assertion that follows still decides the test.
+    def wait_until(self, condition, timeout=None):
+        try:
+            return WebDriverWait(self.driver, self.timeout if timeout is None else timeout).until(condition)
+        except TimeoutException:
+            return False
+
+    def wait_for_page_ready(self, timeout=None):
+        """Document finished loading."""
+        return self.wait_until(
+            lambda d: d.execute_script("return document.readyState") == "complete", timeout)
+
+    def wait_for_toast_appeared(self, timeout=None):
+        """Any toast (success or error) is on screen."""
+        return self.wait_until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, ".Toastify__toast")), timeout)
+
+    def download(self, locator, timeout=None):
+        """Click locator and return the path of the file it downloads, as soon as Chrome finishes it."""
+        downloads = DownloadTracker.for_driver(self.driver)
+        downloads.start()
+        mark = downloads.mark()
+        self.click(locator)
+        return downloads.wait_for_download(mark, self.timeout if timeout is None else timeout)
+
+    def wait_for_network_idle(self, quiet_ms=500, timeout=None):
+        """No fetch/XHR in flight for quiet_ms since the last click (NETWORK_MONITOR=true).
+        Without the monitor this only waits for the document to be ready."""
+        if not NetworkMonitor.enabled:
+            return self.wait_for_page_ready(timeout)
+        return NetworkMonitor.for_driver(self.driver).wait_idle(
+            quiet_ms, self.timeout if timeout is None else timeout, since=self.last_action)
+
+    def click_and_wait_idle(self, locator, quiet_ms=300, timeout=None):
+        """Click and return once the requests it triggered have completed."""
+        if NetworkMonitor.enabled:
+            NetworkMonitor.for_driver(self.driver).poll()
+        self.click(locator)
+        return self.wait_for_network_idle(quiet_ms, timeout)
+
+    def wait_for_save_finished(self, form_locator, timeout=None):
+        """Save request finished: the network went idle after the click, or,
+        without the monitor, a toast appeared or the form was closed."""
+        if NetworkMonitor.enabled:
+            return self.wait_for_network_idle(300, timeout)
+        return self.wait_until(EC.any_of(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, ".Toastify__toast")),
+            EC.invisibility_of_element_located(form_locator)), timeout)
+
+    def wait_for_form_feedback(self, error_locator=SignUpLocators.ERROR_MESSAGES, timeout=None):
+        """Form answered a submit: inline error, toast, or native validation."""
+        index, _ = self.wait_for_any([
+            error_locator,
+            (By.CSS_SELECTOR, ".Toastify__toast"),
+            (By.CSS_SELECTOR, "form :invalid")], timeout)
+        return index is not None
+
+    def wait_for_toast_outcome(self, timeout=None):
+        """First toast since the last asserted one, whichever type the app shows first,
+        or None after timeout. It is not consumed, so assert_toast still finds it."""
+        return self.toasts.wait_for(None, None, None, timeout or self.timeout, consume=False)
+
+    def assert_toast_outcome(self, toast_type, contains=None, timeout=None):
+        """Like assert_toast, but a save answered with the other toast fails at once
+        instead of after the whole timeout."""
+        first = self.wait_for_toast_outcome(timeout)
+        if first is None:
+            raise AssertionError(f"No toast shown; expected {toast_type} containing '{contains}'")
+        if first["type"] != toast_type and first["type"] in ("success", "error"):
+            raise AssertionError(f"Expected {toast_type} toast containing '{contains}', "
+                                 f"got {first['type']}: '{first['text']}'")
+        return self.assert_toast(toast_type, contains, timeout=timeout)
+
+    def table_snapshot(self, rows_locator):
+        """First row and row count, taken before an action that re-renders the table."""
+        rows = self.driver.find_elements(*rows_locator)
+        return rows[0] if rows else None, len(rows)
+
+    def wait_for_table_rerendered(self, rows_locator, snapshot, timeout=None):
+        """Table re-rendered since snapshot: old first row detached or row count changed."""
+        first_row, count = snapshot
+        def rerendered(d):
+            if first_row is not None and EC.staleness_of(first_row)(d):
+                return True
+            return len(d.find_elements(*rows_locator)) != count
+        return self.wait_until(rerendered, timeout)
+
+    def wait_for_option_selected(self, select_locator, text, timeout=None):
+        """Dropdown shows the given option as selected."""
+        return self.wait_until(
+            lambda d: Select(d.find_element(*select_locator)).first_selected_option.text.strip() == text,
+            timeout)
 
 # ------------------------- LOGIN PAGE -------------------------
 class LoginPage(BasePage):
@@ -132,7 +334,8 @@ class LoginPage(BasePage):
         url = os.environ.get("BASE_URL")  # Load URL from .env
         self.driver.get(url)
     
-        print("OPENING URL:", url)
+        if self.verbose:
+            print("OPENING URL:", url)
         self.username = os.environ.get("USER_EMAIL")
         self.password = os.environ.get("PASSWORD")
 
@@ -196,6 +399,11 @@ class AssetPage(BasePage):
     def __init__(self, driver):
         super().__init__(driver)
 
+    @measured_navigation("Assets")
+    def open_assets_page(self):
+        self.click(AssetLocators.ASSETS_MENU)
+        return self.is_visible(AssetLocators.ADD_ROOT_BTN)
+
     def select_asset(self, name): 
         self.click(AssetLocators.ASSET_NAME_NODE(name))
 
@@ -266,54 +474,39 @@ class DevicePage(BasePage):
         super().__init__(driver)
     
     # ---------------- Navigation ----------------
+    @measured_navigation("Devices")
     def go_to_devices(self):
         self.wait.until(EC.element_to_be_clickable(DeviceLocators.SIDE_PANEL_DEVICES)).click()
         self.wait.until(EC.visibility_of_element_located(DeviceLocators.ADD_DEVICE_BUTTON))
    
     def close_any_device_modal_if_open(self):
+        """Close whichever device modal or page is open; one check when none is."""
+        exits = [
+            DeviceLocators.CANCEL_DEVICE_BUTTON,   # Add Device modal
+            DeviceLocators.BACK_TO_DEVICES,        # Edit Device modal
+            DeviceLocators.BACK_CONFIG,            # Config page
+        ]
         try:
-        # 1️⃣ Add Device modal
-            if self.is_visible(DeviceLocators.CANCEL_DEVICE_BUTTON, timeout=2):
-                self.click(DeviceLocators.CANCEL_DEVICE_BUTTON)
-                self.wait.until(
-                    EC.invisibility_of_element_located(
-                        DeviceLocators.CANCEL_DEVICE_BUTTON
-                )
-            )
-
-        # 2️⃣ Edit Device modal
-            elif self.is_visible(DeviceLocators.BACK_TO_DEVICES, timeout=2):
-                self.click(DeviceLocators.BACK_TO_DEVICES)
-                self.wait.until(
-                    EC.invisibility_of_element_located(
-                    DeviceLocators.BACK_TO_DEVICES
-                )
-            )
-
-        # 3️⃣ Config page
-            elif self.is_visible(DeviceLocators.BACK_CONFIG, timeout=2):
-                self.click(DeviceLocators.BACK_CONFIG)
-                self.wait.until(
-                    EC.invisibility_of_element_located(
-                        DeviceLocators.BACK_CONFIG
-                )
-            )
+            index, _ = self.wait_for_any(exits, timeout=0)
+            if index is not None:
+                self.click(exits[index])
+                self.wait_for(exits[index], "gone")
         except Exception:
             pass  # Safe state → nothing open
 
 
     # ---------------- Toast Verifications ----------------
     def verify_toast_success(self, expected_text):
-        self.wait.until(EC.text_to_be_present_in_element(SignUpLocators.TOAST_SUCCESS, expected_text))
-        toast = self.driver.find_element(*SignUpLocators.TOAST_SUCCESS)
-        print("SUCCESS TOAST:", toast.text.strip())
-        self.wait.until(EC.invisibility_of_element_located(SignUpLocators.TOAST_SUCCESS))
+        toast = self.assert_toast_outcome("success", expected_text)
+        print("SUCCESS TOAST:", toast["text"])
 
     def verify_toast_error(self, expected_text):
-        toast = self.wait.until(EC.visibility_of_element_located(SignUpLocators.TOAST_ERROR))
-        actual = toast.text.strip()
-        print("ERROR TOAST:", actual)
-        assert expected_text in actual
+        try:
+            toast = self.assert_toast_outcome("error", expected_text)
+        except AssertionError:
+            print("ERROR TOAST:", [t["text"] for t in self.toast_history(self.toasts.consumed)])
+            raise
+        print("ERROR TOAST:", toast["text"])
 
     def get_hidden_element(self, locator):
         return self.driver.find_element(*locator)
@@ -331,6 +524,9 @@ class DevicePage(BasePage):
         except:
             return False
 
+    def is_device_absent_from_table(self, name):
+        return self.is_absent(DeviceLocators.DEVICE_IN_TABLE(name))
+
     def verify_register_row_visible(self, address):
         """Verify register appears in table after popup save."""
         row = (By.XPATH, f"//td[normalize-space()='{address}']")
@@ -345,6 +541,7 @@ class ManageUserPage(BasePage):
         super().__init__(driver)
 
     # ---------------- Navigation ----------------
+    @measured_navigation("Manage User")
     def go_to_manage_user(self):
         self.click(ManageUserLocators.SIDE_PANEL_MANAGE_USER)
         self.wait.until(EC.visibility_of_element_located(ManageUserLocators.PAGE_HEADER))
@@ -374,20 +571,49 @@ class ManageUserPage(BasePage):
         search.send_keys(Keys.BACKSPACE)
 
     # ---------------- Table Rows ----------------
+    # One execute_script reads the whole table; element handles are only
+    # serialised for the rows a caller is going to act on.
+    USER_TABLE_JS = r"""
+    const [rowsXpath, handles] = arguments;
+    const found = document.evaluate(rowsXpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const out = [];
+    for (let i = 0; i < found.snapshotLength; i++) {
+        const tr = found.snapshotItem(i);
+        const cells = tr.querySelectorAll(':scope > td');
+        if (cells.length < 4 || tr.innerText.includes('No users found')) continue;
+        const select = cells[2].querySelector('select');
+        const remove = Array.from(cells[3].querySelectorAll('button')).find(b => b.innerText.includes('Delete'));
+        const row = {
+            username: cells[0].innerText.trim(),
+            email: cells[1].innerText.trim(),
+            role: select && select.selectedIndex >= 0 ? select.options[select.selectedIndex].text.trim() : cells[2].innerText.trim(),
+            can_delete: !!remove && !remove.disabled,
+        };
+        if (handles === true || (handles || []).includes(row.username)) row.row = tr;
+        out.push(row);
+    }
+    return out;
+    """
+
+    def get_user_table(self, handles=()):
+        """All user rows as dicts (username, email, role, can_delete) in one call.
+
+        handles: usernames whose row element is needed for an action, or True
+        for every row; those rows also carry the element under "row".
+        """
+        return self.driver.execute_script(
+            self.USER_TABLE_JS, ManageUserLocators.USER_TABLE_ROWS[1],
+            handles if handles is True else list(handles))
+
     def get_all_user_rows(self):
         """Return all row elements in the user table, ignoring 'No users found' row."""
-        rows = self.driver.find_elements(*ManageUserLocators.USER_TABLE_ROWS)
-        # filter out the "No users found" row
-        filtered = [row for row in rows if "No users found" not in row.text]
-        return filtered
+        return [user["row"] for user in self.get_user_table(handles=True)]
 
     def get_user_row_by_username(self, username):
         """Return the row element for a given username"""
-        rows = self.get_all_user_rows()
-        for row in rows:
-            uname = row.find_element(By.XPATH, ManageUserLocators.USERNAME_CELL).text.strip()
-            if uname == username:
-                return row
+        for user in self.get_user_table(handles=[username]):
+            if user["username"] == username:
+                return user["row"]
         return None
 
     # ---------------- Delete User ----------------
@@ -419,29 +645,29 @@ class ManageUserPage(BasePage):
 
     # ---------------- CSV Download ----------------
     def download_csv(self):
-        """Click Download CSV button"""
-        self.click(ManageUserLocators.DOWNLOAD_CSV_BUTTON)
-        # Optional: wait for download toast if implemented
-        time.sleep(1)
+        """Click Download CSV button; returns the downloaded file's path"""
+        path = self.download(ManageUserLocators.DOWNLOAD_CSV_BUTTON)
+        self.wait_for_toast_appeared(timeout=5)
+        return path
 
     # ---------------- Verifications ----------------
     def is_user_in_table(self, username):
         """Check if user exists in table"""
-        return self.get_user_row_by_username(username) is not None
+        return username in self.get_all_usernames()
 
     def get_all_usernames(self):
         """Return a list of all usernames visible in table"""
-        rows = self.get_all_user_rows()
-        return [row.find_element(By.XPATH, ManageUserLocators.USERNAME_CELL).text.strip() for row in rows]
+        return [user["username"] for user in self.get_user_table()]
 
 
 # ---------------- Pagination ----------------
     def click_previous_page(self):
         try:
             btn = self.get_element(ManageUserLocators.PREVIOUS_PAGE_BUTTON)
+            snapshot = self.table_snapshot(ManageUserLocators.USER_TABLE_ROWS)
             self.driver.execute_script("arguments[0].scrollIntoView(true);", btn)
             self.driver.execute_script("arguments[0].click();", btn)
-            time.sleep(1)  # optional wait for page refresh
+            self.wait_for_table_rerendered(ManageUserLocators.USER_TABLE_ROWS, snapshot)
         except:
             raise Exception("Previous page button not found or disabled")
 
@@ -449,9 +675,10 @@ class ManageUserPage(BasePage):
         """Click the 'Next' pagination button"""
         try:
             btn = self.get_element(ManageUserLocators.NEXT_PAGE_BUTTON)
+            snapshot = self.table_snapshot(ManageUserLocators.USER_TABLE_ROWS)
             self.driver.execute_script("arguments[0].scrollIntoView(true);", btn)
             self.driver.execute_script("arguments[0].click();", btn)
-            time.sleep(1)  # optional wait for page refresh
+            self.wait_for_table_rerendered(ManageUserLocators.USER_TABLE_ROWS, snapshot)
         except:
             raise Exception("Next page button not found or disabled")
 
@@ -464,9 +691,12 @@ class ManageUserPage(BasePage):
         page_locator = (By.XPATH, f"//ul[@class='flex flex-row items-center gap-1']//a[text()='{page_num}']")
         try:
             btn = self.wait.until(EC.element_to_be_clickable(page_locator))
+            already_current = btn.get_attribute("aria-current") == "page"
+            snapshot = self.table_snapshot(ManageUserLocators.USER_TABLE_ROWS)
             self.driver.execute_script("arguments[0].scrollIntoView(true);", btn)
             self.driver.execute_script("arguments[0].click();", btn)
-            time.sleep(1)  # optional wait for page refresh
+            if not already_current:
+                self.wait_for_table_rerendered(ManageUserLocators.USER_TABLE_ROWS, snapshot)
         except:
             raise Exception(f"Page number {page_num} not found in pagination")
 
@@ -482,6 +712,7 @@ class ManageUserPage(BasePage):
 class SignalPage(BasePage):
 
 
+    @measured_navigation("Signals")
     def open_signal_page(self):
         signal_menu = self.wait.until(
             EC.element_to_be_clickable(SignalLocators.SIGNAL_MENU))
@@ -495,12 +726,12 @@ class SignalPage(BasePage):
         dropdown_element = self.get_element(SignalLocators.MAIN_ASSET_DROPDOWN)
         dropdown = Select(dropdown_element)
         dropdown.select_by_visible_text(asset_name)
-        time.sleep(1)  # allow graph & signals to refresh
+        self.wait_for_option_selected(SignalLocators.MAIN_ASSET_DROPDOWN, asset_name)
 
     def select_compare_asset(self, asset_name):
         dropdown = Select(self.get_element(SignalLocators.COMPARE_ASSET_DROPDOWN))
         dropdown.select_by_visible_text(asset_name)
-        time.sleep(1)
+        self.wait_for_option_selected(SignalLocators.COMPARE_ASSET_DROPDOWN, asset_name)
 
 
     # ---------------- Getters ----------------
@@ -550,9 +781,15 @@ class TourPage(BasePage):
 
     # ---------------- Tour Actions ----------------
     def start_tour(self):
-    # IMPORTANT: wait for login success toast to go away
+    # IMPORTANT: wait for login success toast to show, then to go away. The recorder
+    # keeps toasts already gone, so a login toast seen earlier returns at once.
+        self.toasts.wait_for(None, None, None, self.timeout / 2, consume=False)
         self.wait_for_toast_to_disappear()
+        self.open_tour()
 
+    @measured_navigation("Tour")
+    def open_tour(self):
+        """Click Start Tour and wait for the first popover."""
         start_btn = self.wait.until(
             EC.element_to_be_clickable(TourLocators.START_TOUR_BTN))
         start_btn.click()
@@ -612,3 +849,7 @@ class TourPage(BasePage):
             except:
                 break
         self.close_tour()
+
+
+# Budgets from perf_budgets.json wrap the page-object methods they name
+perf_budgets.apply(globals())
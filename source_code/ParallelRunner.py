@@ -0,0 +1,253 @@
+import io
+import os
+import sys
+import time
+import argparse
+import importlib
+import unittest
+import multiprocessing
+from multiprocessing import util
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from xml.etree import ElementTree as ET
+
+BROWSER_MEMORY_MB = int(os.getenv("BROWSER_MEMORY_MB", "500"))
+
+_worker_id = None
+
+
+class TimedTestResult(unittest.TextTestResult):
+    """TextTestResult that also keeps a plain record of every test outcome."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.records = []
+        self._started = {}
+
+    def startTest(self, test):
+        self._started[test.id()] = time.perf_counter()
+        super().startTest(test)
+
+    def _record(self, test, status, err=None):
+        started = self._started.pop(test.id(), None)
+        self.records.append({
+            "id": test.id(),
+            "status": status,
+            "duration": time.perf_counter() - started if started else 0.0,
+            "message": self._exc_info_to_string(err, test) if err else "",
+            "worker": _worker_id,
+            "phases": dict(getattr(test, "phase_timings", {})),
+        })
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self._record(test, "passed")
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._record(test, "failed", err)
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self._record(test, "error", err)
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._record(test, "skipped")
+        self.records[-1]["message"] = reason
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self._record(test, "passed")
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self._record(test, "failed")
+
+
+# ---------------- Worker sizing ----------------
+def available_memory_mb():
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return None
+
+
+def default_workers(class_count):
+    """Workers limited by CPU count, by free memory per worker's browsers, and by class count."""
+    if os.getenv("PARALLEL_WORKERS"):
+        return max(1, int(os.getenv("PARALLEL_WORKERS")))
+    cpu = os.cpu_count() or 1
+    browsers_per_worker = int(os.getenv("BROWSER_POOL_SIZE", "1")) + 1
+    memory = available_memory_mb()
+    by_memory = memory // (BROWSER_MEMORY_MB * browsers_per_worker) if memory else cpu
+    return max(1, min(cpu, by_memory, class_count))
+
+
+# ---------------- Worker process ----------------
+def _init_worker(worker_ids, output_root):
+    global _worker_id
+    _worker_id = worker_ids.get()
+    worker_dir = os.path.join(output_root, f"worker_{_worker_id}")
+    os.makedirs(worker_dir, exist_ok=True)
+    os.environ["WORKER_ID"] = str(_worker_id)
+    os.environ["TMIND_OUTPUT_DIR"] = worker_dir
+    os.environ.setdefault("BROWSER_POOL_SIZE", "1")
+    # Every worker serves its own stand-in; a fixed port would fit only one of them
+    os.environ["STAND_IN_PORT"] = "0"
+    # Only the parent prunes the shared artifact store
+    os.environ["ARTIFACT_PRUNE_INTERVAL"] = "0"
+    # Pool workers leave through os._exit, so atexit hooks never fire there
+    util.Finalize(None, _shutdown_worker, exitpriority=10)
+
+
+def _shutdown_worker():
+    # Base is imported by the first test class this worker ran
+    base = sys.modules.get("Base")
+    if base is not None:
+        base.Base.shutdown()
+
+
+def run_class(module_name, class_name):
+    """Run one test class in order inside this worker and return its records."""
+    test_class = getattr(importlib.import_module(module_name), class_name)
+    stream = io.StringIO()
+    runner = unittest.TextTestRunner(stream=stream, verbosity=2, resultclass=TimedTestResult)
+    started = time.perf_counter()
+    result = runner.run(unittest.defaultTestLoader.loadTestsFromTestCase(test_class))
+    return {
+        "class": f"{module_name}.{class_name}",
+        "worker": _worker_id,
+        "duration": time.perf_counter() - started,
+        "output": stream.getvalue(),
+        "records": result.records,
+    }
+
+
+# ---------------- Parent process ----------------
+def run_parallel(test_classes, workers=None, output_root=None):
+    """Shard test classes across worker processes; tests inside a class keep their order."""
+    output_root = output_root or os.path.join(os.getcwd(), "workers")
+    workers = workers or default_workers(len(test_classes))
+    # Biggest classes first so the long ones do not start last
+    test_classes = sorted(
+        test_classes,
+        key=lambda c: unittest.defaultTestLoader.loadTestsFromTestCase(c).countTestCases(),
+        reverse=True)
+
+    context = multiprocessing.get_context("spawn")
+    worker_ids = context.Queue()
+    for i in range(workers):
+        worker_ids.put(i + 1)
+
+    print(f"Running {len(test_classes)} classes on {workers} workers")
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker,
+                             initargs=(worker_ids, output_root)) as executor:
+        futures = {executor.submit(run_class, c.__module__, c.__name__): c
+                   for c in test_classes}
+        for future in as_completed(futures):
+            test_class = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as e:
+                outcome = {
+                    "class": f"{test_class.__module__}.{test_class.__name__}",
+                    "worker": None, "duration": 0.0, "output": "",
+                    "records": [{"id": f"{test_class.__module__}.{test_class.__name__}",
+                                 "status": "error", "duration": 0.0, "message": repr(e),
+                                 "worker": None, "phases": {}}],
+                }
+            print(f"[worker {outcome['worker']}] {outcome['class']} "
+                  f"finished in {outcome['duration']:.1f}s")
+            results.append(outcome)
+    return results
+
+
+def write_junit(results, path):
+    """Merge every worker's records into one JUnit XML report."""
+    records = [r for outcome in results for r in outcome["records"]]
+    suite = ET.Element("testsuite", {
+        "name": "TMind",
+        "tests": str(len(records)),
+        "failures": str(sum(r["status"] == "failed" for r in records)),
+        "errors": str(sum(r["status"] == "error" for r in records)),
+        "skipped": str(sum(r["status"] == "skipped" for r in records)),
+        "time": f"{sum(r['duration'] for r in records):.3f}",
+    })
+    for r in records:
+        if r["id"].endswith(")") and " (" in r["id"]:
+            # Class fixture errors look like "setUpClass (Device.DevicesTests)"
+            name, _, class_name = r["id"][:-1].partition(" (")
+        else:
+            class_name, _, name = r["id"].rpartition(".")
+        case = ET.SubElement(suite, "testcase", {
+            "classname": class_name, "name": name, "time": f"{r['duration']:.3f}"})
+        if r["status"] in ("failed", "error", "skipped"):
+            tag = {"failed": "failure", "error": "error", "skipped": "skipped"}[r["status"]]
+            ET.SubElement(case, tag, {"message": r["message"].strip().splitlines()[-1]
+                                      if r["message"].strip() else ""}).text = r["message"]
+        ET.SubElement(case, "system-out").text = f"worker={r['worker']}"
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    ET.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def main(argv=None):
+    from RunTest import TEST_CLASSES
+
+    parser = argparse.ArgumentParser(description="Run TMind test classes in parallel")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--junit", default=os.path.join("reports", "parallel_report.xml"))
+    parser.add_argument("--classes", default="",
+                        help="Comma separated class names, e.g. LoginTests,DevicesTests")
+    args = parser.parse_args(argv)
+
+    test_classes = TEST_CLASSES
+    if args.classes:
+        wanted = set(args.classes.split(","))
+        test_classes = [c for c in TEST_CLASSES if c.__name__ in wanted]
+
+    # Workers inherit the environment, so they all write to the same history run and file
+    from RunHistory import new_run_id, run_history
+    os.environ.setdefault("RUN_ID", new_run_id())
+    os.environ.setdefault("RUN_HISTORY_DB", run_history.path)
+
+    # SWEEP=true: remove leftovers of earlier runs first, and this run's data after.
+    # Stand-in data lives and dies with each worker's server, so there is nothing to sweep.
+    sweep = os.getenv("SWEEP") == "true" and os.getenv("STAND_IN") != "true"
+    if sweep:
+        import Sweeper
+        Sweeper.run("pre")
+
+    started = time.perf_counter()
+    results = run_parallel(test_classes, workers=args.workers)
+    elapsed = time.perf_counter() - started
+
+    if sweep:
+        Sweeper.run("post")
+
+    from ArtifactStore import artifact_store
+    removed, freed = artifact_store.prune()
+    if removed:
+        print(f"Pruned {removed} artifact blobs ({freed / 1048576:.1f} MB)")
+
+    order = {f"{c.__module__}.{c.__name__}": i for i, c in enumerate(test_classes)}
+    results.sort(key=lambda outcome: order.get(outcome["class"], len(order)))
+    for outcome in results:
+        print(outcome["output"])
+    write_junit(results, args.junit)
+
+    records = [r for outcome in results for r in outcome["records"]]
+    failed = [r for r in records if r["status"] in ("failed", "error")]
+    print("=" * 70)
+    print(f"Ran {len(records)} tests in {elapsed:.1f}s, {len(failed)} failed")
+    print(f"JUnit report: {args.junit}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+import os
+import json
+import time
+import atexit
+import functools
+import warnings
+from contextlib import contextmanager
+
+import allure
+
+DEFAULT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perf_budgets.json")
+OUTSIDE_TESTS = "<class fixtures>"
+
+
+class PerfBudgetWarning(UserWarning):
+    pass
+
+
+class PerfBudgets:
+    """Time budgets for page-object methods, read from perf_budgets.json.
+
+    Keys are "PageClass.method" for a whole method, or "PageClass.method:span"
+    for a part of it measured with measure(). A budget over its limit is kept
+    under the running test until its end: "fail" budgets fail the test in
+    Base's cleanup, "warn" budgets (the default) only warn and attach the
+    measurement to Allure. Violations in class fixtures belong to no test;
+    they are reported at exit instead.
+    """
+
+    def __init__(self, path, enabled=True):
+        self.path = path
+        self.enabled = enabled and os.path.exists(path)
+        self.budgets = {}
+        self.violations = {}
+        self.current = OUTSIDE_TESTS
+        if self.enabled:
+            with open(path) as f:
+                self.budgets = {key: value for key, value in json.load(f).items() if not key.startswith("_")}
+            atexit.register(self.report)
+
+    # ---------------- Wiring ----------------
+    def apply(self, namespace):
+        """Wrap every "Class.method" budget whose class is in namespace (Page.py's globals)."""
+        if not self.enabled:
+            return
+        for key in self.budgets:
+            class_name, _, method_name = key.partition(".")
+            cls = namespace.get(class_name)
+            if cls is None or ":" in method_name or not hasattr(cls, method_name):
+                continue
+            setattr(cls, method_name, self._timed(key, getattr(cls, method_name)))
+
+    def _timed(self, key, method):
+        budgets = self
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            with budgets.span(key):
+                return method(*args, **kwargs)
+        return wrapper
+
+    @contextmanager
+    def test(self, test_id):
+        previous, self.current = self.current, test_id
+        try:
+            yield
+        finally:
+            self.current = previous
+
+    def measure(self, page, span):
+        """Time a part of a page-object method against "PageClass.method:span"."""
+        return self.span(f"{type(page).__name__}.{span}")
+
+    @contextmanager
+    def span(self, key):
+        budget = self.budgets.get(key)
+        if budget is None or not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        yield
+        self.check(key, (time.perf_counter() - started) * 1000)
+
+    # ---------------- Checks ----------------
+    def check(self, key, elapsed_ms):
+        budget = self.budgets[key]
+        if elapsed_ms <= budget["max_ms"]:
+            return
+        violation = {
+            "budget": key,
+            "note": budget.get("note", ""),
+            "max_ms": budget["max_ms"],
+            "ms": round(elapsed_ms, 1),
+            "mode": budget.get("mode", "warn"),
+            "test": self.current,
+        }
+        message = f"{key} took {violation['ms']:.0f} ms, budget {budget['max_ms']} ms"
+        if violation["note"]:
+            message += f" ({violation['note']})"
+        violation["message"] = message
+        self.violations.setdefault(self.current, []).append(violation)
+        if violation["mode"] == "warn":
+            warnings.warn(message, PerfBudgetWarning, stacklevel=4)
+
+    def take_violations(self):
+        """The running test's violations; attached to Allure in the test thread."""
+        taken = self.violations.pop(self.current, [])
+        if taken:
+            allure.attach(json.dumps(taken, indent=2), name="perf_budget_violations",
+                          attachment_type=allure.attachment_type.JSON)
+        return taken
+
+    # ---------------- Report ----------------
+    def report(self):
+        """Print and save the violations no test took (class fixtures)."""
+        fixtures = self.violations.get(OUTSIDE_TESTS)
+        if not fixtures:
+            return
+        print("\n===== Perf budgets exceeded in class fixtures =====")
+        for violation in fixtures:
+            print(f"{violation['mode']:5} {violation['message']}")
+
+        path = os.path.join(os.getenv("TMIND_OUTPUT_DIR", os.getcwd()), "reports", "perf_budget_fixtures.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(fixtures, f, indent=2)
+
+
+perf_budgets = PerfBudgets(
+    os.getenv("PERF_BUDGETS_FILE", DEFAULT_FILE),
+    enabled=os.getenv("PERF_BUDGETS", "true") == "true")
@@ -0,0 +1,160 @@
+import os
+import json
+import time
+import atexit
+import functools
+import statistics
+from contextlib import contextmanager
+from datetime import datetime
+
+import allure
+
+from CommandLog import command_log
+
+OUTSIDE_TESTS = "<class fixtures>"
+
+# Installs buffered PerformanceObservers once per document and returns the
+# in-page clock, which marks where the navigation being measured starts.
+START_JS = r"""
+if (!window.__tmindPerf) {
+    const perf = window.__tmindPerf = {lcp: null, longtasks: [], navReported: false};
+    const observe = (type, handle) => {
+        try { new PerformanceObserver(list => list.getEntries().forEach(handle)).observe({type: type, buffered: true}); }
+        catch (e) {}
+    };
+    observe('largest-contentful-paint', e => { perf.lcp = e.startTime; });
+    observe('longtask', e => { perf.longtasks.push({start: e.startTime, duration: e.duration}); });
+}
+return performance.now();
+"""
+
+# Everything the page did since t0. Navigation Timing and LCP describe the
+# document's initial load, so they are reported once per document: in this
+# single-page app later side-panel navigations would repeat the first load's LCP.
+COLLECT_JS = r"""
+const t0 = arguments[0];
+const perf = window.__tmindPerf || {lcp: null, longtasks: [], navReported: true};
+const round = (v) => v == null ? null : Math.round(v * 10) / 10;
+const out = {navigation: null};
+
+if (!perf.navReported) {
+    const nav = performance.getEntriesByType('navigation')[0];
+    if (nav) out.navigation = {
+        ttfb_ms: round(nav.responseStart - nav.requestStart),
+        dom_interactive_ms: round(nav.domInteractive),
+        dom_content_loaded_ms: round(nav.domContentLoadedEventEnd),
+        load_ms: round(nav.loadEventEnd),
+        transfer_kb: round(nav.transferSize / 1024),
+        initial_lcp_ms: round(perf.lcp),
+    };
+    perf.navReported = true;
+}
+
+const tasks = perf.longtasks.filter(t => t.start >= t0);
+out.longtasks = {count: tasks.length, total_ms: round(tasks.reduce((s, t) => s + t.duration, 0)),
+                 max_ms: round(Math.max(0, ...tasks.map(t => t.duration)))};
+
+const resources = performance.getEntriesByType('resource').filter(r => r.startTime >= t0);
+out.resources = {
+    count: resources.length,
+    transfer_kb: round(resources.reduce((s, r) => s + (r.transferSize || 0), 0) / 1024),
+    slowest: resources.sort((a, b) => b.duration - a.duration).slice(0, 5)
+        .map(r => ({url: r.name, type: r.initiatorType, ms: round(r.duration)})),
+};
+
+if (performance.memory) out.heap_mb = {
+    used: round(performance.memory.usedJSHeapSize / 1048576),
+    total: round(performance.memory.totalJSHeapSize / 1048576),
+};
+return out;
+"""
+
+
+class PerfMetrics:
+    """Front-end performance samples taken while the suite navigates the app.
+
+    Each measured navigation costs two script calls: one before the click and
+    one after the page's landmark is visible. Samples are attached to Allure
+    and saved per page as a time series in reports/perf_metrics.json.
+    """
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.current = OUTSIDE_TESTS
+        self.samples = []
+        if enabled:
+            atexit.register(self.report)
+
+    @contextmanager
+    def test(self, test_id):
+        previous, self.current = self.current, test_id
+        try:
+            yield
+        finally:
+            self.current = previous
+
+    @contextmanager
+    def navigation(self, driver, page):
+        """Measure the navigation to page performed inside the block."""
+        if not self.enabled:
+            yield
+            return
+        try:
+            with command_log.internal():
+                t0 = driver.execute_script(START_JS)
+        except Exception:
+            t0 = None
+        started = time.perf_counter()
+        yield
+        navigation_ms = round((time.perf_counter() - started) * 1000, 1)
+        if t0 is None:
+            return
+        try:
+            with command_log.internal():
+                sample = driver.execute_script(COLLECT_JS, t0)
+        except Exception as e:
+            print(f"Performance metrics for {page} not collected: {e}")
+            return
+        sample.update(page=page, test=self.current, navigation_ms=navigation_ms,
+                      at=datetime.now().isoformat(timespec="seconds"))
+        self.samples.append(sample)
+        allure.attach(json.dumps(sample, indent=2), name=f"perf_{page}",
+                      attachment_type=allure.attachment_type.JSON)
+
+    def by_page(self):
+        series = {}
+        for sample in self.samples:
+            series.setdefault(sample["page"], []).append(sample)
+        return series
+
+    def report(self):
+        if not self.samples:
+            return
+        series = self.by_page()
+        print("\n===== Performance metrics: median per page =====")
+        for page, samples in series.items():
+            lcp = [s["navigation"]["initial_lcp_ms"] for s in samples
+                   if s["navigation"] and s["navigation"]["initial_lcp_ms"] is not None]
+            print(f"{page:14} {len(samples):3d} visits  "
+                  f"nav {statistics.median(s['navigation_ms'] for s in samples):7.0f} ms  "
+                  f"long tasks {statistics.median(s['longtasks']['total_ms'] for s in samples):6.0f} ms  "
+                  f"initial LCP {statistics.median(lcp) if lcp else float('nan'):7.0f} ms")
+
+        path = os.path.join(os.getenv("TMIND_OUTPUT_DIR", os.getcwd()), "reports", "perf_metrics.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(series, f, indent=2)
+
+
+perf_metrics = PerfMetrics(os.getenv("PERF_METRICS") == "true")
+
+
+def measured_navigation(page):
+    """Page-object method decorator: record perf metrics for the navigation it performs."""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with perf_metrics.navigation(self.driver, page):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
@@ -0,0 +1,319 @@
+import os
+import sys
+import math
+import time
+import socket
+import sqlite3
+import argparse
+import statistics
+from datetime import datetime
+
+PHASES = ("setup", "call", "teardown")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id    TEXT PRIMARY KEY,
+    started   TEXT NOT NULL,
+    app_build TEXT,
+    host      TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id    TEXT NOT NULL REFERENCES runs(run_id),
+    test_id   TEXT NOT NULL,
+    status    TEXT NOT NULL,
+    duration  REAL NOT NULL,
+    setup     REAL,
+    call      REAL,
+    teardown  REAL,
+    worker    TEXT,
+    finished  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_test ON results(test_id, run_id);
+"""
+
+
+def new_run_id():
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+
+class RecordingResult:
+    """Forwards everything to the runner's result and stores the test's outcome.
+
+    Base.run wraps the result it is given, so history is kept the same way under
+    pytest (the nightly), unittest and the parallel runner.
+    """
+
+    def __init__(self, result, history):
+        self._result = result
+        self._history = history
+        self._status = None
+        self._started = None
+
+    def __getattr__(self, name):
+        return getattr(self._result, name)
+
+    def _set(self, status):
+        # A failure reported by a subtest or cleanup is not overwritten later
+        if self._status in (None, "passed"):
+            self._status = status
+
+    def startTest(self, test):
+        self._started = time.perf_counter()
+        self._result.startTest(test)
+
+    def addSuccess(self, test):
+        self._set("passed")
+        self._result.addSuccess(test)
+
+    def addFailure(self, test, err):
+        self._set("failed")
+        self._result.addFailure(test, err)
+
+    def addError(self, test, err):
+        self._set("error")
+        self._result.addError(test, err)
+
+    def addSkip(self, test, reason):
+        self._set("skipped")
+        self._result.addSkip(test, reason)
+
+    def addExpectedFailure(self, test, err):
+        self._set("passed")
+        self._result.addExpectedFailure(test, err)
+
+    def addUnexpectedSuccess(self, test):
+        self._set("failed")
+        self._result.addUnexpectedSuccess(test)
+
+    def addSubTest(self, test, subtest, err):
+        if err is not None:
+            self._set("failed" if issubclass(err[0], test.failureException) else "error")
+        self._result.addSubTest(test, subtest, err)
+
+    def stopTest(self, test):
+        duration = time.perf_counter() - self._started if self._started else 0.0
+        try:
+            self._history.record(test.id(), self._status or "error", duration,
+                                 getattr(test, "phase_timings", {}))
+        except sqlite3.Error as e:
+            print(f"Run history write failed: {e}")
+        self._result.stopTest(test)
+
+
+class RunHistory:
+    """Test results of every run in one SQLite file (RUN_HISTORY_DB, by default
+    reports/run_history.sqlite under TMIND_OUTPUT_DIR).
+
+    Parallel workers share the run id and the file through the RUN_ID and
+    RUN_HISTORY_DB environment variables; WAL mode and a busy timeout keep
+    them apart.
+    """
+
+    def __init__(self, path, enabled=True):
+        self.path = path
+        self.enabled = enabled
+        self.run_id = os.getenv("RUN_ID") or new_run_id()
+        self._connection = None
+
+    def connect(self):
+        if self._connection is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=30)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(SCHEMA)
+        return self._connection
+
+    def wrap(self, result):
+        return RecordingResult(result, self) if self.enabled and result is not None else result
+
+    def record(self, test_id, status, duration, phases=None, worker=None):
+        phases = phases or {}
+        db = self.connect()
+        with db:
+            db.execute(
+                "INSERT OR IGNORE INTO runs (run_id, started, app_build, host) VALUES (?, ?, ?, ?)",
+                (self.run_id, datetime.now().isoformat(timespec="seconds"),
+                 os.getenv("APP_BUILD"), socket.gethostname()))
+            db.execute(
+                "INSERT INTO results (run_id, test_id, status, duration, setup, call, teardown, worker, finished)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.run_id, test_id, status, round(duration, 3),
+                 *(phases.get(phase) for phase in PHASES),
+                 worker or os.getenv("WORKER_ID"), datetime.now().isoformat(timespec="seconds")))
+
+    # ---------------- Queries ----------------
+    def runs(self):
+        """Run ids, oldest first."""
+        return [row[0] for row in self.connect().execute(
+            "SELECT run_id FROM runs ORDER BY started, run_id")]
+
+    def durations(self, run_ids, status="passed"):
+        """{test_id: {run_id: duration}} for results with the given status."""
+        if not run_ids:
+            return {}
+        marks = ",".join("?" * len(run_ids))
+        out = {}
+        for test_id, run_id, duration in self.connect().execute(
+                f"SELECT test_id, run_id, duration FROM results WHERE status = ? AND run_id IN ({marks})",
+                (status, *run_ids)):
+            out.setdefault(test_id, {})[run_id] = duration
+        return out
+
+    def compare(self, run_id=None, baseline_runs=10, alpha=0.05, min_ratio=1.2, min_seconds=0.5):
+        """Tests of run_id whose duration rose significantly against the preceding runs.
+
+        Every passed test with at least three baseline samples gets a one-sided
+        p-value: where its log duration falls in the Student-t prediction interval
+        of the baseline's log durations. Benjamini-Hochberg keeps the false
+        discovery rate at alpha across all tests, and a regression must also be
+        min_ratio times slower and min_seconds longer than the baseline mean.
+        """
+        runs = self.runs()
+        run_id = run_id or (runs[-1] if runs else None)
+        if run_id not in runs:
+            raise ValueError(f"Unknown run {run_id!r}")
+        baseline = runs[max(0, runs.index(run_id) - baseline_runs):runs.index(run_id)]
+        latest = self.durations([run_id])
+        history = self.durations(baseline)
+
+        rows = []
+        for test_id, by_run in latest.items():
+            samples = [math.log(d) for d in history.get(test_id, {}).values() if d > 0]
+            value = by_run[run_id]
+            if len(samples) < 3 or value <= 0:
+                continue
+            mean = statistics.mean(samples)
+            # Floor the spread at ~1% so a perfectly stable baseline still has a scale
+            sd = max(statistics.stdev(samples), 0.01)
+            n = len(samples)
+            t = (math.log(value) - mean) / (sd * math.sqrt(1 + 1 / n))
+            rows.append({
+                "test_id": test_id,
+                "samples": n,
+                "baseline": math.exp(mean),
+                "latest": value,
+                "ratio": value / math.exp(mean),
+                "t": t,
+                "p": t_sf(t, n - 1),
+            })
+
+        for row, significant in zip(rows, benjamini_hochberg([r["p"] for r in rows], alpha)):
+            row["regressed"] = (significant and row["ratio"] >= min_ratio
+                                and row["latest"] - row["baseline"] >= min_seconds)
+        return run_id, baseline, sorted(rows, key=lambda r: r["p"])
+
+
+# ---------------- Statistics ----------------
+def _beta_continued_fraction(a, b, x, max_iter=200, eps=3e-14):
+    """Lentz's continued fraction for the incomplete beta function."""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1, a - 1
+    c, d = 1.0, 1 - qab * x / qap
+    d = 1 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, max_iter + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1 + aa * d
+        d = 1 / (d if abs(d) > tiny else tiny)
+        c = 1 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1 + aa * d
+        d = 1 / (d if abs(d) > tiny else tiny)
+        c = 1 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < eps:
+            break
+    return h
+
+
+def regularized_beta(a, b, x):
+    """I_x(a, b), the regularized incomplete beta function."""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                     + a * math.log(x) + b * math.log1p(-x))
+    if x < (a + 1) / (a + b + 2):
+        return front * _beta_continued_fraction(a, b, x) / a
+    return 1 - front * _beta_continued_fraction(b, a, 1 - x) / b
+
+
+def t_sf(t, df):
+    """P(T > t) for Student's t with df degrees of freedom."""
+    tail = 0.5 * regularized_beta(df / 2, 0.5, df / (df + t * t))
+    return tail if t > 0 else 1 - tail
+
+
+def benjamini_hochberg(p_values, alpha):
+    """Which hypotheses are rejected at false discovery rate alpha."""
+    order = sorted(range(len(p_values)), key=lambda i: p_values[i])
+    cutoff = 0
+    for rank, i in enumerate(order, start=1):
+        if p_values[i] <= rank / len(p_values) * alpha:
+            cutoff = rank
+    rejected = [False] * len(p_values)
+    for i in order[:cutoff]:
+        rejected[i] = True
+    return rejected
+
+
+run_history = RunHistory(
+    os.getenv("RUN_HISTORY_DB") or os.path.join(
+        os.getenv("TMIND_OUTPUT_DIR", os.getcwd()), "reports", "run_history.sqlite"),
+    enabled=os.getenv("RUN_HISTORY", "true") == "true")
+
+
+# ---------------- Command line ----------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the TMind run history")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compare = commands.add_parser("compare", help="Flag tests that got slower than the rolling baseline")
+    compare.add_argument("--run", default=None, help="Run id to check (default: latest)")
+    compare.add_argument("--baseline", type=int, default=10, help="Number of preceding runs")
+    compare.add_argument("--alpha", type=float, default=0.05, help="False discovery rate")
+    compare.add_argument("--min-ratio", type=float, default=1.2)
+    compare.add_argument("--min-seconds", type=float, default=0.5)
+
+    trend = commands.add_parser("trend", help="Duration of matching tests over recent runs")
+    trend.add_argument("test", help="Substring of the test id")
+    trend.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(run_history.path) or not run_history.runs():
+        print(f"No runs recorded in {run_history.path}")
+        return 0
+
+    if args.command == "compare":
+        try:
+            run_id, baseline, rows = run_history.compare(
+                args.run, args.baseline, args.alpha, args.min_ratio, args.min_seconds)
+        except ValueError as e:
+            print(e)
+            return 2
+        print(f"Run {run_id} against {len(baseline)} baseline runs, {len(rows)} tests compared")
+        regressions = [r for r in rows if r["regressed"]]
+        for r in regressions:
+            print(f"SLOWER  {r['latest']:7.2f}s vs {r['baseline']:7.2f}s  x{r['ratio']:.2f}  "
+                  f"p={r['p']:.2g}  n={r['samples']}  {r['test_id']}")
+        print(f"{len(regressions)} regressions")
+        return 1 if regressions else 0
+
+    runs = run_history.runs()[-args.runs:]
+    durations = run_history.durations(runs)
+    for test_id in sorted(t for t in durations if args.test in t):
+        print(test_id)
+        for run_id in runs:
+            value = durations[test_id].get(run_id)
+            print(f"  {run_id}  {'-' if value is None else f'{value:7.2f}s'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
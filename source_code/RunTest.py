@@ -7,16 +7,21 @@ from Device import DevicesTests
 from ManageUser import ManageUserTests
 from Tour import TourTests
 
+TEST_CLASSES = [
+    LoginTests,
+    SignUpTests,
+    AssetsTests,
+    DevicesTests,
+    ManageUserTests,
+    SignalTests,
+    TourTests,
+]
+
 def suite():
     suite = unittest.TestSuite()
 
-    suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(LoginTests))
-    suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(SignUpTests))
-    suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(AssetsTests))
-    suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(DevicesTests))
-    suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(ManageUserTests))
-    suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(SignalTests))
-    suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(TourTests))
+    for test_class in TEST_CLASSES:
+        suite.addTests(unittest.defaultTestLoader.loadTestsFromTestCase(test_class))
    
     return suite
 
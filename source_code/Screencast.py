@@ -0,0 +1,162 @@
+import os
+import io
+import json
+import time
+import base64
+import shutil
+import zipfile
+import tempfile
+import threading
+import subprocess
+from collections import deque
+
+import trio
+import allure
+
+from ArtifactStore import artifact_store
+
+
+class Screencast:
+    """Last few seconds of a driver's screen, kept in memory.
+
+    A daemon thread per driver runs CDP Page.startScreencast over
+    driver.bidi_connection() (trio) and appends every JPEG frame Chrome sends
+    to a ring buffer. Frames older than `seconds`, or beyond `max_bytes`, are
+    dropped as new ones arrive, so memory stays flat however long the driver
+    lives and nothing touches the disk until clip() is called for a failure.
+    """
+    enabled = os.getenv("SCREENCAST") == "true"
+    seconds = float(os.getenv("SCREENCAST_SECONDS", "10"))
+    max_bytes = int(float(os.getenv("SCREENCAST_MAX_MB", "20")) * 1024 * 1024)
+    quality = int(os.getenv("SCREENCAST_QUALITY", "50"))
+    max_width = int(os.getenv("SCREENCAST_MAX_WIDTH", "960"))
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.frames = deque()
+        self.size = 0
+        self.received = 0
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._thread = None
+
+    @classmethod
+    def for_driver(cls, driver):
+        screencast = getattr(driver, "screencast", None)
+        if screencast is None:
+            screencast = cls(driver)
+            driver.screencast = screencast
+        return screencast
+
+    @classmethod
+    def attach(cls, driver):
+        """Start recording driver when SCREENCAST=true; returns the driver."""
+        if cls.enabled:
+            cls.for_driver(driver).start()
+        return driver
+
+    # ---------------- Recording ----------------
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="screencast", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stopped = True
+
+    def _run(self):
+        try:
+            trio.run(self._record)
+        except Exception as e:
+            # Once frames have arrived this is the browser going away (quit or
+            # crash); the buffer just stops growing
+            if not self._stopped and not self.received:
+                print(f"Screencast stopped: {e}")
+
+    async def _record(self):
+        async with self.driver.bidi_connection() as connection:
+            session, devtools = connection.session, connection.devtools
+            await session.execute(devtools.page.start_screencast(
+                format_="jpeg", quality=self.quality, max_width=self.max_width,
+                max_height=self.max_width))
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(self._watch_stop, nursery.cancel_scope)
+                async for frame in session.listen(devtools.page.ScreencastFrame):
+                    self._push(frame.data)
+                    await session.execute(devtools.page.screencast_frame_ack(frame.session_id))
+
+    async def _watch_stop(self, cancel_scope):
+        while not self._stopped:
+            await trio.sleep(0.5)
+        cancel_scope.cancel()
+
+    def _push(self, data):
+        now = time.monotonic()
+        with self._lock:
+            self.frames.append((now, data))
+            self.received += 1
+            self.size += len(data)
+            while self.frames and (self.size > self.max_bytes or self.frames[0][0] < now - self.seconds):
+                self.size -= len(self.frames.popleft()[1])
+
+    # ---------------- Failure clip ----------------
+    def snapshot(self, since=None):
+        """Frames received after since (time.monotonic()), oldest first."""
+        with self._lock:
+            return [(at, data) for at, data in self.frames if since is None or at >= since]
+
+    def clip(self, name, since=None):
+        """Encode the buffered frames as MP4 (ffmpeg) or a zip of JPEGs, store
+        the clip as an artifact and attach it to Allure. Call from the test thread."""
+        frames = self.snapshot(since)
+        if not frames:
+            return None
+        ended = time.monotonic()
+        durations = [max(b[0] - a[0], 0.04) for a, b in zip(frames, frames[1:])]
+        durations.append(max(ended - frames[-1][0], 0.5))
+        images = [base64.b64decode(data) for _, data in frames]
+
+        video = self._encode_mp4(images, durations) if shutil.which("ffmpeg") else None
+        if video is not None:
+            path = artifact_store.put_bytes(video, f"{name}.mp4", "screencast", "mp4")
+            allure.attach.file(path, name=name, attachment_type=allure.attachment_type.MP4)
+        else:
+            path = artifact_store.put_bytes(self._zip(images, durations), f"{name}.zip", "screencast", "zip")
+            allure.attach.file(path, name=name, attachment_type="application/zip", extension="zip")
+        return path
+
+    @staticmethod
+    def _encode_mp4(images, durations):
+        with tempfile.TemporaryDirectory(prefix="screencast-") as workdir:
+            lines = []
+            for index, (image, duration) in enumerate(zip(images, durations)):
+                frame = os.path.join(workdir, f"{index:05d}.jpg")
+                with open(frame, "wb") as f:
+                    f.write(image)
+                lines += [f"file '{frame}'", f"duration {duration:.3f}"]
+            # The concat demuxer ignores the last duration unless the file is repeated
+            lines.append(f"file '{frame}'")
+            listing = os.path.join(workdir, "frames.txt")
+            with open(listing, "w") as f:
+                f.write("\n".join(lines))
+            output = os.path.join(workdir, "clip.mp4")
+            result = subprocess.run(
+                ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", listing,
+                 "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-fps_mode", "vfr",
+                 "-pix_fmt", "yuv420p", "-c:v", "libx264", output],
+                capture_output=True, text=True)
+            if result.returncode != 0:
+                print(f"ffmpeg failed, keeping the frames as a zip: {result.stderr.strip()[:200]}")
+                return None
+            with open(output, "rb") as f:
+                return f.read()
+
+    @staticmethod
+    def _zip(images, durations):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+            for index, image in enumerate(images):
+                archive.writestr(f"{index:05d}.jpg", image)
+            archive.writestr("frames.json", json.dumps(
+                [{"file": f"{i:05d}.jpg", "seconds": round(d, 3)} for i, d in enumerate(durations)], indent=2))
+        return buffer.getvalue()
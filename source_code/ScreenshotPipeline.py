@@ -0,0 +1,100 @@
+import os
+import base64
+import atexit
+from concurrent.futures import ThreadPoolExecutor, Future
+
+import allure
+
+from ArtifactStore import artifact_store
+from CommandLog import command_log
+
+FORMATS = {
+    # format: (file extension, Allure attachment type)
+    "png": ("png", allure.attachment_type.PNG),
+    "jpeg": ("jpg", allure.attachment_type.JPG),
+    "webp": ("webp", "image/webp"),
+}
+
+
+class ScreenshotPipeline:
+    """Screenshots taken with one CDP call and stored off the test thread.
+
+    Chrome encodes the image itself (WebP or JPEG at `quality`, optionally
+    downscaled by `scale`), so the test thread only pays for the capture.
+    Decoding and writing to the artifact store run on a small thread pool;
+    the store keeps an identical screenshot once. Allure only
+    accepts attachments from the test's own thread, so Base attaches the
+    test's screenshots in a cleanup once their files exist. Screenshots are
+    kept pending per test, so one taken in setUpClass or left by another
+    test is stored but never attached to the wrong report.
+    """
+
+    def __init__(self, fmt="webp", quality=80, scale=1.0, workers=2, background=True):
+        if fmt not in FORMATS:
+            raise ValueError(f"SCREENSHOT_FORMAT must be one of {', '.join(FORMATS)}, not {fmt!r}")
+        self.format = fmt
+        self.extension, self.attachment_type = FORMATS[fmt]
+        self.quality = quality
+        self.scale = scale
+        self.background = background
+        self.pending = []
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screenshot") \
+            if background else None
+        if background:
+            atexit.register(self.drain)
+
+    # ---------------- Capture (test thread) ----------------
+    def capture(self, driver, name):
+        """Grab the viewport now; returns a Future for the saved file's path."""
+        params = {"format": self.format, "captureBeyondViewport": False, "optimizeForSpeed": True}
+        if self.format != "png":
+            params["quality"] = self.quality
+        with command_log.internal():
+            if self.scale < 1:
+                viewport = driver.execute_cdp_cmd("Page.getLayoutMetrics", {})["cssVisualViewport"]
+                params["clip"] = {"x": viewport["pageX"], "y": viewport["pageY"], "scale": self.scale,
+                                  "width": viewport["clientWidth"], "height": viewport["clientHeight"]}
+            data = driver.execute_cdp_cmd("Page.captureScreenshot", params)["data"]
+
+        test_id = artifact_store.current
+        if self.background:
+            future = self._executor.submit(self._store, data, name, test_id)
+        else:
+            future = Future()
+            future.set_result(self._store(data, name, test_id))
+        self.pending.append((test_id, name, future))
+        return future
+
+    # ---------------- Store (background) ----------------
+    def _store(self, data, name, test_id):
+        return artifact_store.put_bytes(base64.b64decode(data), f"{name}.{self.extension}", "screenshot",
+                                        self.extension, test_id)
+
+    # ---------------- Attach (test thread) ----------------
+    def attach_pending(self):
+        """Wait for the running test's screenshots and attach them to Allure; any
+        pending for another test are dropped (their files stay in the store)."""
+        taken, self.pending = self.pending, []
+        for test_id, name, future in taken:
+            if test_id != artifact_store.current:
+                continue
+            try:
+                path = future.result()
+            except Exception as e:
+                print(f"Screenshot {name} not saved: {e}")
+                continue
+            allure.attach.file(path, name=name, attachment_type=self.attachment_type,
+                               extension=self.extension)
+
+    def drain(self):
+        """Finish every queued write; runs at exit."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+
+screenshots = ScreenshotPipeline(
+    fmt=os.getenv("SCREENSHOT_FORMAT", "webp"),
+    quality=int(os.getenv("SCREENSHOT_QUALITY", "80")),
+    scale=float(os.getenv("SCREENSHOT_SCALE", "1.0")),
+    workers=int(os.getenv("SCREENSHOT_WORKERS", "2")),
+    background=os.getenv("SCREENSHOT_ASYNC", "true") == "true")
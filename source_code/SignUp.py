@@ -1,6 +1,5 @@
 import os
 import unittest
-import time
 import allure
 from dotenv import load_dotenv
 from selenium.webdriver.support.ui import WebDriverWait
@@ -35,7 +34,7 @@ class SignUpTests(Base):
     def test_Verify_error_should_display_when_all_fields_empty(self):
         self.signup.navigate_to_signup()
         self.signup.click(SignUpLocators.CREATE_ACCOUNT_BUTTON)
-        time.sleep(2)
+        self.signup.wait_for_form_feedback()
         try:
             error = (self.signup.is_visible(SignUpLocators.ERROR_MESSAGES)
                 or self.signup.get_toast_message()
@@ -69,7 +68,7 @@ class SignUpTests(Base):
         self.signup.send_keys(SignUpLocators.EMAIL_FIELD, "user1@test.com")
         self.signup.send_keys(SignUpLocators.PASSWORD_FIELD, "1234")
         self.signup.click(SignUpLocators.CREATE_ACCOUNT_BUTTON)
-        time.sleep(2)
+        self.signup.wait_for_form_feedback()
         try:
             assert (self.signup.is_visible(SignUpLocators.ERROR_MESSAGES)
                 or self.signup.get_browser_validation_message(SignUpLocators.PASSWORD_FIELD)
@@ -86,7 +85,7 @@ class SignUpTests(Base):
         self.signup.send_keys(SignUpLocators.EMAIL_FIELD, "exuser@gmail.com")
         self.signup.send_keys(SignUpLocators.PASSWORD_FIELD, "StrongPass@123")
         self.signup.click(SignUpLocators.CREATE_ACCOUNT_BUTTON)
-        time.sleep(2)
+        self.signup.wait_for_form_feedback()
         try:
             assert (self.signup.get_toast_message()
                 or self.signup.is_visible(SignUpLocators.ERROR_MESSAGES))
@@ -102,7 +101,7 @@ class SignUpTests(Base):
         self.signup.send_keys(SignUpLocators.EMAIL_FIELD, "test@test.com")
         self.signup.send_keys(SignUpLocators.PASSWORD_FIELD, "StrongPass@123")
         self.signup.click(SignUpLocators.CREATE_ACCOUNT_BUTTON)
-        time.sleep(2)
+        self.signup.wait_for_form_feedback()
         try:
             assert (self.signup.get_browser_validation_message(SignUpLocators.USERNAME_FIELD)
                 or self.signup.is_visible(SignUpLocators.ERROR_MESSAGES))
@@ -118,7 +117,7 @@ class SignUpTests(Base):
         self.signup.send_keys(SignUpLocators.EMAIL_FIELD, "test@test.com")
         self.signup.send_keys(SignUpLocators.PASSWORD_FIELD, "StrongPass@123")
         self.signup.click(SignUpLocators.CREATE_ACCOUNT_BUTTON)
-        time.sleep(2)
+        self.signup.wait_for_form_feedback()
         try:
             assert (self.signup.get_browser_validation_message(SignUpLocators.USERNAME_FIELD)
                 or self.signup.is_visible(SignUpLocators.ERROR_MESSAGES)
@@ -1,9 +1,9 @@
 import os
 import unittest
 import allure
-import time
 from Base import Base
-from Page import LoginPage, AssetPage, SignalPage
+from Page import AssetPage, SignalPage
+from LoginCache import login_cache
 from locators import SignalLocators
 from dotenv import load_dotenv
 from selenium.webdriver.support.ui import Select
@@ -16,14 +16,10 @@ class SignalTests(Base):
     def setUpClass(cls):
         cls.driver = super().start_driver()
 
-        login = LoginPage(cls.driver)
-        login.enter_email(os.environ.get("USER_EMAIL"))
-        login.enter_password(os.environ.get("PASSWORD"))
-        login.click_login()
-        assert login.is_dashboard_displayed(), "Login failed"
+        assert login_cache.login(cls.driver), "Login failed"
         cls.signal = SignalPage(cls.driver)
         # ---------- OPEN SIGNAL MODULE ----------
-        cls.signal.click(SignalLocators.SIGNAL_MENU)
+        cls.signal.open_signal_page()
     # 1 ---------------- OPEN ----------------
     @allure.title("Verify Signal module opens successfully")
     @allure.severity(allure.severity_level.CRITICAL)
@@ -42,7 +38,6 @@ class SignalTests(Base):
             dropdown = self.signal.get_element(
                 SignalLocators.TIME_RANGE_DROPDOWN
             )
-            time.sleep(1)
             assert dropdown.is_displayed(), "Time Range dropdown not visible"
             assert dropdown.is_enabled(), "Time Range dropdown disabled"
         except AssertionError:
@@ -61,7 +56,9 @@ class SignalTests(Base):
             select = Select(dropdown_element)
             select.select_by_value("7d")  # Last 7 Days
 
-            time.sleep(1)
+            self.signal.wait_for_option_selected(
+            SignalLocators.TIME_RANGE_DROPDOWN, "Last 7 Days"
+        )
 
             selected_option = select.first_selected_option.text
             assert selected_option == "Last 7 Days", \
@@ -80,7 +77,6 @@ class SignalTests(Base):
                 SignalLocators.MAIN_ASSET_DROPDOWN
             )
             asset_dropdown.click()
-            time.sleep(1)
             assert asset_dropdown.is_enabled(), "Main Asset dropdown disabled"
         except AssertionError:
             self.attach_screenshot("_failure")
@@ -94,7 +90,6 @@ class SignalTests(Base):
             signals_btn = self.signal.get_element(
                 SignalLocators.SIGNALS_BUTTON
             )
-            time.sleep(1)
             assert not signals_btn.is_enabled(), \
                 "Signals button should be disabled initially"
         except AssertionError:
@@ -109,7 +104,6 @@ class SignalTests(Base):
             device_text = self.signal.get_text(
                 SignalLocators.ASSIGNED_DEVICE_VALUE
             )
-            time.sleep(1)
             assert "Not Assigned" in device_text, \
                 "Assigned device text incorrect"
         except AssertionError:
@@ -0,0 +1,67 @@
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+from contextlib import contextmanager
+
+OUTSIDE_TESTS = "<class fixtures>"
+
+_real_sleep = time.sleep
+
+
+class SleepAudit:
+    """Counts seconds each test spends in unconditional time.sleep calls.
+
+    Sleeps issued from inside selenium (WebDriverWait polling) are conditional
+    and are not counted. Only the thread running the tests is audited (the
+    main thread outside a test); background threads such as the screenshot
+    pool or the artifact pruner go straight to the real time.sleep.
+    """
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.current = OUTSIDE_TESTS
+        self.seconds = {}
+        self.calls = {}
+        self.thread = threading.main_thread()
+        if enabled:
+            time.sleep = self._sleep
+            atexit.register(self.report)
+
+    def _sleep(self, seconds):
+        if threading.current_thread() is not self.thread:
+            return _real_sleep(seconds)
+        caller = sys._getframe(1).f_globals.get("__name__", "")
+        if not caller.startswith("selenium"):
+            self.seconds[self.current] = self.seconds.get(self.current, 0.0) + seconds
+            self.calls[self.current] = self.calls.get(self.current, 0) + 1
+        _real_sleep(seconds)
+
+    @contextmanager
+    def test(self, test_id):
+        previous, self.current = self.current, test_id
+        previous_thread, self.thread = self.thread, threading.current_thread()
+        try:
+            yield
+        finally:
+            self.current, self.thread = previous, previous_thread
+
+    def report(self):
+        if not self.seconds:
+            return
+        rows = sorted(self.seconds.items(), key=lambda item: item[1], reverse=True)
+        print("\n===== Sleep audit: unconditional time.sleep per test =====")
+        for test_id, seconds in rows:
+            print(f"{seconds:8.2f}s  {self.calls[test_id]:4d} calls  {test_id}")
+        print(f"{sum(self.seconds.values()):8.2f}s  total")
+
+        path = os.path.join(os.getenv("TMIND_OUTPUT_DIR", os.getcwd()), "reports", "sleep_audit.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump([{"test": t, "seconds": round(s, 3), "calls": self.calls[t]}
+                       for t, s in rows], f, indent=2)
+
+
+sleep_audit = SleepAudit(os.getenv("SLEEP_AUDIT") == "true")
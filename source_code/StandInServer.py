@@ -0,0 +1,346 @@
+import os
+import sys
+import json
+import time
+import copy
+import random
+import argparse
+import threading
+import mimetypes
+from urllib.parse import urlparse, parse_qs, unquote
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stand_in")
+
+EMAIL = "qa@tmind.local"
+PASSWORD = "Password@123"
+
+DEFAULT_STATE = {
+    "accounts": [{"username": "qa", "email": EMAIL, "password": PASSWORD}],
+    "devices": [
+        {"name": "PressureSensor", "description": "Line 1 pressure", "config": {
+            "configName": "PressureConfig", "pollInterval": "1000", "IpAddress": "192.168.1.10", "Port": "502"}},
+        {"name": "TemperatureSensor", "description": "Oven temperature", "config": {
+            "configName": "TempConfig", "pollInterval": "1000", "IpAddress": "192.168.1.11", "Port": "502"}},
+        {"name": "Controller_01", "description": "PLC", "config": {
+            "configName": "PlcConfig", "pollInterval": "500", "IpAddress": "192.168.1.20", "Port": "502"}},
+    ],
+    "assets": [
+        {"name": "Hydraulic Press", "parent": None, "device": None},
+        {"name": "Press Motor", "parent": "Hydraulic Press", "device": "PressureSensor"},
+        {"name": "Robotic Arm", "parent": None, "device": None},
+    ],
+    "users": [{"username": name, "email": f"{name.lower()}@tmind.local", "role": role}
+              for name, role in [("Sakshi", "Admin"), ("exuser", "Viewer"), ("admin", "Admin"),
+                                 ("admin_ops", "Engineer"), ("sysadmin", "Admin")]]
+             + [{"username": f"user{i:02d}", "email": f"user{i:02d}@tmind.local", "role": "Viewer"}
+                for i in range(1, 21)],
+}
+
+
+class StandInApp:
+    """In-memory TMind backend: the JSON API the stand-in frontend calls.
+
+    latency_ms/jitter_ms delay every /api request; failure_rate fails that
+    share of them with HTTP 500, drawn from a seeded generator so a run is
+    reproducible. fail_paths fails every request whose path starts with one
+    of the prefixes.
+    """
+
+    def __init__(self, latency_ms=0, jitter_ms=0, failure_rate=0.0, fail_paths=(), seed=0):
+        self.lock = threading.Lock()
+        self.configure(latency_ms=latency_ms, jitter_ms=jitter_ms, failure_rate=failure_rate,
+                       fail_paths=list(fail_paths), seed=seed)
+        self.seed(DEFAULT_STATE)
+
+    def configure(self, **settings):
+        with self.lock:
+            for key in ("latency_ms", "jitter_ms", "failure_rate", "fail_paths"):
+                if key in settings:
+                    setattr(self, key, settings[key])
+            if "seed" in settings:
+                self.random = random.Random(settings["seed"])
+        return self.config()
+
+    def config(self):
+        return {"latency_ms": self.latency_ms, "jitter_ms": self.jitter_ms,
+                "failure_rate": self.failure_rate, "fail_paths": self.fail_paths}
+
+    def seed(self, state):
+        with self.lock:
+            self.state = copy.deepcopy({**DEFAULT_STATE, **state})
+
+    # ---------------- Request handling ----------------
+    def delay_and_maybe_fail(self, path):
+        with self.lock:
+            delay = self.latency_ms + (self.random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+            fail = (any(path.startswith(prefix) for prefix in self.fail_paths)
+                    or (self.failure_rate and self.random.random() < self.failure_rate))
+        if delay:
+            time.sleep(delay / 1000)
+        return fail
+
+    def handle(self, method, path, query, body):
+        """Return (status, payload) for an /api request."""
+        parts = [unquote(p) for p in path.split("/") if p][1:]
+        resource, key, sub = (parts + [None, None, None])[:3]
+        name = f"api_{method.lower()}_{resource}" + (f"_{sub}" if sub else "")
+        with self.lock:
+            handler = getattr(self, name, None)
+            if handler is None:
+                return 404, {"message": "Not found"}
+            return handler(key, query, body)
+
+    @staticmethod
+    def _find(items, field, value):
+        return next((item for item in items if item[field].lower() == (value or "").lower()), None)
+
+    # ---------------- Auth ----------------
+    def api_post_login(self, key, query, body):
+        account = self._find(self.state["accounts"], "email", body.get("email"))
+        if not account or account["password"] != body.get("password"):
+            return 401, {"message": "Invalid email or password"}
+        return 200, {"token": f"stand-in-{account['username']}", "username": account["username"]}
+
+    def api_post_signup(self, key, query, body):
+        if self._find(self.state["accounts"], "email", body.get("email")):
+            return 409, {"message": "Email already exists"}
+        self.state["accounts"].append({k: body.get(k, "") for k in ("username", "email", "password")})
+        return 201, {"message": "Registered successfully"}
+
+    # ---------------- Devices ----------------
+    def api_get_devices(self, key, query, body):
+        term = query.get("search", [""])[0].strip().lower()
+        return 200, [d for d in self.state["devices"] if term in d["name"].lower()]
+
+    def api_post_devices(self, key, query, body):
+        if self._find(self.state["devices"], "name", body.get("name")):
+            return 409, {"message": f"Device '{body['name']}' already exists"}
+        device = {"name": body["name"], "description": body.get("description", ""),
+                  "config": {"configName": "", "pollInterval": "1000", "IpAddress": "", "Port": "502"}}
+        self.state["devices"].append(device)
+        return 201, device
+
+    def api_put_devices(self, key, query, body):
+        device = self._find(self.state["devices"], "name", key)
+        if not device:
+            return 404, {"message": "Device not found"}
+        if "config" in body:
+            device["config"].update(body["config"])
+        for field in ("name", "description"):
+            if body.get(field):
+                device[field] = body[field]
+        return 200, device
+
+    def api_post_devices_slaves(self, key, query, body):
+        device = self._find(self.state["devices"], "name", key)
+        if not device:
+            return 404, {"message": "Device not found"}
+        slaves = device.setdefault("slaves", [])
+        slave = {"name": body.get("name") or f"Slave {len(slaves) + 1}",
+                 "registers": body.get("registers", [])}
+        if not slave["registers"]:
+            return 400, {"message": "Cannot save slave with no registers"}
+        slaves.append(slave)
+        return 201, {"message": "Slave created on server", **slave}
+
+    def api_delete_devices(self, key, query, body):
+        device = self._find(self.state["devices"], "name", key)
+        if not device:
+            return 404, {"message": "Device not found"}
+        self.state["devices"].remove(device)
+        return 200, {"message": "Device deleted successfully"}
+
+    # ---------------- Assets ----------------
+    def api_get_assets(self, key, query, body):
+        return 200, self.state["assets"]
+
+    def api_post_assets(self, key, query, body):
+        if self._find(self.state["assets"], "name", body.get("name")):
+            return 409, {"message": "Asset name already exists"}
+        asset = {"name": body["name"], "parent": body.get("parent"), "device": None}
+        self.state["assets"].append(asset)
+        return 201, asset
+
+    def api_put_assets(self, key, query, body):
+        asset = self._find(self.state["assets"], "name", key)
+        if not asset:
+            return 404, {"message": "Asset not found"}
+        for child in self.state["assets"]:
+            if child["parent"] == asset["name"]:
+                child["parent"] = body["name"]
+        asset["name"] = body["name"]
+        return 200, asset
+
+    def api_delete_assets(self, key, query, body):
+        asset = self._find(self.state["assets"], "name", key)
+        if not asset:
+            return 404, {"message": "Asset not found"}
+        if any(a["parent"] == asset["name"] for a in self.state["assets"]):
+            return 409, {"message": "Delete the sub assets first"}
+        self.state["assets"].remove(asset)
+        return 200, {"message": "Deleted successfully"}
+
+    # ---------------- Users ----------------
+    def api_get_users(self, key, query, body):
+        term = query.get("search", [""])[0].strip().lower()
+        return 200, [u for u in self.state["users"] if term in u["username"].lower()]
+
+    def api_post_users(self, key, query, body):
+        if self._find(self.state["users"], "username", body.get("username")):
+            return 409, {"message": "Username already exists"}
+        user = {"username": body["username"], "email": body.get("email", ""), "role": body.get("role", "Viewer")}
+        self.state["users"].append(user)
+        return 201, user
+
+    def api_put_users(self, key, query, body):
+        user = self._find(self.state["users"], "username", key)
+        if not user:
+            return 404, {"message": "User not found"}
+        user["role"] = body["role"]
+        return 200, {"message": "User role updated successfully"}
+
+    def api_delete_users(self, key, query, body):
+        user = self._find(self.state["users"], "username", key)
+        if not user:
+            return 404, {"message": "User not found"}
+        self.state["users"].remove(user)
+        return 200, {"message": "User deleted successfully"}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    app = None
+
+    def log_message(self, format, *args):
+        pass  # one line per request would drown the test output
+
+    def _send(self, status, payload, content_type="application/json"):
+        data = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}") if length else {}
+
+    def _dispatch(self, method):
+        url = urlparse(self.path)
+        if url.path.startswith("/__stand_in/"):
+            return self._control(method, url.path.rsplit("/", 1)[1])
+        if url.path.startswith("/api/"):
+            if self.app.delay_and_maybe_fail(url.path):
+                return self._send(500, {"message": "Internal Server Error (stand-in failure)"})
+            return self._send(*self.app.handle(method, url.path, parse_qs(url.query), self._body()))
+        if method == "GET":
+            return self._static(url.path)
+        self._send(405, {"message": "Method not allowed"})
+
+    def _control(self, method, action):
+        """Test hooks: /__stand_in/config, /__stand_in/seed, /__stand_in/reset, /__stand_in/state."""
+        if action == "config" and method == "POST":
+            return self._send(200, self.app.configure(**self._body()))
+        if action == "config":
+            return self._send(200, self.app.config())
+        if action == "seed" and method == "POST":
+            self.app.seed(self._body())
+            return self._send(200, {"seeded": True})
+        if action == "reset" and method == "POST":
+            self.app.seed(DEFAULT_STATE)
+            return self._send(200, {"reset": True})
+        if action == "state":
+            with self.app.lock:
+                return self._send(200, self.app.state)
+        self._send(404, {"message": "Unknown control endpoint"})
+
+    def _static(self, path):
+        # Every route that is not a file is the single-page app
+        file_path = os.path.normpath(os.path.join(STATIC_DIR, path.lstrip("/")))
+        if not file_path.startswith(STATIC_DIR) or not os.path.isfile(file_path):
+            file_path = os.path.join(STATIC_DIR, "index.html")
+        with open(file_path, "rb") as f:
+            content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+            self._send(200, f.read(), content_type)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+
+class StandInServer:
+    """Serves the stand-in frontend and API on localhost from a daemon thread."""
+
+    def __init__(self, port=0, **settings):
+        self.app = StandInApp(**settings)
+        handler = type("Handler", (StandInHandler,), {"app": self.app})
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="stand-in", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def settings_from_env():
+    return {
+        "latency_ms": float(os.getenv("STAND_IN_LATENCY_MS", "0")),
+        "jitter_ms": float(os.getenv("STAND_IN_JITTER_MS", "0")),
+        "failure_rate": float(os.getenv("STAND_IN_FAILURE_RATE", "0")),
+        "fail_paths": [p for p in os.getenv("STAND_IN_FAIL_PATHS", "").split(",") if p],
+        "seed": int(os.getenv("STAND_IN_SEED", "0")),
+    }
+
+
+def start_for_suite():
+    """STAND_IN=true: run the stand-in in this process and point the suite at it."""
+    server = StandInServer(port=int(os.getenv("STAND_IN_PORT", "0")), **settings_from_env()).start()
+    os.environ["BASE_URL"] = server.url
+    os.environ["USER_EMAIL"] = EMAIL
+    os.environ["PASSWORD"] = PASSWORD
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the stand-in TMind frontend")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=None)
+    parser.add_argument("--jitter-ms", type=float, default=None)
+    parser.add_argument("--failure-rate", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    settings = settings_from_env()
+    for key in ("latency_ms", "jitter_ms", "failure_rate"):
+        if getattr(args, key) is not None:
+            settings[key] = getattr(args, key)
+    server = StandInServer(port=args.port, **settings)
+    print(f"Stand-in TMind at {server.url}  (login {EMAIL} / {PASSWORD})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+import os
+import sys
+import json
+import time
+import argparse
+from fnmatch import fnmatchcase
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from dotenv import load_dotenv
+from urllib3.exceptions import HTTPError
+
+from ApiSeeder import api_seeder, ApiError
+
+# Names the suite creates. Fixtures the tests expect to find (PressureSensor,
+# Controller_01, Sakshi, ...) must never match.
+PATTERNS = {
+    "assets": ["Auto_Root_01*", "Auto_Child_01*", "Root_1", "Root_1_Child*"],
+    "devices": ["BatteryMonitor_01*", "TyrePressureStation_01*"],
+    "users": [],
+}
+
+DELETE_ACTIONS = {"assets": "delete_asset", "devices": "delete_device", "users": "delete_user"}
+LIST_ACTIONS = {"assets": "list_assets", "devices": "list_devices", "users": "list_users"}
+NAME_FIELDS = {"assets": "name", "devices": "name", "users": "username"}
+PATH_ARGS = {"assets": "name", "devices": "name", "users": "username"}
+
+
+class Sweeper:
+    """Deletes data left behind by earlier runs through the backend API.
+
+    An entity matches when its name fits one of the patterns, or contains the
+    run tag. Assets are deleted deepest level first, because the backend
+    refuses to delete a parent that has children; an asset with a descendant
+    that does not match itself is skipped, so nothing the automation did not
+    create is ever deleted. Everything else is deleted in one concurrent
+    batch per kind.
+    """
+
+    def __init__(self, seeder=api_seeder, patterns=None, tag=None, workers=None):
+        self.seeder = seeder
+        self.patterns = patterns or PATTERNS
+        self.tag = tag
+        self.workers = workers or seeder.workers
+
+    def matches(self, kind, name):
+        if self.tag and self.tag in name:
+            return True
+        return any(fnmatchcase(name, pattern) for pattern in self.patterns.get(kind, []))
+
+    def find(self):
+        """({kind: [[names], ...]}, {kind: [names]}): batches to delete in order
+        (assets deepest level first), and matching assets skipped because of
+        descendants that do not match."""
+        found, skipped = {}, {}
+        for kind in DELETE_ACTIONS:
+            entities = self.seeder.call(LIST_ACTIONS[kind])
+            if kind == "assets":
+                found[kind], skipped[kind] = self._asset_levels(entities)
+            else:
+                found[kind] = [[e[NAME_FIELDS[kind]] for e in entities if self.matches(kind, e[NAME_FIELDS[kind]])]]
+                skipped[kind] = []
+        return found, skipped
+
+    def _asset_levels(self, assets):
+        parents = {a["name"]: a.get("parent") for a in assets}
+        children = {}
+        for name, parent in parents.items():
+            children.setdefault(parent, []).append(name)
+
+        def depth(name):
+            level = 0
+            while parents.get(name):
+                level, name = level + 1, parents[name]
+            return level
+
+        def deletable(name):
+            return self.matches("assets", name) and all(deletable(child) for child in children.get(name, []))
+
+        levels, skipped = {}, []
+        for name in parents:
+            if deletable(name):
+                levels.setdefault(depth(name), []).append(name)
+            elif self.matches("assets", name):
+                skipped.append(name)
+        return [levels[level] for level in sorted(levels, reverse=True)], skipped
+
+    def _delete(self, kind, name):
+        try:
+            self.seeder.request(DELETE_ACTIONS[kind], **{PATH_ARGS[kind]: name})
+            return None
+        except ApiError as e:
+            return None if e.status == 404 else str(e)
+        except Exception as e:
+            return f"{type(e).__name__}: {e}"
+
+    def sweep(self, dry_run=True):
+        started = time.perf_counter()
+        report = {"at": datetime.now().isoformat(timespec="seconds"), "tag": self.tag,
+                  "dry_run": dry_run, "kinds": {}, "error": None}
+        try:
+            self.seeder.login()
+            found, skipped = self.find()
+        except (ApiError, HTTPError, OSError, ValueError) as e:
+            # Wrong route, backend down or not JSON: report it instead of failing the batch step
+            report["error"] = f"{type(e).__name__}: {e}"
+            report["seconds"] = round(time.perf_counter() - started, 2)
+            return report
+        # Devices before assets: an asset may still reference a device
+        for kind in ("devices", "users", "assets"):
+            kind_started = time.perf_counter()
+            deleted, failed = [], {}
+            for level in found[kind]:
+                if dry_run or not level:
+                    continue
+                with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sweep") as executor:
+                    errors = list(executor.map(lambda name: self._delete(kind, name), level))
+                for name, error in zip(level, errors):
+                    if error:
+                        failed[name] = error
+                    else:
+                        deleted.append(name)
+            report["kinds"][kind] = {
+                "matched": [name for level in found[kind] for name in level],
+                "skipped": skipped[kind],
+                "deleted": deleted,
+                "failed": failed,
+                "seconds": round(time.perf_counter() - kind_started, 2),
+            }
+        report["seconds"] = round(time.perf_counter() - started, 2)
+        return report
+
+
+def print_report(report, phase):
+    action = "would delete" if report["dry_run"] else "deleted"
+    print(f"\n===== Sweep ({phase}) in {report['seconds']:.2f}s =====")
+    if report["error"]:
+        print(f"Sweep failed, nothing deleted: {report['error']}")
+    for kind, r in report["kinds"].items():
+        names = r["matched"] if report["dry_run"] else r["deleted"]
+        print(f"{kind:8} {action} {len(names):3d} in {r['seconds']:.2f}s  {', '.join(names)}")
+        if r["skipped"]:
+            print(f"{'':8} kept {', '.join(r['skipped'])} (descendants the automation did not create)")
+        for name, error in r["failed"].items():
+            print(f"{'':8} FAILED {name}: {error}")
+
+
+def run(phase="pre", tag=None, dry_run=None):
+    """Sweep and save reports/sweep_<phase>.json; returns the report. Only a
+    dry run unless dry_run=False or SWEEP_DELETE=true."""
+    if dry_run is None:
+        dry_run = os.getenv("SWEEP_DELETE") != "true"
+    report = Sweeper(tag=tag or os.getenv("RUN_TAG")).sweep(dry_run)
+    print_report(report, phase)
+    path = os.path.join(os.getenv("TMIND_OUTPUT_DIR", os.getcwd()), "reports", f"sweep_{phase}.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Delete leftover automation data through the API")
+    parser.add_argument("--phase", choices=["pre", "post"], default="pre", help="Names the saved report")
+    parser.add_argument("--tag", default=None, help="Also delete anything whose name contains this run tag")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--dry-run", dest="dry_run", action="store_const", const=True,
+                      help="Only list what would be deleted (default unless SWEEP_DELETE=true)")
+    mode.add_argument("--delete", dest="dry_run", action="store_const", const=False, help="Really delete")
+    args = parser.parse_args(argv)
+
+    load_dotenv()
+    report = run(args.phase, args.tag, args.dry_run)
+    return 1 if report["error"] or any(r["failed"] for r in report["kinds"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+from selenium.common.exceptions import WebDriverException
+from DomObserver import allow_script_time
+
+# Installed on every new document; logs each .Toastify__toast as it is created,
+# keeps its text current while it is shown and stamps when it is removed.
+RECORDER_JS = r"""
+(() => {
+    if (window.__tmindToasts) return;
+    const log = window.__tmindToasts = {doc: Date.now() + ':' + Math.random(), seq: 0, entries: []};
+    const live = new Map();
+    const typeOf = (el) => {
+        const m = (el.getAttribute('class') || '').match(/Toastify__toast--(\w+)/);
+        return m ? m[1] : 'default';
+    };
+    const scan = () => {
+        document.querySelectorAll('.Toastify__toast').forEach((el) => {
+            let entry = live.get(el);
+            if (!entry) {
+                entry = {seq: ++log.seq, type: typeOf(el), text: '', ts: Date.now(), removed_ts: null};
+                live.set(el, entry);
+                log.entries.push(entry);
+                if (log.entries.length > 500) log.entries.shift();
+            }
+            entry.type = typeOf(el);
+            entry.text = (el.textContent || '').trim() || entry.text;
+        });
+        live.forEach((entry, el) => {
+            if (!el.isConnected) { entry.removed_ts = Date.now(); live.delete(el); }
+        });
+    };
+    new MutationObserver(scan).observe(document, {subtree: true, childList: true, characterData: true, attributes: true, attributeFilter: ['class']});
+    scan();
+})();
+"""
+
+WAIT_JS = r"""
+const [toastType, contains, mark, timeoutMs, done] = arguments;
+const match = () => {
+    const log = window.__tmindToasts;
+    if (!log) return null;
+    // A new document restarts the sequence, so an old mark means "from the start"
+    const after = mark && mark.doc === log.doc ? mark.seq : 0;
+    const entry = log.entries.find(e => e.seq > after
+        && (!toastType || e.type === toastType)
+        && (!contains || e.text.includes(contains)));
+    return entry ? Object.assign({doc: log.doc}, entry) : null;
+};
+const noneLive = () => {
+    const log = window.__tmindToasts;
+    return log && !log.entries.some(e => e.removed_ts === null) ? true : null;
+};
+const check = toastType === '__none_live__' ? noneLive : match;
+let ticker = null, timer = null;
+const finish = (result) => { clearInterval(ticker); clearTimeout(timer); done(result); };
+const first = check();
+if (first !== null) { done(first); return; }
+ticker = setInterval(() => { const r = check(); if (r !== null) finish(r); }, 50);
+timer = setTimeout(() => finish(null), timeoutMs);
+"""
+
+
+class ToastRecorder:
+    """Per-driver history of every toast the app showed.
+
+    Marks are {"doc", "seq"} pairs so a reload or a new lease of a pooled
+    browser does not hide toasts behind an older sequence number.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.consumed = None
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": RECORDER_JS})
+        self._install_here()
+
+    @classmethod
+    def for_driver(cls, driver):
+        recorder = getattr(driver, "toast_recorder", None)
+        if recorder is None:
+            recorder = cls(driver)
+            driver.toast_recorder = recorder
+        return recorder
+
+    def _install_here(self):
+        self.driver.execute_script(RECORDER_JS)
+
+    def mark(self):
+        """Position in the history; assertions made after it only see newer toasts."""
+        self.consumed = self.driver.execute_script(
+            "const log = window.__tmindToasts; return log ? {doc: log.doc, seq: log.seq} : null")
+        return self.consumed
+
+    def history(self, mark=None):
+        return self.driver.execute_script("""
+            const log = window.__tmindToasts, mark = arguments[0];
+            if (!log) return [];
+            const after = mark && mark.doc === log.doc ? mark.seq : 0;
+            return log.entries.filter(e => e.seq > after);""", mark)
+
+    def wait_for(self, toast_type=None, contains=None, after=None, timeout=10, consume=True):
+        """First toast after the mark (default: after the last one asserted) matching
+        type and text, or None after timeout. consume=False leaves the mark where it is."""
+        entry = self._wait(toast_type, contains, self.consumed if after is None else after, timeout)
+        if entry and consume:
+            self.consumed = {"doc": entry["doc"], "seq": entry["seq"]}
+        return entry
+
+    def wait_until_none_live(self, timeout=10):
+        return self._wait("__none_live__", None, None, timeout) is not None
+
+    def _wait(self, toast_type, contains, mark, timeout):
+        allow_script_time(self.driver, timeout)
+        try:
+            return self.driver.execute_async_script(WAIT_JS, toast_type, contains, mark, int(timeout * 1000))
+        except WebDriverException:
+            # Navigation dropped the script; the new document already has the recorder
+            return self.driver.execute_async_script(WAIT_JS, toast_type, contains, mark, int(timeout * 1000))
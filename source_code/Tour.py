@@ -2,7 +2,8 @@ import os
 import unittest
 import allure
 from Base import Base
-from Page import LoginPage, TourPage
+from Page import TourPage
+from LoginCache import login_cache
 from locators import TourLocators
 from dotenv import load_dotenv
 
@@ -15,11 +16,7 @@ class TourTests(Base):
     def setUp(self):
         self.driver = super().start_driver()
 
-        self.login = LoginPage(self.driver)
-        self.login.enter_email(os.environ.get("USER_EMAIL"))
-        self.login.enter_password(os.environ.get("PASSWORD"))
-        self.login.click_login()
-        assert self.login.is_dashboard_displayed()
+        assert login_cache.login(self.driver), "Login failed"
 
         self.tour = TourPage(self.driver)
 
@@ -335,6 +335,9 @@ class SignalLocators:
         "//select[contains(@class,'tour-compare-dropdown')]"
     )
 
+    # Signals graph card (landmark of the Signals page)
+    SIGNAL_GRAPH_CARD = (By.XPATH, "//div[contains(@class,'tour-graph-card')]")
+
     # Signals graph empty state text
     GRAPH_NO_DATA_TEXT = (
         By.XPATH,
@@ -9,6 +9,12 @@ if exist allure-results rmdir /s /q allure-results
 if exist allure-report rmdir /s /q allure-report
 if exist Nightly_Regression_Report.html del Nightly_Regression_Report.html
 
+REM SWEEP=true: sweep like ParallelRunner.py does (a dry run unless SWEEP_DELETE=true)
+if /I "%SWEEP%"=="true" (
+    echo ===== Sweeping Leftover Test Data =====
+    python Sweeper.py --phase pre
+)
+
 echo ===== Running Pytest =====
 
 REM Run Pytest with BOTH reports
@@ -17,6 +23,11 @@ pytest -v RunTest.py ^
  --self-contained-html ^
  --alluredir=allure-results
 
+if /I "%SWEEP%"=="true" (
+    echo ===== Sweeping This Run's Test Data =====
+    python Sweeper.py --phase post
+)
+
 echo ===== Generating Allure HTML Report =====
 allure generate allure-results --clean -o allure-report
 
@@ -0,0 +1,645 @@
+// Stand-in TMind frontend. Reproduces the DOM that locators.py targets, on
+// top of the JSON API in StandInServer.py. Plain DOM code, no build step.
+(() => {
+  'use strict';
+
+  const root = document.getElementById('root');
+  const modalRoot = document.getElementById('modal-root');
+  const toaster = document.querySelector('.Toastify');
+
+  // ---------------- Helpers ----------------
+  function h(tag, attrs, ...children) {
+    const el = document.createElement(tag);
+    for (const [key, value] of Object.entries(attrs || {})) {
+      if (value == null || value === false) continue;
+      if (key.startsWith('on')) el.addEventListener(key.slice(2), value);
+      else if (key === 'className') el.className = value;
+      else if (key === 'value') el.value = value;
+      else el.setAttribute(key, value === true ? '' : value);
+    }
+    for (const child of children.flat()) {
+      if (child != null && child !== false) el.append(child instanceof Node ? child : String(child));
+    }
+    return el;
+  }
+
+  async function api(method, path, body) {
+    const response = await fetch('/api' + path, {
+      method,
+      headers: {'Content-Type': 'application/json', Authorization: 'Bearer ' + (localStorage.getItem('token') || '')},
+      body: body === undefined ? undefined : JSON.stringify(body),
+    });
+    const data = await response.json().catch(() => ({}));
+    if (!response.ok) throw new Error(data.message || response.statusText);
+    return data;
+  }
+
+  // react-toastify markup: the text sits in an inner div of the toast
+  function toast(type, message) {
+    const el = h('div', {className: `Toastify__toast Toastify__toast--${type}`, role: 'alert'},
+      h('div', {className: 'Toastify__toast-body'}, h('div', null, message)));
+    toaster.append(el);
+    setTimeout(() => el.remove(), 3000);
+  }
+
+  function modal(...children) {
+    closeModal();
+    modalRoot.append(h('div', {className: 'overlay'}, h('div', {className: 'dialog', role: 'dialog'}, ...children)));
+  }
+
+  function closeModal() {
+    modalRoot.replaceChildren();
+  }
+
+  function formValues(form) {
+    return Object.fromEntries(new FormData(form).entries());
+  }
+
+  // ---------------- Routing ----------------
+  function navigate(path) {
+    history.pushState(null, '', path);
+    render();
+  }
+
+  function link(path, attrs, ...children) {
+    return h('a', {href: path, ...attrs, onclick: (e) => { e.preventDefault(); navigate(path); }}, ...children);
+  }
+
+  window.addEventListener('popstate', render);
+
+  const routes = [
+    [/^\/login$/, loginView, false],
+    [/^\/signup$/, signupView, false],
+    [/^\/dashboard$/, dashboardView, true],
+    [/^\/devices$/, devicesView, true],
+    [/^\/devices\/edit\/(.+)$/, editDeviceView, true],
+    [/^\/devices\/config\/(.+)$/, configDeviceView, true],
+    [/^\/assets$/, assetsView, true],
+    [/^\/manage-user$/, manageUserView, true],
+    [/^\/signals$/, signalsView, true],
+  ];
+
+  function render() {
+    closeModal();
+    const loggedIn = !!localStorage.getItem('token');
+    const path = location.pathname;
+    for (const [pattern, view, needsLogin] of routes) {
+      const match = path.match(pattern);
+      if (!match) continue;
+      if (needsLogin && !loggedIn) return navigate('/login');
+      if (!needsLogin && loggedIn && path === '/login') return navigate('/dashboard');
+      root.replaceChildren(needsLogin ? layout(view(...match.slice(1).map(decodeURIComponent))) : view());
+      return;
+    }
+    navigate(loggedIn ? '/dashboard' : '/login');
+  }
+
+  function layout(content) {
+    const menu = h('div', {className: 'menu', role: 'menu', hidden: true},
+      h('div', {role: 'menuitem', onclick: () => { localStorage.clear(); navigate('/login'); }}, 'Logout'));
+    return h('div', {className: 'layout'},
+      h('nav', {className: 'sidebar'},
+        link('/dashboard', null, h('span', null, 'Dashboard')),
+        link('/devices', null, h('span', null, 'Devices')),
+        link('/assets', null, h('span', null, 'Assets')),
+        link('/manage-user', {id: 'sidebar-manage-user'}, h('span', null, 'Manage User')),
+        link('/signals', {id: 'sidebar-signal'}, h('span', null, 'Signals')),
+        link('/reports', {id: 'sidebar-reports'}, h('span', null, 'Reports'))),
+      h('div', {className: 'main'},
+        h('div', {className: 'topbar'},
+          h('button', {onclick: () => { menu.hidden = !menu.hidden; }}, h('div', {className: 'bg-primary'})),
+          menu),
+        content));
+  }
+
+  // ---------------- Login / sign up ----------------
+  function loginView() {
+    const error = h('p', {className: 'text-red-500', hidden: true});
+    const form = h('form', {className: 'auth', novalidate: true, onsubmit: async (e) => {
+      e.preventDefault();
+      const {email, password} = formValues(form);
+      if (!email || !password) {
+        error.textContent = !email ? 'Email is required' : 'Password is required';
+        error.hidden = false;
+        return;
+      }
+      try {
+        const result = await api('POST', '/login', {email, password});
+        localStorage.setItem('token', result.token);
+        localStorage.setItem('username', result.username);
+        toast('success', 'Login successful');
+        navigate('/dashboard');
+      } catch (err) {
+        toast('error', err.message);
+      }
+    }},
+      h('h1', null, 'Login'),
+      h('input', {name: 'email', type: 'email', placeholder: 'Enter email'}),
+      h('input', {name: 'password', type: 'password', placeholder: 'Enter password'}),
+      error,
+      h('button', {type: 'submit'}, 'Login'),
+      h('p', null, "Don't have an account? ",
+        h('span', {className: 'cursor-pointer', onclick: () => navigate('/signup')}, 'Sign up')));
+    return form;
+  }
+
+  function signupView() {
+    const done = h('p', {hidden: true}, 'Registered successfully');
+    const form = h('form', {className: 'auth', onsubmit: async (e) => {
+      e.preventDefault();
+      form.querySelectorAll('p.text-red-500').forEach((p) => p.remove());
+      const values = formValues(form);
+      if (values.password.length < 8) {
+        form.querySelector('[name=password]').after(
+          h('p', {className: 'text-red-500'}, 'Password must be at least 8 characters'));
+        return;
+      }
+      try {
+        await api('POST', '/signup', values);
+        done.hidden = false;
+        toast('success', 'Registered successfully');
+      } catch (err) {
+        toast('error', err.message);
+      }
+    }},
+      h('h1', null, 'Create Account'),
+      h('input', {name: 'username', placeholder: 'Enter username', required: true}),
+      h('input', {name: 'email', type: 'email', placeholder: 'Enter email', required: true}),
+      h('input', {name: 'password', type: 'password', placeholder: 'Enter password', required: true}),
+      h('button', {type: 'submit'}, 'Create Account'),
+      done,
+      h('p', null, 'Already have an account? ',
+        h('span', {className: 'cursor-pointer', onclick: () => navigate('/login')}, 'Login here')));
+    return form;
+  }
+
+  // ---------------- Dashboard and tour ----------------
+  const TOUR = [
+    ['Dashboard', 'Your plant at a glance: devices, assets and live signals.'],
+    ['Devices', 'Register Modbus devices and configure how they are polled.'],
+    ['Assets', 'Organise machines in a tree and map signals onto them.'],
+    ['Signals', 'Plot the signals of an asset and compare assets side by side.'],
+  ];
+
+  function dashboardView() {
+    return h('div', null,
+      h('div', {className: 'card'},
+        h('div', {className: 'flex items-center justify-between'},
+          h('h2', null, 'Welcome to TMind'),
+          h('button', {title: 'Start Tour', onclick: () => showTourStep(0)}, '?')),
+        h('p', null, 'Stand-in dashboard.')));
+  }
+
+  // driver.js markup; "Done" on the last step destroys the tour
+  function showTourStep(index) {
+    document.querySelectorAll('.driver-overlay, .driver-popover').forEach((el) => el.remove());
+    if (index < 0 || index >= TOUR.length) return;
+    const [title, description] = TOUR[index];
+    const last = index === TOUR.length - 1;
+    document.body.append(
+      h('div', {className: 'driver-overlay'}),
+      h('div', {className: 'driver-popover', role: 'dialog'},
+        h('button', {className: 'driver-popover-close-btn', onclick: () => showTourStep(-1)}, '×'),
+        h('header', {id: 'driver-popover-title', className: 'driver-popover-title'}, title),
+        h('div', {id: 'driver-popover-description', className: 'driver-popover-description'}, description),
+        h('footer', {className: 'driver-popover-footer'},
+          h('span', {className: 'driver-popover-progress-text'}, `${index + 1} of ${TOUR.length}`),
+          h('button', {className: 'driver-popover-prev-btn', disabled: index === 0,
+            onclick: () => showTourStep(index - 1)}, '← Previous'),
+          h('button', {className: 'driver-popover-next-btn',
+            onclick: () => showTourStep(last ? -1 : index + 1)}, last ? 'Done' : 'Next →'))));
+  }
+
+  // ---------------- Devices ----------------
+  const DEVICE_NAME = /^[A-Za-z0-9][A-Za-z0-9 _-]{2,99}$/;
+  const IP_ADDRESS = /^((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\.){3}(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)$/;
+
+  function devicesView() {
+    const tbody = h('tbody');
+    const search = h('input', {placeholder: 'Search devices...', oninput: () => load()});
+
+    async function load() {
+      const devices = await api('GET', '/devices?search=' + encodeURIComponent(search.value)).catch((err) => {
+        toast('error', err.message);
+        return [];
+      });
+      tbody.replaceChildren(...(devices.length ? devices.map(row) : [h('tr', null, h('td', {colspan: 3}, 'No devices found'))]));
+    }
+
+    function row(device) {
+      return h('tr', null,
+        h('td', null, device.name),
+        h('td', null, device.description),
+        h('td', {className: 'flex gap-2'},
+          h('button', {onclick: () => navigate('/devices/edit/' + encodeURIComponent(device.name))}, 'Edit'),
+          h('button', {onclick: () => navigate('/devices/config/' + encodeURIComponent(device.name))}, 'Config'),
+          h('button', {onclick: () => confirmDelete(device.name)}, 'Delete')));
+    }
+
+    function confirmDelete(name) {
+      modal(
+        h('h2', null, 'Confirm Deletion'),
+        h('p', null, 'Are you sure you want to delete ', h('span', null, name), '?'),
+        h('div', {className: 'flex gap-2'},
+          h('button', {onclick: closeModal}, 'No, Keep it'),
+          h('button', {onclick: async () => {
+            try {
+              await api('DELETE', '/devices/' + encodeURIComponent(name));
+              toast('success', 'Device deleted successfully');
+            } catch (err) {
+              toast('error', err.message);
+            }
+            closeModal();
+            load();
+          }}, 'Yes, Delete it')));
+    }
+
+    function addDevice() {
+      const form = h('form', {className: 'dialog', onsubmit: async (e) => {
+        e.preventDefault();
+        const {name, description} = formValues(form);
+        if (!name.trim()) return toast('error', 'Device Name is required.');
+        if (!DEVICE_NAME.test(name)) {
+          return toast('error', 'Device Name must be 3-100 characters, start with a letter or number, '
+            + 'and contain only letters, numbers, spaces, underscores and dashes.');
+        }
+        try {
+          await api('POST', '/devices', {name, description});
+          toast('success', 'Device created successfully');
+          closeModal();
+          load();
+        } catch (err) {
+          toast('error', err.message);
+        }
+      }},
+        h('h2', null, 'Add Device'),
+        h('input', {name: 'name', placeholder: 'Enter device name'}),
+        h('textarea', {name: 'description', placeholder: 'Enter description'}),
+        h('div', {className: 'flex gap-2'},
+          h('button', {type: 'button', onclick: closeModal}, 'Cancel'),
+          h('button', {type: 'submit'}, 'Save Device')));
+      closeModal();
+      modalRoot.append(h('div', {className: 'overlay'}, form));
+    }
+
+    load();
+    return h('div', null,
+      h('div', {className: 'flex items-center justify-between'},
+        h('h1', null, 'Devices'),
+        h('button', {onclick: addDevice}, '+ Add Device')),
+      search,
+      h('table', {className: 'w-full'},
+        h('thead', null, h('tr', null, h('th', null, 'Name'), h('th', null, 'Description'), h('th', null, 'Actions'))),
+        tbody));
+  }
+
+  function configFields(config, nameAttrs) {
+    return [
+      h('label', {for: 'configName'}, 'Configuration Name'),
+      h('input', {id: 'configName', name: 'configName', value: config.configName, required: true}),
+      h('label', {for: 'pollInterval'}, 'Poll Interval (ms)'),
+      h('input', {id: 'pollInterval', name: 'pollInterval', type: 'number', value: config.pollInterval, required: true}),
+      h('label', {for: 'IpAddress'}, 'IP Address'),
+      h('input', {id: 'IpAddress', name: 'IpAddress', value: config.IpAddress, required: true, ...nameAttrs}),
+      h('label', {for: 'Port'}, 'Port'),
+      h('input', {id: 'Port', name: 'Port', type: 'number', value: config.Port, required: true, ...nameAttrs}),
+    ];
+  }
+
+  function configError(values) {
+    const poll = Number(values.pollInterval);
+    if (!(poll >= 100 && poll <= 300000)) return 'Poll interval must be between 100 and 300000 milliseconds.';
+    if (!IP_ADDRESS.test(values.IpAddress)) return 'Invalid IP Address';
+    const port = Number(values.Port);
+    if (!(Number.isInteger(port) && port >= 1 && port <= 65535)) return 'Port must be between 1 and 65535';
+    return null;
+  }
+
+  function deviceForm(name, build) {
+    const container = h('div', null, 'Loading...');
+    api('GET', '/devices?search=' + encodeURIComponent(name)).then((devices) => {
+      const device = devices.find((d) => d.name === name);
+      container.replaceChildren(device ? build(device) : h('p', null, 'Device not found'));
+    }).catch((err) => toast('error', err.message));
+    return container;
+  }
+
+  function editDeviceView(name) {
+    return deviceForm(name, (device) => {
+      const form = h('form', {className: 'card', onsubmit: async (e) => {
+        e.preventDefault();
+        const values = formValues(form);
+        const error = configError(values);
+        if (error) return toast('error', error);
+        try {
+          await api('PUT', '/devices/' + encodeURIComponent(name), {
+            name: values.name, description: values.description,
+            config: {configName: values.configName, pollInterval: values.pollInterval,
+                     IpAddress: values.IpAddress, Port: values.Port}});
+          toast('success', 'Device updated successfully');
+          navigate('/devices');
+        } catch (err) {
+          toast('error', err.message);
+        }
+      }},
+        h('div', null, 'Edit Device & Configuration'),
+        h('label', {for: 'name'}, 'Device Name'),
+        h('input', {id: 'name', name: 'name', value: device.name}),
+        h('label', {for: 'description'}, 'Description'),
+        h('textarea', {id: 'description', name: 'description'}, device.description),
+        h('label', null, 'Protocol'),
+        h('button', {type: 'button', role: 'combobox'}, 'Modbus TCP'),
+        ...configFields(device.config),
+        h('div', {className: 'flex gap-2'},
+          h('button', {type: 'button', onclick: () => navigate('/devices')}, 'Back to Devices'),
+          h('button', {type: 'submit'}, 'Save Changes')));
+      return form;
+    });
+  }
+
+  function configDeviceView(name) {
+    return deviceForm(name, (device) => {
+      const form = h('form', {className: 'card', onsubmit: async (e) => {
+        e.preventDefault();
+        const values = formValues(form);
+        const error = configError(values);
+        if (error) return toast('error', error);
+        try {
+          await api('PUT', '/devices/' + encodeURIComponent(name), {config: values});
+          toast('success', 'Configuration updated successfully');
+          navigate('/devices');
+        } catch (err) {
+          toast('error', err.message);
+        }
+      }},
+        h('div', null, 'Configure Device'),
+        ...configFields(device.config),
+        h('div', {className: 'flex gap-2'},
+          h('button', {type: 'button', onclick: () => navigate('/devices')}, 'Back'),
+          h('button', {type: 'submit'}, 'Save Configuration')));
+      return form;
+    });
+  }
+
+  // ---------------- Assets ----------------
+  function assetsView() {
+    let assets = [];
+    let selected = null;
+    const expanded = new Set();
+    const tree = h('div');
+    const details = h('div', {className: 'card'});
+    const search = h('input', {placeholder: 'Search assets...', oninput: () => draw()});
+
+    async function load() {
+      assets = await api('GET', '/assets').catch((err) => {
+        toast('error', err.message);
+        return [];
+      });
+      draw();
+    }
+
+    const childrenOf = (name) => assets.filter((a) => a.parent === name);
+    const levelOf = (asset) => (asset.parent ? levelOf(assets.find((a) => a.name === asset.parent)) + 1 : 0);
+
+    function matches(asset, term) {
+      return asset.name.toLowerCase().includes(term) || childrenOf(asset.name).some((c) => matches(c, term));
+    }
+
+    function draw() {
+      const term = search.value.trim().toLowerCase();
+      const nodes = (parent, depth) => childrenOf(parent).filter((a) => !term || matches(a, term)).map((asset) => {
+        const children = childrenOf(asset.name);
+        const open = expanded.has(asset.name) || !!term;
+        return h('div', null,
+          h('div', {className: 'flex items-center justify-between hover:bg-accent', style: `padding-left:${depth * 16}px`},
+            h('div', {className: 'flex items-center gap-2'},
+              h('button', {className: 'expand', disabled: !children.length, onclick: () => {
+                expanded.has(asset.name) ? expanded.delete(asset.name) : expanded.add(asset.name);
+                draw();
+              }}, children.length ? (open ? '▾' : '▸') : '·'),
+              h('span', {className: 'text-sm', onclick: () => { selected = asset.name; draw(); }}, asset.name)),
+            h('div', {className: 'flex gap-1'},
+              h('button', {id: 'add-subasset-btn', title: 'Add sub asset', onclick: () => addSubAsset(asset.name)}, '+'),
+              h('button', {id: 'edit-asset-btn', title: 'Edit', onclick: () => editAsset(asset.name)}, '✎'),
+              !children.length && h('button', {id: 'delete-asset-btn', title: 'Delete', onclick: () => deleteAsset(asset.name)}, '🗑'))),
+          open && nodes(asset.name, depth + 1));
+      });
+      tree.replaceChildren(...nodes(null, 0));
+
+      const asset = assets.find((a) => a.name === selected);
+      details.replaceChildren(...(!asset ? [h('p', null, 'No Asset Selected')] : [
+        h('div', {className: 'tracking-tight'}, asset.name),
+        h('p', null, 'Type'), h('p', null, asset.parent ? 'Sub Asset' : 'Root'),
+        h('p', null, 'Level'), h('p', null, String(levelOf(asset))),
+        h('p', null, 'Sub Assets: ', h('span', null, String(childrenOf(asset.name).length))),
+      ]));
+    }
+
+    function nameDialog(title, input, submitText, onSave, extraButtons) {
+      const form = h('form', {className: 'dialog', onsubmit: async (e) => {
+        e.preventDefault();
+        const name = input.value.trim();
+        if (!name) return toast('error', 'Asset name is required');
+        try {
+          await onSave(name);
+          closeModal();
+          await load();
+        } catch (err) {
+          toast('error', err.message);
+        }
+      }},
+        h('h2', null, title), input,
+        h('div', {className: 'flex gap-2'},
+          h('button', {type: 'button', onclick: closeModal}, 'Cancel'),
+          h('button', {type: 'submit'}, submitText)));
+      closeModal();
+      modalRoot.append(h('div', {className: 'overlay'}, form));
+    }
+
+    function addRoot() {
+      nameDialog('Add Root Asset', h('input', {id: 'name', name: 'name', placeholder: 'Enter root asset name'}), 'Add',
+        async (name) => {
+          await api('POST', '/assets', {name});
+          toast('success', 'Asset created successfully');
+        });
+    }
+
+    function addSubAsset(parent) {
+      nameDialog('Add Sub Asset', h('input', {name: 'name', placeholder: 'Enter Asset Name'}), 'Save',
+        async (name) => {
+          await api('POST', '/assets', {name, parent});
+          expanded.add(parent);
+          toast('success', 'Sub asset created successfully');
+        });
+    }
+
+    function editAsset(current) {
+      nameDialog('Edit Asset', h('input', {name: 'name', placeholder: 'Enter new name', value: current}), 'Save Changes',
+        async (name) => {
+          await api('PUT', '/assets/' + encodeURIComponent(current), {name});
+          if (selected === current) selected = name;
+          toast('success', 'Asset updated successfully');
+        });
+    }
+
+    function deleteAsset(name) {
+      modal(
+        h('h2', null, 'Delete Asset'),
+        h('p', null, 'Are you sure you want to delete ', h('span', null, name), '?'),
+        h('div', {className: 'flex gap-2'},
+          h('button', {onclick: closeModal}, 'Cancel'),
+          h('button', {onclick: async () => {
+            try {
+              await api('DELETE', '/assets/' + encodeURIComponent(name));
+              toast('success', 'Asset deleted successfully');
+              if (selected === name) selected = null;
+            } catch (err) {
+              toast('error', err.message);
+            }
+            closeModal();
+            load();
+          }}, 'Delete')));
+    }
+
+    load();
+    return h('div', {className: 'assets'},
+      h('div', {className: 'tree card'},
+        h('div', {className: 'flex items-center justify-between'},
+          h('h2', null, 'Assets'),
+          h('button', {onclick: addRoot}, '+ Add Root')),
+        search, tree),
+      details);
+  }
+
+  // ---------------- Manage user ----------------
+  const ROLES = ['Admin', 'Engineer', 'Viewer'];
+  const PAGE_SIZE = 10;
+
+  function manageUserView() {
+    let users = [];
+    let page = 1;
+    const tbody = h('tbody');
+    const pagination = h('ul', {className: 'flex flex-row items-center gap-1'});
+    const search = h('input', {placeholder: 'Search users...', oninput: () => { page = 1; load(); }});
+
+    async function load() {
+      users = await api('GET', '/users?search=' + encodeURIComponent(search.value.trim())).catch((err) => {
+        toast('error', err.message);
+        return [];
+      });
+      draw();
+    }
+
+    function draw() {
+      const pages = Math.max(1, Math.ceil(users.length / PAGE_SIZE));
+      page = Math.min(page, pages);
+      const shown = users.slice((page - 1) * PAGE_SIZE, page * PAGE_SIZE);
+      const me = localStorage.getItem('username');
+      tbody.replaceChildren(...(shown.length ? shown.map((user) => h('tr', null,
+        h('td', null, user.username),
+        h('td', null, user.email),
+        h('td', null, h('select', {onchange: async (e) => {
+          try {
+            await api('PUT', '/users/' + encodeURIComponent(user.username), {role: e.target.value});
+            user.role = e.target.value;
+            toast('success', 'User role updated successfully');
+          } catch (err) {
+            e.target.value = user.role;
+            toast('error', err.message);
+          }
+        }}, ROLES.map((role) => h('option', {value: role, selected: role === user.role}, role)))),
+        h('td', null, h('button', {disabled: user.username === me, onclick: () => confirmDelete(user.username)}, 'Delete'))))
+        : [h('tr', null, h('td', {colspan: 4}, 'No users found'))]));
+
+      const go = (target) => () => { page = target; draw(); };
+      pagination.replaceChildren(
+        h('li', null, h('a', {'aria-label': 'Go to previous page', onclick: page > 1 ? go(page - 1) : null}, 'Previous')),
+        ...Array.from({length: pages}, (_, i) => h('li', null,
+          h('a', {'aria-current': i + 1 === page ? 'page' : null, onclick: go(i + 1)}, String(i + 1)))),
+        h('li', null, h('a', {'aria-label': 'Go to next page', onclick: page < pages ? go(page + 1) : null}, 'Next')));
+    }
+
+    function confirmDelete(username) {
+      modal(
+        h('h2', null, 'Confirm Delete'),
+        h('p', null, 'Are you sure you want to delete ', h('span', null, username), '?'),
+        h('div', {className: 'flex gap-2'},
+          h('button', {onclick: closeModal}, 'Cancel'),
+          h('button', {onclick: async () => {
+            try {
+              await api('DELETE', '/users/' + encodeURIComponent(username));
+              toast('success', 'User deleted successfully');
+            } catch (err) {
+              toast('error', err.message);
+            }
+            closeModal();
+            load();
+          }}, 'Delete')));
+    }
+
+    function downloadCsv() {
+      const lines = [['Username', 'Email', 'Role'], ...users.map((u) => [u.username, u.email, u.role])];
+      const url = URL.createObjectURL(new Blob([lines.map((l) => l.join(',')).join('\n')], {type: 'text/csv'}));
+      const anchor = h('a', {href: url, download: 'users.csv'});
+      document.body.append(anchor);
+      anchor.click();
+      anchor.remove();
+      setTimeout(() => URL.revokeObjectURL(url), 1000);
+      toast('success', 'CSV downloaded successfully!');
+    }
+
+    load();
+    return h('div', null,
+      h('h1', null, 'User Management'),
+      h('p', null, 'Manage application users'),
+      h('div', {className: 'flex items-center justify-between'},
+        search,
+        h('button', {onclick: downloadCsv}, 'Download CSV')),
+      h('table', {id: 'user-table', className: 'w-full'},
+        h('thead', null, h('tr', null, ['Username', 'Email', 'Role', 'Actions'].map((t) => h('th', null, t)))),
+        tbody),
+      h('nav', {'aria-label': 'pagination'}, pagination));
+  }
+
+  // ---------------- Signals ----------------
+  function signalsView() {
+    let assets = [];
+    const mainAsset = h('select', {className: 'tour-main-asset-dropdown', onchange: () => draw()});
+    const compare = h('select', {className: 'tour-compare-dropdown', disabled: true});
+    const signals = h('button', {disabled: true}, 'No signals');
+    const device = h('span', null, 'Not assigned');
+
+    function options(select, names) {
+      select.replaceChildren(h('option', {value: ''}, 'Select asset'), ...names.map((n) => h('option', {value: n}, n)));
+    }
+
+    function draw() {
+      const asset = assets.find((a) => a.name === mainAsset.value);
+      device.textContent = asset && asset.device ? asset.device : 'Not assigned';
+      signals.disabled = !(asset && asset.device);
+      signals.textContent = signals.disabled ? 'No signals' : 'Pressure, Temperature';
+      compare.disabled = !asset;
+      options(compare, assets.filter((a) => a !== asset).map((a) => a.name));
+    }
+
+    api('GET', '/assets').then((result) => {
+      assets = result;
+      options(mainAsset, assets.map((a) => a.name));
+      draw();
+    }).catch((err) => toast('error', err.message));
+
+    return h('div', null,
+      h('h1', null, 'Signals'),
+      h('div', {className: 'card flex gap-2'},
+        h('div', {className: 'tour-time-range'},
+          h('label', null, 'Time Range'),
+          h('select', null, ['Last 24 Hours', 'Last 7 Days', 'Last 30 Days'].map((t) => h('option', null, t)))),
+        h('div', null, h('label', null, 'Main Asset'), mainAsset),
+        h('div', null, h('label', null, 'Signals'), signals),
+        h('div', null, h('label', {className: 'tour-main-device'}, 'Assigned Device'), h('p', null, device)),
+        h('div', null, h('label', null, 'Compare With'), compare)),
+      h('div', {className: 'card tour-graph-card'}, h('p', null, 'No data available')));
+  }
+
+  render();
+})();